@@ -4,21 +4,41 @@
 import importlib
 import logging
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Tuple, Type, Union
+from typing import Any, Dict, List, Optional, Tuple, Type, Union, cast
 
 import dask.array as da
 import numpy as np
 import xarray as xr
-from ome_types import OME
+from fsspec.spec import AbstractFileSystem
+from ome_types import OME, from_xml, to_xml
 
 from . import dimensions, exceptions, transforms, types
-from .formats import FORMAT_IMPLEMENTATIONS, READER_TO_INSTALL
+from .formats import (
+    FILE_SIGNATURE_IMPLEMENTATIONS,
+    FILE_SIGNATURE_READ_BYTES,
+    FORMAT_IMPLEMENTATIONS,
+    MIN_TRUSTED_FILE_SIGNATURE_BYTES,
+    READER_TO_INSTALL,
+)
 from .image_container import ImageContainer
 from .metadata import utils as metadata_utils
 from .readers import TiffGlobReader
 from .readers.reader import Reader
 from .types import PhysicalPixelSizes
+from .utils import io_utils
+from .utils.disk_chunk_cache import DEFAULT_DISK_CHUNK_CACHE_MAX_BYTES
 from .utils.io_utils import pathlike_to_fs
+from .utils.metadata_cache import MetadataCache, get_metadata_cache_key
+from .utils.scene_cache import (
+    DEFAULT_MAX_CACHED_SCENES,
+    DEFAULT_MAX_IN_MEMORY_CACHED_SCENES,
+    SceneCache,
+)
+
+###############################################################################
+
+# The per-scene attributes reset on scene change and stored in the scene cache
+SCENE_STATE_ATTRS = ("_xarray_dask_data", "_xarray_data", "_dims")
 
 ###############################################################################
 
@@ -62,6 +82,19 @@ class AICSImage(ImageContainer):
     fs_kwargs: Dict[str, Any]
         Any specific keyword arguments to pass down to the fsspec created filesystem.
         Default: {}
+    chunk_cache_dir: Optional[types.PathLike]
+        A directory to persistently cache decoded chunks in. Useful when repeatedly
+        reading the same remote images from many processes or jobs.
+        Default: None (no on-disk chunk cache)
+    chunk_cache_max_bytes: int
+        The maximum total number of bytes of chunks to keep in the chunk_cache_dir.
+        Default: DEFAULT_DISK_CHUNK_CACHE_MAX_BYTES (10 GiB)
+    metadata_cache_dir: Optional[types.PathLike]
+        A directory to store a description of the image (reader, scenes, and per-scene
+        dims, shape, dtype, channel names, physical pixel sizes, and OME metadata) in.
+        Opening the same unmodified image with the same arguments again skips
+        determining the reader and parsing the metadata.
+        Default: None (no metadata cache)
     kwargs: Any
         Extra keyword arguments that will be passed down to the reader subclass.
 
@@ -89,6 +122,17 @@ class AICSImage(ImageContainer):
 
     >>> img = AICSImage("s3://my_bucket/my_file.tiff")
 
+    Initialize an image from S3 and cache the read chunks on local disk so that later
+    reads (from any process) don't download them again.
+
+    >>> img = AICSImage("s3://my_bucket/my_file.tiff", chunk_cache_dir="/tmp/chunks")
+
+    Initialize an image that is opened many times, only the first open determines the
+    reader and parses the metadata.
+
+    >>> img = AICSImage("my_file.czi", metadata_cache_dir="/tmp/metadata")
+    ... img.dims  # <Dimensions [T: 40, C: 3, Z: 1, Y: 30000, X: 45000]>
+
     Initialize an image and pass arguments to the reader using kwargs.
 
     >>> img = AICSImage("my_file.czi", chunk_dims=["T", "Y", "X"])
@@ -143,6 +187,85 @@ class AICSImage(ImageContainer):
             except ImportError:
                 pass
 
+    @staticmethod
+    def _determine_reader_from_file_signature(
+        image: types.PathLike,
+        fs: AbstractFileSystem,
+        path: str,
+        fs_kwargs: Dict[str, Any] = {},
+    ) -> Optional[Type[Reader]]:
+        """
+        Determine the reader for a file from its leading bytes, read with a single
+        request.
+
+        Returns
+        -------
+        ReaderClass: Optional[Type[Reader]]
+            The reader that supports the provided image or None if the file signature
+            isn't recognized (or none of its readers are installed).
+        """
+        try:
+            head = io_utils.read_file_head(fs, path, FILE_SIGNATURE_READ_BYTES)
+        except Exception as e:
+            log.debug(f"Failed to read file signature for ({path}): {e}")
+            return None
+
+        for magic_checks, signature_readers in FILE_SIGNATURE_IMPLEMENTATIONS:
+            if not all(
+                head[offset : offset + len(magic)] == magic
+                for offset, magic in magic_checks
+            ):
+                continue
+
+            # Prefer the readers (and their ordering) for the file extension
+            # (i.e. only try bfio for ".ome.tiff" files)
+            # If none of them match the signature (i.e. TIFF based formats with
+            # their own preferred readers) leave it to extension based detection
+            candidates = signature_readers
+            for format_ext, readers in FORMAT_IMPLEMENTATIONS.items():
+                if path.lower().endswith(f".{format_ext}"):
+                    candidates = [r for r in readers if r in signature_readers]
+                    break
+
+            if len(candidates) == 0:
+                return None
+
+            # Only load the readers that are installed
+            installed_readers: List[Type[Reader]] = []
+            for reader_path in candidates:
+                try:
+                    installed_readers.append(_load_reader(reader_path))
+                except ImportError:
+                    pass
+
+            # Validate every reader except the last which is trusted based on the
+            # file signature alone, unless the signature is too weak to be trusted
+            trusted = (
+                sum(len(magic) for _, magic in magic_checks)
+                >= MIN_TRUSTED_FILE_SIGNATURE_BYTES
+            )
+            validated_readers = installed_readers[:-1] if trusted else installed_readers
+            for ReaderClass in validated_readers:
+                try:
+                    if ReaderClass.is_supported_image(image, fs_kwargs=fs_kwargs):
+                        return ReaderClass
+                except Exception as e:
+                    log.warning(
+                        f"Attempted file ({path}) load with "
+                        f"reader: {ReaderClass.__name__} failed with error: {e}"
+                    )
+
+            if trusted and len(installed_readers) > 0:
+                return installed_readers[-1]
+
+            # A weak signature match could be a coincidence, check the rest
+            if not trusted:
+                continue
+
+            return None
+
+        return None
+
     @staticmethod
     def determine_reader(
         image: types.ImageLike,
@@ -173,7 +296,14 @@ class AICSImage(ImageContainer):
 
         # Try reader detection based off of file path extension
         if isinstance(image, (str, Path)):
-            _, path = pathlike_to_fs(image, enforce_exists=True, fs_kwargs=fs_kwargs)
+            fs, path = pathlike_to_fs(image, enforce_exists=True, fs_kwargs=fs_kwargs)
+
+            # Try reader detection based off of the file signature (magic bytes)
+            ReaderClass = AICSImage._determine_reader_from_file_signature(
+                image, fs, path, fs_kwargs=fs_kwargs
+            )
+            if ReaderClass is not None:
+                return ReaderClass
 
             # Check for extension in FORMAT_IMPLEMENTATIONS
             for format_ext, readers in FORMAT_IMPLEMENTATIONS.items():
@@ -257,17 +387,61 @@ class AICSImage(ImageContainer):
         reader: Optional[Type[Reader]] = None,
         reconstruct_mosaic: bool = True,
         fs_kwargs: Dict[str, Any] = {},
+        chunk_cache_dir: Optional[types.PathLike] = None,
+        chunk_cache_max_bytes: int = DEFAULT_DISK_CHUNK_CACHE_MAX_BYTES,
+        metadata_cache_dir: Optional[types.PathLike] = None,
         **kwargs: Any,
     ):
-        if reader is None:
-            # Determine reader class and create dask delayed array
-            ReaderClass = self.determine_reader(image, fs_kwargs=fs_kwargs, **kwargs)
-        else:
+        # Look up a prior description of this exact image in the metadata cache
+        self._metadata_cache: Optional[MetadataCache] = None
+        self._metadata_cache_key: Optional[str] = None
+        self._metadata_cache_entry: Dict[str, Any] = {}
+        if metadata_cache_dir is not None and isinstance(image, (str, Path)):
+            fs, path = pathlike_to_fs(image, enforce_exists=True, fs_kwargs=fs_kwargs)
+            self._metadata_cache = MetadataCache(metadata_cache_dir)
+            self._metadata_cache_key = get_metadata_cache_key(
+                fs,
+                path,
+                reader=reader,
+                reconstruct_mosaic=reconstruct_mosaic,
+                **kwargs,
+            )
+            self._metadata_cache_entry = (
+                self._metadata_cache.get(self._metadata_cache_key) or {}
+            )
+
+        if reader is not None:
             # Init reader
             ReaderClass = reader
+        elif "reader" in self._metadata_cache_entry:
+            # Use the previously determined reader
+            ReaderClass = _load_reader(self._metadata_cache_entry["reader"])
+        else:
+            # Determine reader class and create dask delayed array
+            ReaderClass = self.determine_reader(image, fs_kwargs=fs_kwargs, **kwargs)
 
-        # Init and store reader
-        self._reader = ReaderClass(image, fs_kwargs=fs_kwargs, **kwargs)
+        # Store everything needed to init the reader
+        # The reader is only constructed once required when the image was described
+        # by the metadata cache
+        self._reader_class = ReaderClass
+        self._reader_init_args = (image, fs_kwargs, kwargs)
+        self._chunk_cache_dir = chunk_cache_dir
+        self._chunk_cache_max_bytes = chunk_cache_max_bytes
+        self._reader: Optional[Reader] = None
+        self._current_scene_index = 0
+        self._current_resolution_level = 0
+        self._scene_cache = SceneCache({"_xarray_data": ("_xarray_dask_data",)})
+        if "scenes" not in self._metadata_cache_entry:
+            self._reader = self._construct_reader()
+
+            # Store the initial description of the image
+            if self._metadata_cache is not None:
+                self._metadata_cache_entry = {
+                    "reader": f"{ReaderClass.__module__}.{ReaderClass.__qualname__}",
+                    "scenes": list(self._reader.scenes),
+                    "scene_metadata": {},
+                }
+                self._write_metadata_cache()
 
         # Store delayed modifiers
         self._reconstruct_mosaic = reconstruct_mosaic
@@ -276,6 +450,100 @@ class AICSImage(ImageContainer):
         self._xarray_dask_data: Optional[xr.DataArray] = None
         self._xarray_data: Optional[xr.DataArray] = None
         self._dims: Optional[dimensions.Dimensions] = None
+        self._ome_metadata: Optional[OME] = None
+
+    def _construct_reader(self) -> Reader:
+        image, fs_kwargs, kwargs = self._reader_init_args
+        reader = self._reader_class(image, fs_kwargs=fs_kwargs, **kwargs)
+
+        # Read chunks through a persistent on-disk cache
+        if self._chunk_cache_dir is not None:
+            reader.set_disk_chunk_cache(
+                self._chunk_cache_dir, max_bytes=self._chunk_cache_max_bytes
+            )
+
+        # Match the scene cache limits and catch up to any scene set before the reader
+        # was constructed
+        reader.set_scene_cache_size(
+            self._scene_cache.max_scenes, self._scene_cache.max_in_memory_scenes
+        )
+        reader.set_scene(self._current_scene_index)
+        return reader
+
+    def set_scene_cache_size(
+        self,
+        max_scenes: int = DEFAULT_MAX_CACHED_SCENES,
+        max_in_memory_scenes: int = DEFAULT_MAX_IN_MEMORY_CACHED_SCENES,
+    ) -> None:
+        """
+        Set how many previously used scenes keep their constructed data and metadata
+        so that switching back to them with `set_scene` doesn't rebuild them.
+
+        Parameters
+        ----------
+        max_scenes: int
+            The maximum number of previously used scenes to keep the delayed arrays,
+            dims, and metadata of.
+            Default: DEFAULT_MAX_CACHED_SCENES (8)
+        max_in_memory_scenes: int
+            The maximum number of previously used scenes to keep fully read
+            (in-memory) data for.
+            Default: DEFAULT_MAX_IN_MEMORY_CACHED_SCENES (0, only the current scene's
+            in-memory data is kept)
+
+        Examples
+        --------
+        Keep the data of the last two scenes in memory while iterating back and forth
+
+        >>> img = AICSImage("multi-scene.ome.tiff")
+        ... img.set_scene_cache_size(max_in_memory_scenes=2)
+        ... for scene in [0, 1, 0, 1]:
+        ...     img.set_scene(scene)
+        ...     data = img.data  # Only read once per scene
+        """
+        self._scene_cache.resize(max_scenes, max_in_memory_scenes)
+        if self._reader is not None:
+            self._reader.set_scene_cache_size(max_scenes, max_in_memory_scenes)
+
+    def _write_metadata_cache(self) -> None:
+        if self._metadata_cache is not None and self._metadata_cache_key is not None:
+            try:
+                self._metadata_cache.put(
+                    self._metadata_cache_key, self._metadata_cache_entry
+                )
+            except (OSError, TypeError, ValueError) as e:
+                log.warning(f"Failed to write metadata cache entry: {e}")
+
+    def _get_cached_scene_metadata(self) -> Optional[Dict[str, Any]]:
+        # Only the full resolution level of each scene is described
+        if self._current_resolution_level != 0:
+            return None
+
+        return self._metadata_cache_entry.get("scene_metadata", {}).get(
+            self.current_scene
+        )
+
+    def _cache_scene_metadata(self) -> None:
+        # Only store the current scene description once
+        if (
+            self._metadata_cache is None
+            or self._current_resolution_level != 0
+            or self._xarray_dask_data is None
+            or self._get_cached_scene_metadata() is not None
+        ):
+            return
+
+        arr = self._xarray_dask_data
+        self._metadata_cache_entry["scene_metadata"][self.current_scene] = {
+            "dims": "".join(str(d) for d in arr.dims),
+            "shape": list(arr.shape),
+            "dtype": arr.dtype.str,
+            "channel_names": [
+                str(c) for c in arr[dimensions.DimensionNames.Channel].values
+            ],
+            "physical_pixel_sizes": list(self.reader.physical_pixel_sizes),
+        }
+        self._write_metadata_cache()
 
     @property
     def reader(self) -> Reader:
@@ -287,6 +555,9 @@ class AICSImage(ImageContainer):
             The intent is that if the AICSImage class doesn't provide a raw enough
             interface then the base class can be used directly.
         """
+        if self._reader is None:
+            self._reader = self._construct_reader()
+
         return self._reader
 
     @property
@@ -309,6 +580,9 @@ class AICSImage(ImageContainer):
 
         >>> for i in range(len(image.scenes))
         """
+        if self._reader is None:
+            return tuple(self._metadata_cache_entry["scenes"])
+
         return self.reader.scenes
 
     @property
@@ -319,6 +593,9 @@ class AICSImage(ImageContainer):
         scene: str
             The current operating scene.
         """
+        if self._reader is None:
+            return self.scenes[self._current_scene_index]
+
         return self.reader.current_scene
 
     @property
@@ -348,14 +625,122 @@ class AICSImage(ImageContainer):
         TypeError
             The provided value wasn't a string (scene id) or integer (scene index).
         """
+        previous_scene_index = self._current_scene_index
+
+        # Validate and store the scene until the base Reader is constructed
+        if self._reader is None:
+            if isinstance(scene_id, str):
+                if scene_id not in self.scenes:
+                    raise IndexError(
+                        f"Scene id: '{scene_id}' "
+                        f"is not present in available image scenes: {self.scenes}"
+                    )
+
+                self._current_scene_index = self.scenes.index(scene_id)
+
+            elif isinstance(scene_id, int):
+                if scene_id >= len(self.scenes):
+                    raise IndexError(
+                        f"Scene index: {scene_id} "
+                        f"is greater than the number of available scenes "
+                        f"present in the file."
+                    )
+
+                self._current_scene_index = scene_id
+
+            else:
+                raise TypeError(
+                    f"Must provide either a string (for scene id) "
+                    f"or integer (for scene index). "
+                    f"Provided: {scene_id} ({type(scene_id)}."
+                )
+
         # Update current scene on the base Reader
         # This clears the base Reader's cache
-        self.reader.set_scene(scene_id)
+        else:
+            self.reader.set_scene(scene_id)
+            self._current_scene_index = self.reader.current_scene_index
 
-        # Reset the data stored in the AICSImage object
+        # Store the (full resolution) data of the prior scene for later
+        if (
+            self._current_scene_index != previous_scene_index
+            and self._current_resolution_level == 0
+        ):
+            self._scene_cache.store(
+                previous_scene_index,
+                {attr: getattr(self, attr) for attr in SCENE_STATE_ATTRS},
+            )
+
+        # Reset the data stored in the AICSImage object and restore any previously
+        # constructed data of the new scene
         self._xarray_dask_data = None
         self._xarray_data = None
         self._dims = None
+        if self._current_scene_index != previous_scene_index:
+            self._current_resolution_level = 0
+            state = self._scene_cache.pop(self._current_scene_index)
+            if state is not None:
+                for attr, value in state.items():
+                    setattr(self, attr, value)
+
+    @property
+    def resolution_levels(self) -> Tuple[int, ...]:
+        """
+        Returns
+        -------
+        resolution_levels: Tuple[int, ...]
+            A tuple of valid resolution level indices for the current scene, where
+            level 0 is the full resolution image and each following level is a
+            further downsampled version of it.
+        """
+        return self.reader.resolution_levels
+
+    @property
+    def current_resolution_level(self) -> int:
+        """
+        Returns
+        -------
+        resolution_level: int
+            The current operating resolution level of the current scene.
+        """
+        return self._current_resolution_level
+
+    def set_resolution_level(self, resolution_level: int) -> None:
+        """
+        Set the operating resolution level of the current scene.
+
+        Parameters
+        ----------
+        resolution_level: int
+            The resolution level index to set as the operating level.
+
+        Raises
+        ------
+        IndexError
+            The provided level is not found in the available resolution levels.
+
+        Notes
+        -----
+        Setting a different scene resets the operating resolution level to 0.
+
+        Examples
+        --------
+        Render an overview from the lowest resolution level of a pyramid
+
+        >>> img = AICSImage("pyramid.ome.tiff")
+        ... img.set_resolution_level(img.resolution_levels[-1])
+        ... overview = img.get_image_data("YX", Z=0)
+        """
+        # Update current level on the base Reader
+        # This clears the base Reader's cache
+        self.reader.set_resolution_level(resolution_level)
+        if resolution_level != self._current_resolution_level:
+            self._current_resolution_level = resolution_level
+
+            # Reset the data stored in the AICSImage object
+            self._xarray_dask_data = None
+            self._xarray_data = None
+            self._dims = None
 
     def _transform_data_array_to_aics_image_standard(
         self,
@@ -446,6 +831,8 @@ class AICSImage(ImageContainer):
                     )
                 )
 
+            self._cache_scene_metadata()
+
         return self._xarray_dask_data
 
     @property
@@ -496,6 +883,7 @@ class AICSImage(ImageContainer):
                 coords=self._xarray_data.coords,
                 attrs=self._xarray_data.attrs,
             )
+            self._cache_scene_metadata()
 
         return self._xarray_data
 
@@ -536,6 +924,10 @@ class AICSImage(ImageContainer):
         dtype: np.dtype
             Data-type of the image array's elements.
         """
+        scene_metadata = self._get_cached_scene_metadata()
+        if self._xarray_dask_data is None and scene_metadata is not None:
+            return np.dtype(scene_metadata["dtype"])
+
         return self.xarray_dask_data.dtype
 
     @property
@@ -546,6 +938,10 @@ class AICSImage(ImageContainer):
         shape: Tuple[int, ...]
             Tuple of the image array's dimensions.
         """
+        scene_metadata = self._get_cached_scene_metadata()
+        if self._xarray_dask_data is None and scene_metadata is not None:
+            return tuple(scene_metadata["shape"])
+
         return self.xarray_dask_data.shape
 
     @property
@@ -557,9 +953,15 @@ class AICSImage(ImageContainer):
             Object with the paired dimension names and their sizes.
         """
         if self._dims is None:
-            self._dims = dimensions.Dimensions(
-                dims=self.xarray_dask_data.dims, shape=self.shape
-            )
+            scene_metadata = self._get_cached_scene_metadata()
+            if self._xarray_dask_data is None and scene_metadata is not None:
+                self._dims = dimensions.Dimensions(
+                    dims=scene_metadata["dims"], shape=scene_metadata["shape"]
+                )
+            else:
+                self._dims = dimensions.Dimensions(
+                    dims=self.xarray_dask_data.dims, shape=self.shape
+                )
 
         return self._dims
 
@@ -702,7 +1104,10 @@ class AICSImage(ImageContainer):
         -----
         * If a requested dimension is not present in the data the dimension is
           added with a depth of 1.
-        * This will preload the entire image before returning the requested data.
+        * This will preload the entire image before returning the requested data
+          unless the request selects a Y or X region of an image that isn't already
+          in memory, in which case only the chunks (i.e. tiles of tiled TIFFs)
+          intersecting the request are read.
 
         See `aicsimageio.transforms.reshape_data` for more details.
         """
@@ -710,6 +1115,13 @@ class AICSImage(ImageContainer):
         if dimension_order_out is None:
             return self.data
 
+        # Only read the requested region of images that aren't already in memory
+        if self._xarray_data is None and (
+            dimensions.DimensionNames.SpatialY in kwargs
+            or dimensions.DimensionNames.SpatialX in kwargs
+        ):
+            return self.get_image_dask_data(dimension_order_out, **kwargs).compute()
+
         # Transform and return
         return transforms.reshape_data(
             data=self.data,
@@ -835,7 +1247,22 @@ class AICSImage(ImageContainer):
         NotImplementedError
             No metadata transformer available.
         """
-        return self.reader.ome_metadata
+        if self._ome_metadata is None:
+            if "ome_metadata" in self._metadata_cache_entry:
+                self._ome_metadata = from_xml(
+                    self._metadata_cache_entry["ome_metadata"]
+                )
+            else:
+                self._ome_metadata = self.reader.ome_metadata
+
+                # Store the (potentially expensive to produce) OME metadata
+                if self._metadata_cache is not None:
+                    self._metadata_cache_entry["ome_metadata"] = to_xml(
+                        self._ome_metadata
+                    )
+                    self._write_metadata_cache()
+
+        return self._ome_metadata
 
     @property
     def channel_names(self) -> List[str]:
@@ -845,6 +1272,10 @@ class AICSImage(ImageContainer):
         channel_names: List[str]
             Using available metadata, the list of strings representing channel names.
         """
+        scene_metadata = self._get_cached_scene_metadata()
+        if self._xarray_dask_data is None and scene_metadata is not None:
+            return list(scene_metadata["channel_names"])
+
         # Unlike the base readers, the AICSImage guarantees a Channel dim
         return list(self.xarray_dask_data[dimensions.DimensionNames.Channel].values)
 
@@ -862,6 +1293,10 @@ class AICSImage(ImageContainer):
         We currently do not handle unit attachment to these values. Please see the file
         metadata for unit information.
         """
+        scene_metadata = self._get_cached_scene_metadata()
+        if scene_metadata is not None:
+            return PhysicalPixelSizes(*scene_metadata["physical_pixel_sizes"])
+
         return self.reader.physical_pixel_sizes
 
     def get_mosaic_tile_position(
@@ -885,6 +1320,142 @@ class AICSImage(ImageContainer):
         """
         return self.reader.get_mosaic_tile_position(mosaic_tile_index)
 
+    def get_mosaic_tile_positions(self) -> np.ndarray:
+        """
+        Get the absolute position (top left point) and size of every mosaic tile of
+        the current scene at once.
+
+        Returns
+        -------
+        positions: np.ndarray
+            A read-only integer array with one row per mosaic tile (in M index order)
+            and columns: Y (top), X (left), height, and width.
+
+        Raises
+        ------
+        UnexpectedShapeError
+            The image has no mosaic dimension available.
+        """
+        return self.reader.get_mosaic_tile_positions()
+
+    def get_mosaic_region_dask_data(
+        self,
+        x: int,
+        y: int,
+        w: int,
+        h: int,
+        dimension_order_out: Optional[str] = None,
+        **kwargs: Any,
+    ) -> da.Array:
+        """
+        Get a Y and X region of the stitched mosaic image as a dask array, only
+        reading the tiles that intersect the region.
+
+        Parameters
+        ----------
+        x: int
+            The left X pixel of the region in the stitched mosaic.
+        y: int
+            The top Y pixel of the region in the stitched mosaic.
+        w: int
+            The width of the region. Clipped to the stitched mosaic.
+        h: int
+            The height of the region. Clipped to the stitched mosaic.
+        dimension_order_out: Optional[str]
+            A string containing the dimension ordering desired for the returned array.
+            Default: The AICSImage standard dimension order of the stitched mosaic.
+        kwargs: Any
+            The selections of the other dimensions (i.e. `C=1` or `T=range(3)`).
+            See `get_image_dask_data` for more details.
+
+        Returns
+        -------
+        region: da.Array
+            The region with the specified dimension ordering.
+
+        Raises
+        ------
+        UnexpectedShapeError
+            The image has no mosaic dimension available.
+        ValueError
+            The region has a negative position or no area.
+        """
+        mosaic_dims = self.reader.dims.order.replace(
+            dimensions.DimensionNames.MosaicTile, ""
+        )
+        if dimensions.DimensionNames.Samples in mosaic_dims:
+            standard_dims = dimensions.DEFAULT_DIMENSION_ORDER_WITH_SAMPLES
+        else:
+            standard_dims = dimensions.DEFAULT_DIMENSION_ORDER
+
+        region = transforms.reshape_data(
+            data=self.reader.get_mosaic_region_dask_data(x, y, w, h),
+            given_dims=mosaic_dims,
+            return_dims=standard_dims,
+        )
+        return cast(
+            da.Array,
+            transforms.reshape_data(
+                data=region,
+                given_dims=standard_dims,
+                return_dims=dimension_order_out or standard_dims,
+                **kwargs,
+            ),
+        )
+
+    def get_mosaic_region(
+        self,
+        x: int,
+        y: int,
+        w: int,
+        h: int,
+        dimension_order_out: Optional[str] = None,
+        **kwargs: Any,
+    ) -> np.ndarray:
+        """
+        Get a Y and X region of the stitched mosaic image as a numpy array, only
+        reading the tiles that intersect the region.
+
+        Parameters
+        ----------
+        x: int
+            The left X pixel of the region in the stitched mosaic.
+        y: int
+            The top Y pixel of the region in the stitched mosaic.
+        w: int
+            The width of the region. Clipped to the stitched mosaic.
+        h: int
+            The height of the region. Clipped to the stitched mosaic.
+        dimension_order_out: Optional[str]
+            A string containing the dimension ordering desired for the returned array.
+            Default: The AICSImage standard dimension order of the stitched mosaic.
+        kwargs: Any
+            The selections of the other dimensions (i.e. `C=1` or `T=range(3)`).
+            See `get_image_data` for more details.
+
+        Returns
+        -------
+        region: np.ndarray
+            The region with the specified dimension ordering.
+
+        Raises
+        ------
+        UnexpectedShapeError
+            The image has no mosaic dimension available.
+        ValueError
+            The region has a negative position or no area.
+
+        Examples
+        --------
+        Pan over a large stitched scan
+
+        >>> img = AICSImage("very-large-mosaic.czi")
+        ... view = img.get_mosaic_region(20000, 10000, 1024, 1024, "YX", C=0)
+        """
+        return self.get_mosaic_region_dask_data(
+            x, y, w, h, dimension_order_out, **kwargs
+        ).compute()
+
     @property
     def mosaic_tile_dims(self) -> Optional[dimensions.Dimensions]:
         """
@@ -902,30 +1473,35 @@ class AICSImage(ImageContainer):
         select_scenes: Optional[Union[List[str], Tuple[str, ...]]] = None,
     ) -> None:
         """
-        Saves the file data to OME-TIFF format with general naive best practices.
+        Saves the file data to OME-TIFF or OME-Zarr format with general naive best
+        practices.
 
         Parameters
         ----------
         uri: types.PathLike
             The URI or local path for where to save the data.
-            Note: Can only write to local file systems.
+            URIs ending with ".zarr" are saved as OME-Zarr with OmeZarrWriter (to any
+            fsspec supported file system), all others as OME-TIFF with OmeTiffWriter
+            (to local file systems only).
         select_scenes: Optional[Union[List[str], Tuple[str, ...]]]
             Which scenes in the image to save to the file.
             Default: None (save all scenes)
 
         Notes
         -----
-        See `aicsimageio.writers.OmeTiffWriter` for more in-depth specification
-        and the `aicsimageio.writers` module as a whole for list of all available
-        file writers.
-
-        When reading in the produced OME-TIFF file, scenes IDs may have changed.
-        This is due to how certain file and metadata formats do or do-not have IDs
-        and simply names. In converting to OME-TIFF we will always store the scene
-        ids in each Image's name attribute but IDs will be generated. The order of the
-        scenes will be the same (or whatever order was specified / provided).
+        See `aicsimageio.writers.OmeTiffWriter` and
+        `aicsimageio.writers.OmeZarrWriter` for more in-depth specification and the
+        `aicsimageio.writers` module as a whole for list of all available file
+        writers.
+
+        When reading in the produced OME-TIFF or OME-Zarr file, scenes IDs may have
+        changed. This is due to how certain file and metadata formats do or do-not
+        have IDs and simply names. In converting to OME-TIFF or OME-Zarr we will
+        always store the scene ids in each Image's name attribute but IDs will be
+        generated. The order of the scenes will be the same (or whatever order was
+        specified / provided).
         """
-        from .writers import OmeTiffWriter
+        from .writers import OmeTiffWriter, OmeZarrWriter
 
         # Get all parameters as dict of lists, or static because of unchanging values
         datas: List[types.ArrayLike] = []
@@ -949,8 +1525,13 @@ class AICSImage(ImageContainer):
             image_names.append(self.current_scene)
             physical_pixel_sizes.append(self.physical_pixel_sizes)
 
+        # Choose the writer by extension
+        writer: Union[Type[OmeTiffWriter], Type[OmeZarrWriter]] = (
+            OmeZarrWriter if str(uri).rstrip("/").endswith(".zarr") else OmeTiffWriter
+        )
+
         # Save all selected scenes
-        OmeTiffWriter.save(
+        writer.save(
             data=datas,
             uri=uri,
             dim_order=dim_orders,
@@ -962,7 +1543,7 @@ class AICSImage(ImageContainer):
     def __str__(self) -> str:
         return (
             f"<AICSImage ["
-            f"Reader: {type(self.reader).__name__}, "
+            f"Reader: {self._reader_class.__name__}, "
             f"Image-is-in-Memory: {self._xarray_data is not None}"
             f"]>"
         )
@@ -2,7 +2,10 @@
 # -*- coding: utf-8 -*-
 
 from collections.abc import Sequence as seq
-from typing import Collection, ItemsView, Sequence, Tuple, Union
+from typing import Collection, Dict, ItemsView, List, Optional, Sequence, Tuple, Union
+
+import dask
+from dask.utils import parse_bytes
 
 ###############################################################################
 
@@ -60,6 +63,98 @@ REQUIRED_CHUNK_DIMS = [
     DimensionNames.Samples,
 ]
 
+# Use as chunk_dims to pick the chunk dims from the file layout
+AUTO_CHUNK_DIMS = "auto"
+
+# The dims always chunked (in addition to the required chunk dims) for each access hint
+CHUNK_ACCESS_HINTS: Dict[str, List[str]] = {
+    "plane": [],
+    "stack": [DimensionNames.SpatialZ],
+    "timeseries": [DimensionNames.Time],
+    "channels": [DimensionNames.Channel],
+}
+
+###############################################################################
+
+
+def guess_chunk_dims(
+    dims: Sequence[str],
+    shape: Sequence[int],
+    itemsize: int,
+    access_hint: Optional[str] = None,
+    target_chunk_bytes: Optional[int] = None,
+) -> List[str]:
+    """
+    Pick the dimensions to chunk by from the stored layout of an image.
+
+    Parameters
+    ----------
+    dims: Sequence[str]
+        The dimensions of the image in the order they are stored in the file
+        (i.e. the page order of a TIFF), outermost first.
+    shape: Sequence[int]
+        The size of each dimension.
+    itemsize: int
+        The number of bytes per pixel.
+    access_hint: Optional[str]
+        How the image will be accessed, one of CHUNK_ACCESS_HINTS: "plane" (only the
+        required plane dims), "stack" (Z-stacks), "timeseries" (time series), or
+        "channels" (all channels of a plane).
+        Default: None (grow the chunks along the stored order up to the target size)
+    target_chunk_bytes: Optional[int]
+        The number of bytes a chunk may grow to when no access hint is provided.
+        Default: None (the dask "array.chunk-size" config value)
+
+    Returns
+    -------
+    chunk_dims: List[str]
+        The dimensions to chunk by, always including the required chunk dims.
+
+    Raises
+    ------
+    ValueError
+        The provided access hint is not one of CHUNK_ACCESS_HINTS.
+
+    Notes
+    -----
+    Without an access hint, chunks start as the plane and add the next outer stored
+    dimension while the chunk stays within the target size. This keeps every chunk
+    a contiguous run of planes in the file. The mosaic tile dimension is never
+    chunked.
+    """
+    chunk_dims = [d for d in REQUIRED_CHUNK_DIMS if d in dims]
+
+    # Follow the declared access pattern
+    if access_hint is not None:
+        if access_hint not in CHUNK_ACCESS_HINTS:
+            raise ValueError(
+                f"Unknown chunk access hint: '{access_hint}'. "
+                f"Valid hints: {list(CHUNK_ACCESS_HINTS)}"
+            )
+
+        return chunk_dims + [d for d in CHUNK_ACCESS_HINTS[access_hint] if d in dims]
+
+    if target_chunk_bytes is None:
+        target_chunk_bytes = parse_bytes(dask.config.get("array.chunk-size"))
+
+    # Grow from the innermost stored dimension outwards while the chunk fits
+    sizes = dict(zip(dims, shape))
+    chunk_bytes = itemsize
+    for d in chunk_dims:
+        chunk_bytes *= sizes[d]
+
+    for d in reversed(dims):
+        if d in chunk_dims or d == DimensionNames.MosaicTile:
+            continue
+        if chunk_bytes * sizes[d] > target_chunk_bytes:
+            break
+
+        chunk_dims.append(d)
+        chunk_bytes *= sizes[d]
+
+    return chunk_dims
+
+
 ###############################################################################
 
 
@@ -1,7 +1,7 @@
 #!/usr/bin/env python
 # -*- coding: utf-8 -*-
 
-from typing import Dict, List
+from typing import Dict, List, Tuple
 
 ###############################################################################
 
@@ -339,6 +339,7 @@ FORMAT_IMPLEMENTATIONS: Dict[str, List[str]] = {
         "aicsimageio.readers.bioformats_reader.BioformatsReader",
         "aicsimageio.readers.default_reader.DefaultReader",
     ],
+    "ome.zarr": ["aicsimageio.readers.ome_zarr_reader.OmeZarrReader"],
     "orf": ["aicsimageio.readers.default_reader.DefaultReader"],
     "par": ["aicsimageio.readers.bioformats_reader.BioformatsReader"],
     "pbm": ["aicsimageio.readers.default_reader.DefaultReader"],
@@ -470,6 +471,7 @@ FORMAT_IMPLEMENTATIONS: Dict[str, List[str]] = {
     "xqf": ["aicsimageio.readers.bioformats_reader.BioformatsReader"],
     "xv": ["aicsimageio.readers.bioformats_reader.BioformatsReader"],
     "xys": ["aicsimageio.readers.bioformats_reader.BioformatsReader"],
+    "zarr": ["aicsimageio.readers.ome_zarr_reader.OmeZarrReader"],
     "zfp": ["aicsimageio.readers.bioformats_reader.BioformatsReader"],
     "zfr": ["aicsimageio.readers.bioformats_reader.BioformatsReader"],
     "zip": ["aicsimageio.readers.bioformats_reader.BioformatsReader"],
@@ -485,3 +487,66 @@ READER_TO_INSTALL: Dict[str, str] = {
     "aicsimageio.readers.dv_reader.DVReader": "aicsimageio[dv]",
     "aicsimageio.readers.nd2_reader.ND2Reader": "aicsimageio[nd2]",
 }
+
+# The readers to use for files identified by their leading bytes
+# (i.e. files without, or with misleading, extensions)
+#
+# Each file signature is one or more (offset, magic bytes) pairs that must all match.
+# Signatures are checked in order, so the most specific signatures come first.
+# The readers are tried in order, all but the final installed reader are validated
+# with `is_supported_image`, the final installed reader is trusted based on the
+# file signature alone unless the signature is weak (shorter than
+# MIN_TRUSTED_FILE_SIGNATURE_BYTES in total), then it is validated as well.
+
+TIFF_SIGNATURE_READERS: List[str] = [
+    "aicsimageio.readers.bfio_reader.OmeTiledTiffReader",
+    "aicsimageio.readers.ome_tiff_reader.OmeTiffReader",
+    "aicsimageio.readers.tiff_reader.TiffReader",
+]
+
+FILE_SIGNATURE_IMPLEMENTATIONS: List[
+    Tuple[Tuple[Tuple[int, bytes], ...], List[str]]
+] = [
+    # TIFF (little and big endian)
+    (((0, b"II*\x00"),), TIFF_SIGNATURE_READERS),
+    (((0, b"MM\x00*"),), TIFF_SIGNATURE_READERS),
+    # BigTIFF (little and big endian)
+    (((0, b"II+\x00"),), TIFF_SIGNATURE_READERS),
+    (((0, b"MM\x00+"),), TIFF_SIGNATURE_READERS),
+    # CZI
+    (((0, b"ZISRAWFILE"),), ["aicsimageio.readers.czi_reader.CziReader"]),
+    # LIF (test value 0x70 then the 0x2A XML header marker)
+    (
+        ((0, b"\x70\x00\x00\x00"), (8, b"\x2a")),
+        ["aicsimageio.readers.lif_reader.LifReader"],
+    ),
+    # ND2 (non-JPEG2000 based)
+    (((0, b"\xda\xce\xbe\x0a"),), ["aicsimageio.readers.nd2_reader.ND2Reader"]),
+    # PNG, JPEG, and GIF
+    (
+        ((0, b"\x89PNG\r\n\x1a\n"),),
+        ["aicsimageio.readers.default_reader.DefaultReader"],
+    ),
+    (((0, b"\xff\xd8\xff"),), ["aicsimageio.readers.default_reader.DefaultReader"]),
+    (((0, b"GIF87a"),), ["aicsimageio.readers.default_reader.DefaultReader"]),
+    (((0, b"GIF89a"),), ["aicsimageio.readers.default_reader.DefaultReader"]),
+    # MP4 / MOV, AVI, and MKV / WebM
+    (((4, b"ftyp"),), ["aicsimageio.readers.default_reader.DefaultReader"]),
+    (
+        ((0, b"RIFF"), (8, b"AVI ")),
+        ["aicsimageio.readers.default_reader.DefaultReader"],
+    ),
+    (
+        ((0, b"\x1a\x45\xdf\xa3"),),
+        ["aicsimageio.readers.default_reader.DefaultReader"],
+    ),
+    # DV (Priism / MRC header with the DV magic number, little and big endian)
+    (((96, b"\xa0\xc0"),), ["aicsimageio.readers.dv_reader.DVReader"]),
+    (((96, b"\xc0\xa0"),), ["aicsimageio.readers.dv_reader.DVReader"]),
+]
+
+# File signatures with fewer magic bytes than this are validated with the reader
+MIN_TRUSTED_FILE_SIGNATURE_BYTES = 4
+
+# The number of leading bytes to read to identify a file by signature
+FILE_SIGNATURE_READ_BYTES = 4096
@@ -11,10 +11,17 @@ from xml.etree import ElementTree as ET
 
 import lxml.etree
 import numpy as np
-from ome_types import OME
-from ome_types.model.simple_types import PixelType
-
-from ..dimensions import DimensionNames
+from ome_types import OME, from_xml, to_xml
+from ome_types.model import Channel, Image, Pixels, TiffData
+from ome_types.model.simple_types import ChannelID, Color, PixelType, PositiveFloat
+
+from .. import exceptions
+from ..dimensions import (
+    DEFAULT_DIMENSION_ORDER,
+    DEFAULT_DIMENSION_ORDER_LIST_WITH_SAMPLES,
+    DEFAULT_DIMENSION_ORDER_WITH_SAMPLES,
+    DimensionNames,
+)
 from ..types import ArrayLike, PathLike, PhysicalPixelSizes
 
 ###############################################################################
@@ -40,6 +47,10 @@ KNOWN_INVALID_OME_XSD_REFERENCES = [
 ]
 REPLACEMENT_OME_XSD_REFERENCE = "www.openmicroscopy.org/Schemas/OME/2016-06"
 
+# The OME-XML of a bioformats2raw layout OME-Zarr is stored in the OME group
+OME_GROUP = "OME"
+OME_METADATA_KEY = f"{OME_GROUP}/METADATA.ome.xml"
+
 ###############################################################################
 
 
@@ -699,3 +710,341 @@ def physical_pixel_sizes(ome: OME, scene: int = 0) -> PhysicalPixelSizes:
     """
     p = ome.images[scene].pixels
     return PhysicalPixelSizes(p.physical_size_z, p.physical_size_y, p.physical_size_x)
+
+
+def extend_data_shape(shape: Tuple[int, ...], num_dims: int) -> Tuple[int, ...]:
+    # extend data shape to be same len as dimension_order
+    if len(shape) < num_dims:
+        shape = tuple([1] * (num_dims - len(shape))) + shape
+    return shape
+
+
+def resolve_ome_dimension_order(
+    shape: Tuple[int, ...], dimension_order: Union[str, None]
+) -> Tuple[str, bool]:
+    """
+    Do some dimension validation and return an ome-compatible 5D dimension order
+    and whether the data is rgb multisample
+
+    Parameters
+    ----------
+    shape: Tuple[int, ...]
+        A data array shape
+    dimension_order: Union[str, None]
+        A dimension order string, composed of some subset of TCZYXS
+
+    Returns
+    -------
+    Tuple[str, bool]
+        An OME-compatible 5D dimension_order string and a boolean for whether the
+        data shape had rgb samples
+    """
+    ndims = len(shape)
+
+    if ndims > 5 and (shape[-1] != 3 and shape[-1] != 4):
+        raise ValueError(
+            f"Passed in greater than 5D data but last dimension is not 3 or 4: "
+            f"{shape[-1]}"
+        )
+
+    if dimension_order is not None and len(dimension_order) != ndims:
+        raise exceptions.InvalidDimensionOrderingError(
+            f"Dimension order string has {len(dimension_order)} dims but data "
+            f"shape has {ndims} dims"
+        )
+
+    # data is rgb if last dimension is S and its size is 3 or 4
+    is_rgb = False
+    if dimension_order is None:
+        # we will only guess rgb here if ndims > 5
+        # I could make a better guess if I look at any ome-xml passed in
+        is_rgb = ndims > 5 and (shape[-1] == 3 or shape[-1] == 4)
+        dimension_order = (
+            DEFAULT_DIMENSION_ORDER_WITH_SAMPLES if is_rgb else DEFAULT_DIMENSION_ORDER
+        )
+    else:
+        is_rgb = dimension_order[-1] == DimensionNames.Samples and (
+            shape[-1] == 3 or shape[-1] == 4
+        )
+
+    if (ndims > 5 and not is_rgb) or ndims > 6 or ndims < 2:
+        raise ValueError(
+            f"Data array has unexpected number of dimensions: is_rgb = {is_rgb} "
+            f"and shape is {shape}"
+        )
+
+    # assert valid characters in dimension_order
+    if not (
+        all(d in DEFAULT_DIMENSION_ORDER_LIST_WITH_SAMPLES for d in dimension_order)
+    ):
+        raise exceptions.InvalidDimensionOrderingError(
+            f"Invalid dimension_order {dimension_order}"
+        )
+    if dimension_order.find(DimensionNames.Samples) > -1 and not is_rgb:
+        raise exceptions.InvalidDimensionOrderingError(
+            "Samples must be last dimension if present, and only S=3 or 4 is \
+            supported."
+        )
+    if dimension_order[-2:] != "YX" and dimension_order[-3:] != "YXS":
+        raise exceptions.InvalidDimensionOrderingError(
+            f"Last characters of dimension_order {dimension_order} expected to \
+            be YX or YXS.  Please transpose your data."
+        )
+
+    # remember whether S was a dim or not, and remove it for now
+    if is_rgb:
+        ndims = ndims - 1
+        dimension_order = dimension_order[:-1]
+
+    # expand to 5D and add appropriate dimensions
+    if len(dimension_order) == 2:
+        dimension_order = "TCZ" + dimension_order
+
+    # expand to 5D and add appropriate dimensions
+    elif len(dimension_order) == 3:
+        # prepend either TC, TZ or CZ
+        if dimension_order[0] == DimensionNames.Time:
+            dimension_order = "CZ" + dimension_order
+        elif dimension_order[0] == DimensionNames.Channel:
+            dimension_order = "TZ" + dimension_order
+        elif dimension_order[0] == DimensionNames.SpatialZ:
+            dimension_order = "TC" + dimension_order
+
+    # expand to 5D and add appropriate dimensions
+    elif len(dimension_order) == 4:
+        # prepend either T, C, or Z
+        first2 = dimension_order[:2]
+        if first2 == "TC" or first2 == "CT":
+            dimension_order = DimensionNames.SpatialZ + dimension_order
+        elif first2 == "TZ" or first2 == "ZT":
+            dimension_order = DimensionNames.Channel + dimension_order
+        elif first2 == "CZ" or first2 == "ZC":
+            dimension_order = DimensionNames.Time + dimension_order
+
+    return dimension_order, is_rgb
+
+
+def _build_ome_image(
+    image_index: int = 0,
+    tiff_plane_offset: int = 0,
+    data_shape: Tuple[int, ...] = (1, 1, 1, 1, 1),
+    data_dtype: np.dtype = np.dtype(np.uint8),
+    is_rgb: bool = False,
+    dimension_order: str = DEFAULT_DIMENSION_ORDER,
+    image_name: Optional[str] = "I0",
+    physical_pixel_sizes: PhysicalPixelSizes = PhysicalPixelSizes(None, None, None),
+    channel_names: List[str] = None,
+    channel_colors: Optional[List[List[int]]] = None,
+) -> Image:
+    if len(data_shape) < 2 or len(data_shape) > 6:
+        raise ValueError(f"Bad OME image shape length: {data_shape}")
+
+    # extend data shape to be same len as dimension_order, accounting for rgb
+    if is_rgb:
+        data_shape = extend_data_shape(data_shape, len(dimension_order) + 1)
+    else:
+        data_shape = extend_data_shape(data_shape, len(dimension_order))
+
+    def dim_or_1(dim: str) -> int:
+        idx = dimension_order.find(dim)
+        return 1 if idx == -1 else data_shape[idx]
+
+    channel_count = dim_or_1(DimensionNames.Channel)
+
+    if len(dimension_order) != 5:
+        raise ValueError(f"Unrecognized OME TIFF dimension order {dimension_order}")
+    for c in dimension_order:
+        if c not in DEFAULT_DIMENSION_ORDER:
+            raise ValueError(f"Unrecognized OME TIFF dimension {c}")
+    if isinstance(channel_names, list) and len(channel_names) != channel_count:
+        raise ValueError(f"Wrong number of channel names {len(channel_names)}")
+    if isinstance(channel_colors, list) and len(channel_colors) != channel_count:
+        raise ValueError(
+            f"Wrong number of channel colors. "
+            f"Received: {len(channel_colors)} ({channel_colors}) "
+            f"Expected: {channel_count}."
+        )
+
+    samples_per_pixel = 1
+    if is_rgb:
+        samples_per_pixel = data_shape[-1]
+
+    # dimension_order must be set to the *reverse* of what dimensionality
+    # the ome tif file is saved as
+    pixels = Pixels(
+        id=f"Pixels:{image_index}:0",
+        dimension_order=dimension_order[::-1],
+        type=dtype_to_ome_type(data_dtype),
+        size_t=dim_or_1(DimensionNames.Time),
+        size_c=channel_count * samples_per_pixel,
+        size_z=dim_or_1(DimensionNames.SpatialZ),
+        size_y=dim_or_1(DimensionNames.SpatialY),
+        size_x=dim_or_1(DimensionNames.SpatialX),
+        interleaved=True if samples_per_pixel > 1 else None,
+    )
+    if physical_pixel_sizes.Z is None or physical_pixel_sizes.Z == 0:
+        pixels.physical_size_z = None
+    else:
+        pixels.physical_size_z = PositiveFloat(physical_pixel_sizes.Z)
+    if physical_pixel_sizes.Y is None or physical_pixel_sizes.Y == 0:
+        pixels.physical_size_y = None
+    else:
+        pixels.physical_size_y = PositiveFloat(physical_pixel_sizes.Y)
+    if physical_pixel_sizes.X is None or physical_pixel_sizes.X == 0:
+        pixels.physical_size_x = None
+    else:
+        pixels.physical_size_x = PositiveFloat(physical_pixel_sizes.X)
+
+    # one single tiffdata indicating sequential tiff IFDs based on dimension_order
+    pixels.tiff_data_blocks = [
+        TiffData(
+            plane_count=pixels.size_t * channel_count * pixels.size_z,
+            ifd=tiff_plane_offset,
+        )
+    ]
+
+    pixels.channels = [
+        Channel(samples_per_pixel=samples_per_pixel) for i in range(channel_count)
+    ]
+    if channel_names is None:
+        for i in range(channel_count):
+            pixels.channels[i].id = ChannelID(
+                generate_ome_channel_id(str(image_index), i)
+            )
+            pixels.channels[i].name = "C:" + str(i)
+    else:
+        for i in range(channel_count):
+            name = channel_names[i]
+            pixels.channels[i].id = ChannelID(
+                generate_ome_channel_id(str(image_index), i)
+            )
+            pixels.channels[i].name = name
+
+    if channel_colors is not None:
+        assert len(channel_colors) >= pixels.size_c
+        for i in range(channel_count):
+            this_channel_color_def = channel_colors[i]
+            if len(this_channel_color_def) != 3:
+                raise ValueError(
+                    f"Expected RGB (3) color definition for channel color. "
+                    f"Received {len(this_channel_color_def)} values "
+                    f"({this_channel_color_def}) for image {image_index} "
+                    f"channel {i}."
+                )
+            else:
+                # Handle List[int] -> Tuple[int, int, int] for color def
+                # Naive cast of tuple(List[int]) generates type: Tuple[int, ...]
+                this_channel_color = (
+                    this_channel_color_def[0],
+                    this_channel_color_def[1],
+                    this_channel_color_def[2],
+                )
+
+                pixels.channels[i].color = Color(this_channel_color)
+
+    img = Image(
+        name=image_name,
+        id=generate_ome_image_id(str(image_index)),
+        pixels=pixels,
+    )
+    return img
+
+
+def build_ome(
+    data_shapes: List[Tuple[int, ...]],
+    data_types: List[np.dtype],
+    dimension_order: Optional[List[Optional[str]]] = None,
+    channel_names: Optional[List[Optional[List[str]]]] = None,
+    image_name: List[Optional[str]] = None,
+    physical_pixel_sizes: List[PhysicalPixelSizes] = None,
+    channel_colors: List[Optional[List[List[int]]]] = None,
+) -> OME:
+    """
+
+    Create the necessary metadata for an OME tiff image
+
+    Parameters
+    ----------
+    data_shapes:
+        A list of 5- or 6-d tuples
+    data_types:
+        A list of data types
+    dimension_order:
+        The order of dimensions in the data array, using
+        T,C,Z,Y,X and optionally S
+    channel_names:
+        The names for each channel to be put into the OME metadata
+    image_name:
+        The name of the image to be put into the OME metadata
+    physical_pixel_sizes:
+        Z,Y, and X physical dimensions of each pixel,
+        defaulting to microns
+    channel_colors:
+        List of all images channel colors to be put into the OME metadata
+    is_rgb:
+        is a S dimension present?  S is expected to be the last dim in
+        the data shape
+
+    Returns
+    -------
+    OME
+        An OME object that can be converted to a valid OME-XML string
+    """
+    num_images = len(data_shapes)
+    # resolve defaults that are None
+    if dimension_order is None:
+        dimension_order = [None] * num_images
+    if channel_names is None:
+        channel_names = [None] * num_images
+    if image_name is None:
+        image_name = [None] * num_images
+    if physical_pixel_sizes is None:
+        physical_pixel_sizes = [PhysicalPixelSizes(None, None, None)] * num_images
+    if channel_colors is None:
+        channel_colors = [None] * num_images
+
+    # assert all lists are same length
+    if (
+        num_images != len(data_types)
+        or num_images != len(dimension_order)
+        or num_images != len(channel_names)
+        or num_images != len(image_name)
+        or num_images != len(physical_pixel_sizes)
+        or num_images != len(channel_colors)
+    ):
+        raise ValueError("Mismatched array counts in parameters to build_ome")
+
+    images = []
+    tiff_plane_offset = 0
+    for image_index in range(len(data_shapes)):
+        # correct the dimension_order for ome
+        ome_dimension_order, is_rgb = resolve_ome_dimension_order(
+            data_shapes[image_index], dimension_order[image_index]
+        )
+        img = _build_ome_image(
+            image_index,
+            tiff_plane_offset,
+            data_shapes[image_index],
+            data_types[image_index],
+            is_rgb,
+            ome_dimension_order,
+            image_name[image_index],
+            physical_pixel_sizes[image_index],
+            channel_names[image_index],
+            channel_colors[image_index],
+        )
+        # increment tiff_plane_offset for next image
+        tiff_plane_offset += (
+            img.pixels.size_z * img.pixels.size_t * len(img.pixels.channels)
+        )
+        images.append(img)
+
+    from .. import get_module_version
+
+    ome_object = OME(creator=f"aicsimageio {get_module_version()}", images=images)
+
+    # validate! (TODO: Is there a better api in ome-types for this?)
+    test = to_xml(ome_object)
+    from_xml(test)
+
+    return ome_object
@@ -14,6 +14,7 @@ if TYPE_CHECKING:
     from .lif_reader import LifReader  # noqa: F401
     from .nd2_reader import ND2Reader  # noqa: F401
     from .ome_tiff_reader import OmeTiffReader  # noqa: F401
+    from .ome_zarr_reader import OmeZarrReader  # noqa: F401
     from .reader import Reader
     from .tiff_glob_reader import TiffGlobReader  # noqa: F401
     from .tiff_reader import TiffReader  # noqa: F401
@@ -29,6 +30,7 @@ _READERS = (
     ".lif_reader.LifReader",
     ".nd2_reader.ND2Reader",
     ".ome_tiff_reader.OmeTiffReader",
+    ".ome_zarr_reader.OmeZarrReader",
     ".tiff_reader.TiffReader",
     ".tiff_glob_reader.TiffGlobReader",
 )
@@ -4,21 +4,27 @@
 import logging
 import xml.etree.ElementTree as ET
 from copy import copy
+from functools import partial
 from pathlib import Path
 from typing import Any, Dict, Hashable, List, Optional, Tuple, Union
 
 import dask.array as da
 import numpy as np
 import xarray as xr
-from dask import delayed
 from fsspec.implementations.local import LocalFileSystem
 from fsspec.spec import AbstractFileSystem
 from ome_types.model.ome import OME
 
 from .. import constants, exceptions, types
-from ..dimensions import DEFAULT_CHUNK_DIMS, REQUIRED_CHUNK_DIMS, DimensionNames
+from ..dimensions import (
+    AUTO_CHUNK_DIMS,
+    DEFAULT_CHUNK_DIMS,
+    REQUIRED_CHUNK_DIMS,
+    DimensionNames,
+    guess_chunk_dims,
+)
 from ..metadata import utils as metadata_utils
-from ..utils import io_utils
+from ..utils import dask_utils, io_utils
 from .reader import Reader
 
 try:
@@ -68,7 +74,8 @@ class CziReader(Reader):
     image: types.PathLike
         Path to image file to construct Reader for.
     chunk_dims: Union[str, List[str]]
-        Which dimensions to create chunks for.
+        Which dimensions to create chunks for, or "auto" (AUTO_CHUNK_DIMS) to pick
+        them from the stored layout of each scene (see `guess_chunk_dims`).
         Default: DEFAULT_CHUNK_DIMS
         Note: DimensionNames.SpatialY, DimensionNames.SpatialX, and
         DimensionNames.Samples, will always be added to the list if not present during
@@ -79,6 +86,11 @@ class CziReader(Reader):
     fs_kwargs: Dict[str, Any]
         Any specific keyword arguments to pass down to the fsspec created filesystem.
         Default: {}
+    chunk_access_hint: Optional[str]
+        How the image will be accessed ("plane", "stack", "timeseries", or
+        "channels"), used to pick the chunk dims when chunk_dims is "auto".
+        Default: None (chunks grow along the stored order up to the dask
+        "array.chunk-size")
 
     Notes
     -----
@@ -107,6 +119,7 @@ class CziReader(Reader):
         chunk_dims: Union[str, List[str]] = DEFAULT_CHUNK_DIMS,
         include_subblock_metadata: bool = False,
         fs_kwargs: Dict[str, Any] = {},
+        chunk_access_hint: Optional[str] = None,
     ):
         # Expand details of provided image
         self._fs, self._path = io_utils.pathlike_to_fs(
@@ -123,7 +136,12 @@ class CziReader(Reader):
             )
 
         # Store params
-        if isinstance(chunk_dims, str):
+        # Auto chunk dims are picked for each scene during dask array construction
+        self._auto_chunk_dims = chunk_dims == AUTO_CHUNK_DIMS
+        self._chunk_access_hint = chunk_access_hint
+        if self._auto_chunk_dims:
+            chunk_dims = []
+        elif isinstance(chunk_dims, str):
             chunk_dims = list(chunk_dims)
 
         self.chunk_dims = chunk_dims
@@ -133,6 +151,9 @@ class CziReader(Reader):
         # Delayed storage
         self._px_sizes: Optional[types.PhysicalPixelSizes] = None
         self._mapped_dims: Optional[str] = None
+        self._mosaic_tile_regions: Optional[
+            Tuple[List[str], List[int], List[Tuple[Tuple[Any, ...], Tuple[Any, ...]]]]
+        ] = None
 
         # Enforce valid image
         if not self._is_supported_image(self._fs, self._path):
@@ -291,6 +312,38 @@ class CziReader(Reader):
             fs=fs, path=path, scene=scene, read_dims=read_dims
         )[0]
 
+    @staticmethod
+    def _read_chunk_for_block(
+        block_index: Tuple[int, ...],
+        fs: AbstractFileSystem,
+        path: str,
+        scene: int,
+        blocked_dimension_order: List[str],
+        begin_indicies: Tuple[int, ...],
+        chunk_dims: List[str],
+    ) -> np.ndarray:
+        # Add the czi file begin index for each dimension to the array dimension
+        # index (chunk dimensions are a single block so their block index is zero)
+        this_chunk_read_indicies = (
+            current_dim_begin_index + curr_dim_index
+            for current_dim_begin_index, curr_dim_index in zip(
+                begin_indicies, block_index
+            )
+        )
+
+        # Zip the dims with the read indices
+        this_chunk_read_dims = dict(
+            zip(blocked_dimension_order, this_chunk_read_indicies)
+        )
+
+        # Remove the dimensions that we want to chunk by from the read dims
+        for d in chunk_dims:
+            this_chunk_read_dims.pop(d, None)
+
+        return CziReader._read_chunk_from_image(
+            fs=fs, path=path, scene=scene, read_dims=this_chunk_read_dims
+        )
+
     @staticmethod
     def _get_image_data(
         fs: AbstractFileSystem,
@@ -358,7 +411,7 @@ class CziReader(Reader):
             # Convert ops and run getitem
             return data[tuple(ops)], real_dims
 
-    def _create_dask_array(self, czi: CziFile) -> xr.DataArray:
+    def _create_dask_array(self, czi: CziFile) -> da.Array:
         """
         Creates a delayed dask array for the file.
 
@@ -372,14 +425,6 @@ class CziReader(Reader):
         image_data: da.Array
             The fully constructed and fully delayed image as a Dask Array object.
         """
-        # Always add the plane dimensions if not present already
-        for dim in REQUIRED_CHUNK_DIMS:
-            if dim not in self.chunk_dims:
-                self.chunk_dims.append(dim)
-
-        # Safety measure / "feature"
-        self.chunk_dims = [d.upper() for d in self.chunk_dims]
-
         # Construct the delayed dask array
         dims_shape = CziReader._dims_shape_to_scene_dims_shape(
             czi.get_dims_shape(),
@@ -394,6 +439,28 @@ class CziReader(Reader):
         for remove_dim_char in [CZI_BLOCK_DIM_CHAR, CZI_SCENE_DIM_CHAR]:
             dims_str = dims_str.replace(remove_dim_char, "")
 
+        # Get pixel type and catch unsupported
+        pixel_type = PIXEL_DICT.get(czi.pixel_type)
+        if pixel_type is None:
+            raise TypeError(f"Pixel type: {czi.pixel_type} is not supported.")
+
+        # Pick the chunk dims from the subblock dimension order of this scene
+        if self._auto_chunk_dims:
+            self.chunk_dims = guess_chunk_dims(
+                dims_str,
+                [dims_shape[dim][1] for dim in dims_str],
+                np.dtype(pixel_type).itemsize,
+                access_hint=self._chunk_access_hint,
+            )
+
+        # Always add the plane dimensions if not present already
+        for dim in REQUIRED_CHUNK_DIMS:
+            if dim not in self.chunk_dims:
+                self.chunk_dims.append(dim)
+
+        # Safety measure / "feature"
+        self.chunk_dims = [d.upper() for d in self.chunk_dims]
+
         # Get the shape for the chunk and operating shape for the dask array
         # We also collect the chunk and non chunk dimension ordering so that we can
         # swap the dimensions after we
@@ -428,68 +495,33 @@ class CziReader(Reader):
             non_chunk_dimension_ordering + chunk_dimension_ordering
         )
 
-        # Fill out the rest of the operating shape with dimension sizes of 1 to match
-        # the length of the sample chunk
-        # When dask.block happens it fills the dimensions from inner-most to outer-most
-        # with the chunks as long as the dimension is size 1
-        # Basically, we are adding empty dimensions to the operating shape that will be
-        # filled by the chunks from dask
-        operating_shape_tuple = tuple(operating_shape) + (1,) * len(
-            sample_chunk_shape_tuple
-        )
-
-        # Create empty numpy array with the operating shape so that we can iter through
-        # and use the multi_index to create the readers.
-        lazy_arrays: np.ndarray = np.ndarray(operating_shape_tuple, dtype=object)
-
-        # We can enumerate over the multi-indexed array and construct read_dims
-        # dictionaries by simply zipping together the ordered dims list and the current
-        # multi-index plus the begin index for that plane. We then set the value of the
-        # array at the same multi-index to the delayed reader using the constructed
-        # read_dims dictionary.
+        # We can construct read_dims dictionaries for each block by simply zipping
+        # together the ordered dims list and the block index plus the begin index for
+        # that plane. Each block of the single graph layer then reads using the
+        # constructed read_dims dictionary.
         dims = [
             d for d in czi.dims if d not in [CZI_BLOCK_DIM_CHAR, CZI_SCENE_DIM_CHAR]
         ]
         begin_indicies = tuple(dims_shape[d][0] for d in dims)
-        for np_index, _ in np.ndenumerate(lazy_arrays):
-            # Add the czi file begin index for each dimension to the array dimension
-            # index
-            this_chunk_read_indicies = (
-                current_dim_begin_index + curr_dim_index
-                for current_dim_begin_index, curr_dim_index in zip(
-                    begin_indicies, np_index
-                )
-            )
 
-            # Zip the dims with the read indices
-            this_chunk_read_dims = dict(
-                zip(blocked_dimension_order, this_chunk_read_indicies)
-            )
-
-            # Remove the dimensions that we want to chunk by from the read dims
-            for d in self.chunk_dims:
-                this_chunk_read_dims.pop(d, None)
-
-            # Get pixel type and catch unsupported
-            pixel_type = PIXEL_DICT.get(czi.pixel_type)
-            if pixel_type is None:
-                raise TypeError(f"Pixel type: {czi.pixel_type} is not supported.")
-
-            # Add delayed array to lazy arrays at index
-            lazy_arrays[np_index] = da.from_delayed(
-                delayed(CziReader._read_chunk_from_image)(
-                    fs=self._fs,
-                    path=self._path,
-                    scene=self.current_scene_index,
-                    read_dims=this_chunk_read_dims,
-                ),
-                shape=sample_chunk_shape,
-                dtype=pixel_type,
-            )
-
-        # Convert the numpy array of lazy readers into a dask array and fill the inner
-        # most empty dimensions with chunks
-        merged = da.block(lazy_arrays.tolist())
+        # Construct a single graph layer with one read task per chunk
+        merged = dask_utils.from_block_function(
+            partial(
+                CziReader._read_chunk_for_block,
+                fs=self._fs,
+                path=self._path,
+                scene=self.current_scene_index,
+                blocked_dimension_order=blocked_dimension_order,
+                begin_indicies=begin_indicies,
+                chunk_dims=self.chunk_dims,
+            ),
+            grid_shape=operating_shape,
+            chunk_shape=sample_chunk_shape_tuple,
+            dtype=pixel_type,
+            name="czi-read",
+            cache_key=self._get_chunk_cache_key(blocked_dimension_order),
+            disk_cache=self._disk_chunk_cache,
+        )
 
         # Because we have set certain dimensions to be chunked and others not
         # we will need to transpose back to original dimension ordering
@@ -715,13 +747,58 @@ class CziReader(Reader):
             )
 
     @staticmethod
-    def _stitch_tiles(
-        data: types.ArrayLike,
+    def _get_mosaic_chunks(
+        data: da.Array,
+        data_dims: str,
+        ordered_dims_present: List[str],
+        arr_shape: List[int],
+        regions: List[Tuple[Tuple[Any, ...], Tuple[Any, ...]]],
+    ) -> List[Tuple[int, ...]]:
+        chunks: List[Tuple[int, ...]] = []
+        for dim_index, (dim, size) in enumerate(zip(ordered_dims_present, arr_shape)):
+            if dim in [DimensionNames.SpatialY, DimensionNames.SpatialX]:
+                # Split Y and X at the tile starts
+                # Stage positions are jittered so the tiles of a row or column rarely
+                # share a start, splits closer than half a tile are merged so there
+                # is about one chunk per tile row or column and no slivers
+                tile_size = max(
+                    [
+                        ans_index[dim_index].stop - ans_index[dim_index].start
+                        for _, ans_index in regions
+                    ],
+                    default=size,
+                )
+                min_chunk_size = max(tile_size // 2, 1)
+                splits = [0]
+                for start in sorted(
+                    {ans_index[dim_index].start for _, ans_index in regions}
+                ):
+                    if (
+                        start - splits[-1] >= min_chunk_size
+                        and size - start >= min_chunk_size
+                    ):
+                        splits.append(start)
+
+                chunks.append(tuple(np.diff(splits + [size]).tolist()))
+            elif dim != DimensionNames.Samples and (
+                sum(data.chunks[data_dims.index(dim)]) == size
+            ):
+                # Keep the chunking of the other dims
+                chunks.append(data.chunks[data_dims.index(dim)])
+            elif dim != DimensionNames.Samples:
+                chunks.append((1,) * size)
+            else:
+                chunks.append((size,))
+
+        return chunks
+
+    @staticmethod
+    def _get_tile_regions(
         data_dims: str,
         data_dims_shape: Dict[str, Tuple[int, int]],
         tile_bboxes: Dict[TileInfo, BBox],
         final_bbox: BBox,
-    ) -> types.ArrayLike:
+    ) -> Tuple[List[str], List[int], List[Tuple[Tuple[Any, ...], Tuple[Any, ...]]]]:
         # Assumptions: 1) docs for ZEISSRAW(CZI) say:
         #   Scene – for clustering items in X/Y direction (data belonging to
         #   contiguous regions of interests in a mosaic image).
@@ -744,15 +821,8 @@ class CziReader(Reader):
             if dim is DimensionNames.Samples:
                 arr_shape_list.append(data_dims_shape[CZI_SAMPLES_DIM_CHAR][1])
 
-        ans = None
-        if isinstance(data, da.Array):
-            ans = da.zeros(
-                shape=tuple(arr_shape_list),
-                dtype=data.dtype,
-            )
-        else:
-            ans = np.zeros(arr_shape_list, dtype=data.dtype)
-
+        # Find where each tile is read from and placed into the mosaic
+        regions = []
         for (tile_info, box) in tile_bboxes.items():
             # Construct data indexes to use
             tile_dims = tile_info.dimension_coordinates
@@ -790,8 +860,46 @@ class CziReader(Reader):
                 if dim is DimensionNames.Samples:
                     ans_indexes.append(slice(None))
 
-            # Assign the tiles into ans
-            ans[tuple(ans_indexes)] = data[tuple(data_indexes)]
+            regions.append((tuple(data_indexes), tuple(ans_indexes)))
+
+        return ordered_dims_present, arr_shape_list, regions
+
+    @staticmethod
+    def _stitch_tiles(
+        data: types.ArrayLike,
+        data_dims: str,
+        data_dims_shape: Dict[str, Tuple[int, int]],
+        tile_bboxes: Dict[TileInfo, BBox],
+        final_bbox: BBox,
+    ) -> types.ArrayLike:
+        ordered_dims_present, arr_shape_list, regions = CziReader._get_tile_regions(
+            data_dims=data_dims,
+            data_dims_shape=data_dims_shape,
+            tile_bboxes=tile_bboxes,
+            final_bbox=final_bbox,
+        )
+
+        if isinstance(data, da.Array):
+            # Build the mosaic as a single graph layer with chunks on the tile grid
+            # so that each chunk only pulls the tiles overlapping it
+            return dask_utils.paste_regions(
+                data=data,
+                shape=arr_shape_list,
+                chunks=CziReader._get_mosaic_chunks(
+                    data=data,
+                    data_dims=data_dims,
+                    ordered_dims_present=ordered_dims_present,
+                    arr_shape=arr_shape_list,
+                    regions=regions,
+                ),
+                regions=regions,
+                name="czi-mosaic",
+            )
+
+        # Assign the tiles into ans
+        ans = np.zeros(arr_shape_list, dtype=data.dtype)
+        for data_index, ans_index in regions:
+            ans[ans_index] = data[data_index]
 
         return ans
 
@@ -863,6 +971,88 @@ class CziReader(Reader):
     def _get_stitched_mosaic(self) -> xr.DataArray:
         return self._construct_mosaic_xarray(self.data)
 
+    def _get_mosaic_tile_regions(
+        self,
+    ) -> Tuple[List[str], List[int], List[Tuple[Tuple[Any, ...], Tuple[Any, ...]]]]:
+        # Read the subblock bounding boxes once per scene, these are the same
+        # regions the stitched mosaic is built from
+        if self._mosaic_tile_regions is None:
+            with self._fs.open(self._path) as open_resource:
+                czi = CziFile(open_resource.f)
+                dims_shape = CziReader._dims_shape_to_scene_dims_shape(
+                    dims_shape=czi.get_dims_shape(),
+                    scene_index=self.current_scene_index,
+                    consistent=czi.shape_is_consistent,
+                )
+
+                bboxes = czi.get_all_mosaic_tile_bounding_boxes(
+                    S=self.current_scene_index
+                )
+                mosaic_scene_bbox = czi.get_mosaic_scene_bounding_box(
+                    index=self.current_scene_index
+                )
+
+            self._mosaic_tile_regions = CziReader._get_tile_regions(
+                data_dims=self.mapped_dims,
+                data_dims_shape=dims_shape,
+                tile_bboxes=bboxes,
+                final_bbox=mosaic_scene_bbox,
+            )
+
+        return self._mosaic_tile_regions
+
+    def _reset_self(self) -> None:
+        super()._reset_self()
+        self._mosaic_tile_regions = None
+
+    def _get_mosaic_region_dask_data(self, y: slice, x: slice) -> da.Array:
+        (
+            ordered_dims_present,
+            arr_shape_list,
+            tile_regions,
+        ) = self._get_mosaic_tile_regions()
+
+        # Only place the subblocks intersecting the region
+        y_index = ordered_dims_present.index(DimensionNames.SpatialY)
+        x_index = ordered_dims_present.index(DimensionNames.SpatialX)
+        y_start, y_stop, _ = y.indices(arr_shape_list[y_index])
+        x_start, x_stop, _ = x.indices(arr_shape_list[x_index])
+        regions = [
+            (data_index, ans_index)
+            for data_index, ans_index in tile_regions
+            if ans_index[y_index].start < y_stop
+            and ans_index[y_index].stop > y_start
+            and ans_index[x_index].start < x_stop
+            and ans_index[x_index].stop > x_start
+        ]
+
+        crop = [
+            {DimensionNames.SpatialY: y, DimensionNames.SpatialX: x}.get(
+                dim, slice(None)
+            )
+            for dim in ordered_dims_present
+        ]
+        region_shape, region_regions = dask_utils.crop_regions(
+            regions=regions,
+            data_shape=self.dask_data.shape,
+            shape=arr_shape_list,
+            crop=crop,
+        )
+
+        return dask_utils.paste_regions(
+            data=self.dask_data,
+            shape=region_shape,
+            chunks=CziReader._get_mosaic_chunks(
+                data=self.dask_data,
+                data_dims=self.mapped_dims,
+                ordered_dims_present=ordered_dims_present,
+                arr_shape=region_shape,
+                regions=region_regions,
+            ),
+            regions=region_regions,
+            name="czi-mosaic-region",
+        )
+
     @property
     def ome_metadata(self) -> OME:
         return metadata_utils.transform_metadata_with_xslt(
@@ -921,10 +1111,19 @@ class CziReader(Reader):
         if DimensionNames.MosaicTile not in self.dims.order:
             raise exceptions.UnexpectedShapeError("No mosaic dimension in image.")
 
-        # Get max of mosaic positions from lif
+        top, left, _, _ = self.get_mosaic_tile_positions()[mosaic_tile_index]
+        return int(top), int(left)
+
+    def _get_mosaic_tile_positions(self) -> np.ndarray:
+        # Read every tile bounding box in a single pass
         with self._fs.open(self._path) as open_resource:
             czi = CziFile(open_resource.f)
-
             bboxes = czi.get_all_mosaic_tile_bounding_boxes(S=self.current_scene_index)
-            bbox = list(bboxes.values())[mosaic_tile_index]
-            return bbox.y, bbox.x
+
+        return np.array(
+            [
+                (bbox.y, bbox.x, bbox.h, bbox.w)
+                for bbox in list(bboxes.values())[: self.dims.M]
+            ],
+            dtype=np.int64,
+        ).reshape((-1, 4))
@@ -1,18 +1,18 @@
 #!/usr/bin/env python
 # -*- coding: utf-8 -*-
 
+from functools import partial
 from typing import Any, Dict, List, Optional, Tuple, Union
 
 import dask.array as da
 import numpy as np
 import xarray as xr
-from dask import delayed
 from fsspec.spec import AbstractFileSystem
 
 from .. import constants, exceptions, types
 from ..dimensions import DimensionNames
 from ..metadata import utils as metadata_utils
-from ..utils import io_utils
+from ..utils import dask_utils, io_utils
 from .reader import Reader
 
 try:
@@ -219,6 +219,39 @@ class DefaultReader(Reader):
             ) as reader:
                 return np.asarray(reader.get_data(index))
 
+    @staticmethod
+    def _get_image_block(
+        block_index: Tuple[int, ...],
+        fs: AbstractFileSystem,
+        path: str,
+        extension: str,
+        mode: str,
+    ) -> np.ndarray:
+        """
+        Read the plane for a single block of the (planes, *plane_shape) array.
+
+        Parameters
+        ----------
+        block_index: Tuple[int, ...]
+            The block index, the plane index followed by zeros for the plane dims.
+        fs: AbstractFileSystem
+            The file system to use for reading.
+        path: str
+            The path to file to read.
+        extension: str
+            The file extension naively indicating format to use to read the file.
+        mode: str
+            The read mode to use for opening and reading.
+
+        Returns
+        -------
+        plane: np.ndarray
+            The image plane as a numpy array.
+        """
+        return DefaultReader._get_image_data(
+            fs=fs, path=path, extension=extension, mode=mode, index=block_index[0]
+        )
+
     @staticmethod
     def _get_image_length(
         fs: AbstractFileSystem,
@@ -441,28 +474,22 @@ class DefaultReader(Reader):
                         index=0,
                     )
 
-                    # Create operating shape for the final dask array by prepending
-                    # image length to a tuple of ones that is the same length as
-                    # the sample shape
-                    operating_shape = (image_length,) + ((1,) * len(sample.shape))
-                    # Create numpy array of empty arrays for delayed get data
-                    # functions
-                    lazy_arrays: np.ndarray = np.ndarray(operating_shape, dtype=object)
-                    for indices, _ in np.ndenumerate(lazy_arrays):
-                        lazy_arrays[indices] = da.from_delayed(
-                            delayed(self._get_image_data)(
-                                fs=self._fs,
-                                path=self._path,
-                                extension=self.extension,
-                                mode=self.imageio_read_mode,
-                                index=indices[0],
-                            ),
-                            shape=sample.shape,
-                            dtype=sample.dtype,
-                        )
-
-                    # Block them into a single dask array
-                    image_data = da.block(lazy_arrays.tolist())
+                    # Construct a single graph layer with one read task per plane
+                    image_data = dask_utils.from_block_function(
+                        partial(
+                            DefaultReader._get_image_block,
+                            fs=self._fs,
+                            path=self._path,
+                            extension=self.extension,
+                            mode=self.imageio_read_mode,
+                        ),
+                        grid_shape=(image_length,),
+                        chunk_shape=sample.shape,
+                        dtype=sample.dtype,
+                        name="imageio-read",
+                        cache_key=self._get_chunk_cache_key([DimensionNames.Time]),
+                        disk_cache=self._disk_chunk_cache,
+                    )
 
                 # Catch all other image types as unsupported
                 # https://imageio.readthedocs.io/en/stable/userapi.html#imageio.core.format.Reader.get_length
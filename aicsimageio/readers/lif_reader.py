@@ -3,23 +3,25 @@
 
 import xml.etree.ElementTree as ET
 from copy import copy
+from functools import partial
 from typing import Any, Dict, Hashable, List, Optional, Tuple, Union
 
 import dask.array as da
 import numpy as np
 import xarray as xr
-from dask import delayed
 from fsspec.spec import AbstractFileSystem
 
-from .. import constants, exceptions, transforms, types
+from .. import constants, exceptions, types
 from ..dimensions import (
+    AUTO_CHUNK_DIMS,
     DEFAULT_CHUNK_DIMS,
     DEFAULT_DIMENSION_ORDER_LIST,
     DEFAULT_DIMENSION_ORDER_LIST_WITH_MOSAIC_TILES,
     REQUIRED_CHUNK_DIMS,
     DimensionNames,
+    guess_chunk_dims,
 )
-from ..utils import io_utils
+from ..utils import dask_utils, io_utils
 from .reader import Reader
 
 try:
@@ -44,7 +46,8 @@ class LifReader(Reader):
     image: types.PathLike
         Path to image file to construct Reader for.
     chunk_dims: Union[str, List[str]]
-        Which dimensions to create chunks for.
+        Which dimensions to create chunks for, or "auto" (AUTO_CHUNK_DIMS) to pick
+        them from the stored layout of each scene (see `guess_chunk_dims`).
         Default: DEFAULT_CHUNK_DIMS
         Note: Dimensions.SpatialY, Dimensions.SpatialX, and DimensionNames.Samples,
         will always be added to the list if not present during dask array
@@ -52,6 +55,11 @@ class LifReader(Reader):
     fs_kwargs: Dict[str, Any]
         Any specific keyword arguments to pass down to the fsspec created filesystem.
         Default: {}
+    chunk_access_hint: Optional[str]
+        How the image will be accessed ("plane", "stack", "timeseries", or
+        "channels"), used to pick the chunk dims when chunk_dims is "auto".
+        Default: None (chunks grow along the stored order up to the dask
+        "array.chunk-size")
 
     Notes
     -----
@@ -75,6 +83,7 @@ class LifReader(Reader):
         image: types.PathLike,
         chunk_dims: Union[str, List[str]] = DEFAULT_CHUNK_DIMS,
         fs_kwargs: Dict[str, Any] = {},
+        chunk_access_hint: Optional[str] = None,
     ):
         # Expand details of provided image
         self._fs, self._path = io_utils.pathlike_to_fs(
@@ -84,7 +93,12 @@ class LifReader(Reader):
         )
 
         # Store params
-        if isinstance(chunk_dims, str):
+        # Auto chunk dims are picked for each scene during dask array construction
+        self._auto_chunk_dims = chunk_dims == AUTO_CHUNK_DIMS
+        self._chunk_access_hint = chunk_access_hint
+        if self._auto_chunk_dims:
+            chunk_dims = []
+        elif isinstance(chunk_dims, str):
             chunk_dims = list(chunk_dims)
 
         self.chunk_dims = chunk_dims
@@ -268,14 +282,6 @@ class LifReader(Reader):
         image_data: da.Array
             The fully constructed and fully delayed image as a Dask Array object.
         """
-        # Always add the plane dimensions if not present already
-        for dim in REQUIRED_CHUNK_DIMS:
-            if dim not in self.chunk_dims:
-                self.chunk_dims.append(dim)
-
-        # Safety measure / "feature"
-        self.chunk_dims = [d.upper() for d in self.chunk_dims]
-
         # Construct the delayed dask array
         selected_scene = lif.get_image(self.current_scene_index)
         selected_scene_shape: List[int] = []
@@ -296,6 +302,23 @@ class LifReader(Reader):
         # Get sample for dtype
         sample_plane = np.asarray(selected_scene.get_frame())
 
+        # Pick the chunk dims from the dimension order of this scene
+        if self._auto_chunk_dims:
+            self.chunk_dims = guess_chunk_dims(
+                selected_scene_dims,
+                selected_scene_shape,
+                sample_plane.dtype.itemsize,
+                access_hint=self._chunk_access_hint,
+            )
+
+        # Always add the plane dimensions if not present already
+        for dim in REQUIRED_CHUNK_DIMS:
+            if dim not in self.chunk_dims:
+                self.chunk_dims.append(dim)
+
+        # Safety measure / "feature"
+        self.chunk_dims = [d.upper() for d in self.chunk_dims]
+
         # Constuct the chunk and non-chunk shapes one dim at a time
         # We also collect the chunk and non-chunk dimension order so that
         # we can swap the dimensions after we block out the array
@@ -312,37 +335,27 @@ class LifReader(Reader):
                 non_chunk_dim_order.append(dim)
                 non_chunk_shape.append(size)
 
-        # Fill out the rest of the blocked shape with dimension sizes of 1 to
-        # match the length of the sample chunk
-        # When dask.block happens it fills the dimensions from inner-most to
-        # outer-most with the chunks as long as the dimension is size 1
+        # The blocked array has every non-chunk dimension (chunked by one) followed
+        # by every chunk dimension (in a single chunk)
         blocked_dim_order = non_chunk_dim_order + chunk_dim_order
-        blocked_shape = tuple(non_chunk_shape) + ((1,) * len(chunk_shape))
-
-        # Make ndarray for lazy arrays to fill
-        lazy_arrays: np.ndarray = np.ndarray(blocked_shape, dtype=object)
-        for np_index, _ in np.ndenumerate(lazy_arrays):
-            # All dimensions get their normal index except for chunk dims
-            # which get None, which tell the get data func to pull the whole dim
-            retrieve_indices = np_index[: len(non_chunk_shape)] + (
-                (None,) * len(chunk_shape)
-            )
 
-            # Fill the numpy array with the delayed arrays
-            lazy_arrays[np_index] = da.from_delayed(
-                delayed(LifReader._get_image_data)(
-                    fs=self._fs,
-                    path=self._path,
-                    scene=self.current_scene_index,
-                    retrieve_dims=blocked_dim_order,
-                    retrieve_indices=retrieve_indices,
-                ),
-                shape=chunk_shape,
-                dtype=sample_plane.dtype,
-            )
-
-        # Convert the numpy array of lazy readers into a dask array
-        image_data = da.block(lazy_arrays.tolist())
+        # Construct a single graph layer with one read task per chunk
+        image_data = dask_utils.from_block_function(
+            partial(
+                LifReader._get_image_block,
+                fs=self._fs,
+                path=self._path,
+                scene=self.current_scene_index,
+                retrieve_dims=blocked_dim_order,
+                n_chunk_dims=len(chunk_shape),
+            ),
+            grid_shape=non_chunk_shape,
+            chunk_shape=chunk_shape,
+            dtype=sample_plane.dtype,
+            name="lif-read",
+            cache_key=self._get_chunk_cache_key(blocked_dim_order),
+            disk_cache=self._disk_chunk_cache,
+        )
 
         # Because we have set certain dimensions to be chunked and others not
         # we will need to transpose back to original dimension ordering
@@ -362,6 +375,48 @@ class LifReader(Reader):
 
         return image_data
 
+    @staticmethod
+    def _get_image_block(
+        block_index: Tuple[int, ...],
+        fs: AbstractFileSystem,
+        path: str,
+        scene: int,
+        retrieve_dims: List[str],
+        n_chunk_dims: int,
+    ) -> np.ndarray:
+        """
+        Read a single block of the blocked (non-chunk dims then chunk dims) array.
+
+        Parameters
+        ----------
+        block_index: Tuple[int, ...]
+            The index of the block along every dimension of the blocked array.
+        fs: AbstractFileSystem
+            The file system to use for reading.
+        path: str
+            The path to file to read.
+        scene: int
+            The scene index to pull the chunk from.
+        retrieve_dims: List[str]
+            The order of the retrieve indicies operations (non-chunk dims then
+            chunk dims).
+        n_chunk_dims: int
+            The number of chunk dimensions, all of which are fully retrieved.
+
+        Returns
+        -------
+        chunk: np.ndarray
+            The image chunk as a numpy array.
+        """
+        return LifReader._get_image_data(
+            fs=fs,
+            path=path,
+            scene=scene,
+            retrieve_dims=retrieve_dims,
+            retrieve_indices=list(block_index[: len(retrieve_dims) - n_chunk_dims])
+            + ([None] * n_chunk_dims),
+        )
+
     @staticmethod
     def _get_coords_and_physical_px_sizes(
         xml: ET.Element, image_short_info: Dict[str, Any], scene_index: int
@@ -544,47 +599,98 @@ class LifReader(Reader):
             )
 
     @staticmethod
-    def _stitch_tiles(
-        data: types.ArrayLike,
+    def _get_tile_regions(
         dims: str,
+        shape: Tuple[int, ...],
         ny: int,
         nx: int,
-    ) -> types.ArrayLike:
-        # Fill all tiles
-        rows: List[types.ArrayLike] = []
+    ) -> Tuple[List[int], List[Tuple[Tuple[Any, ...], Tuple[Any, ...]]]]:
+        mosaic_dims = dims.replace(DimensionNames.MosaicTile, "")
+        m_axis = dims.index(DimensionNames.MosaicTile)
+        mosaic_shape = [size for axis, size in enumerate(shape) if axis != m_axis]
+
+        # LIF image stitching has a 1 pixel overlap
+        # Every tile but the last in the row (the X dimension) drops its first pixel,
+        # every row but the last drops its first Y pixel, and the last tile (and the
+        # last row) is placed first
+        tile_y = mosaic_shape[mosaic_dims.index(DimensionNames.SpatialY)]
+        tile_x = mosaic_shape[mosaic_dims.index(DimensionNames.SpatialX)]
+        mosaic_shape[mosaic_dims.index(DimensionNames.SpatialY)] = tile_y + (ny - 1) * (
+            tile_y - 1
+        )
+        mosaic_shape[mosaic_dims.index(DimensionNames.SpatialX)] = tile_x + (nx - 1) * (
+            tile_x - 1
+        )
+
+        regions = []
         for row_i in range(ny):
-            row: List[types.ArrayLike] = []
-            for col_i in range(nx):
-                # Calc m_index
-                m_index = (row_i * nx) + col_i
-
-                # Get tile by getting all data for specific M
-                tile = transforms.reshape_data(
-                    data,
-                    given_dims=dims,
-                    return_dims=dims.replace(DimensionNames.MosaicTile, ""),
-                    M=m_index,
-                )
+            if row_i + 1 < ny:
+                y_start = tile_y + (ny - 2 - row_i) * (tile_y - 1)
+                source_y, dest_y = slice(1, None), slice(y_start, y_start + tile_y - 1)
+            else:
+                source_y, dest_y = slice(None), slice(0, tile_y)
 
-                # LIF image stitching has a 1 pixel overlap
-                # Take all pixels except the first _except_ if this is the last tile
-                # in the row (the X dimension)
+            for col_i in range(nx):
                 if col_i + 1 < nx:
-                    row.insert(0, tile[:, :, :, :, 1:])
+                    x_start = tile_x + (nx - 2 - col_i) * (tile_x - 1)
+                    source_x = slice(1, None)
+                    dest_x = slice(x_start, x_start + tile_x - 1)
                 else:
-                    row.insert(0, tile)
+                    source_x, dest_x = slice(None), slice(0, tile_x)
 
-            # Concat row and append
-            # Take all pixels except the first Y dimension pixel _except_ if this is the
-            # last row
-            np_row = np.concatenate(row, axis=-1)
-            if row_i + 1 < ny:
-                rows.insert(0, np_row[:, :, :, 1:, :])
-            else:
-                rows.insert(0, np_row)
+                source_index: List[Any] = [slice(None)] * len(dims)
+                source_index[m_axis] = (row_i * nx) + col_i
+                source_index[dims.index(DimensionNames.SpatialY)] = source_y
+                source_index[dims.index(DimensionNames.SpatialX)] = source_x
+
+                dest_index: List[Any] = [slice(None)] * len(mosaic_dims)
+                dest_index[mosaic_dims.index(DimensionNames.SpatialY)] = dest_y
+                dest_index[mosaic_dims.index(DimensionNames.SpatialX)] = dest_x
+
+                regions.append((tuple(source_index), tuple(dest_index)))
 
-        # Concatenate
-        mosaic = np.concatenate(rows, axis=-2)
+        return mosaic_shape, regions
+
+    @staticmethod
+    def _stitch_tiles(
+        data: types.ArrayLike,
+        dims: str,
+        ny: int,
+        nx: int,
+    ) -> types.ArrayLike:
+        mosaic_shape, regions = LifReader._get_tile_regions(
+            dims=dims,
+            shape=data.shape,
+            ny=ny,
+            nx=nx,
+        )
+
+        if isinstance(data, da.Array):
+            # One chunk per tile in Y and X, other dims keep their chunking
+            mosaic_chunks: List[Tuple[int, ...]] = []
+            for dim in dims.replace(DimensionNames.MosaicTile, ""):
+                dim_chunks = data.chunks[dims.index(dim)]
+                if dim == DimensionNames.SpatialY:
+                    tile_y = data.shape[dims.index(dim)]
+                    dim_chunks = (tile_y,) + (tile_y - 1,) * (ny - 1)
+                elif dim == DimensionNames.SpatialX:
+                    tile_x = data.shape[dims.index(dim)]
+                    dim_chunks = (tile_x,) + (tile_x - 1,) * (nx - 1)
+
+                mosaic_chunks.append(dim_chunks)
+
+            return dask_utils.paste_regions(
+                data=data,
+                shape=mosaic_shape,
+                chunks=mosaic_chunks,
+                regions=regions,
+                name="lif-mosaic",
+            )
+
+        # Write every tile directly into its place in the mosaic
+        mosaic = np.empty(mosaic_shape, dtype=data.dtype)
+        for source_index, dest_index in regions:
+            mosaic[dest_index] = data[source_index]
 
         return mosaic
 
@@ -647,6 +753,54 @@ class LifReader(Reader):
     def _get_stitched_mosaic(self) -> xr.DataArray:
         return self._construct_mosaic_xarray(self.data)
 
+    def _get_mosaic_region_dask_data(self, y: slice, x: slice) -> da.Array:
+        with self._fs.open(self._path) as open_resource:
+            lif = LifFile(open_resource)
+            selected_scene = lif.get_image(self.current_scene_index)
+            last_tile_position = selected_scene.info["mosaic_position"][-1]
+
+        mosaic_shape, regions = self._get_tile_regions(
+            dims=self.dims.order,
+            shape=self.dask_data.shape,
+            ny=last_tile_position[0] + 1,
+            nx=last_tile_position[1] + 1,
+        )
+
+        # Only place the tiles intersecting the region
+        mosaic_dims = self.dims.order.replace(DimensionNames.MosaicTile, "")
+        region_shape, region_regions = dask_utils.crop_regions(
+            regions=regions,
+            data_shape=self.dask_data.shape,
+            shape=mosaic_shape,
+            crop=[
+                {DimensionNames.SpatialY: y, DimensionNames.SpatialX: x}.get(
+                    dim, slice(None)
+                )
+                for dim in mosaic_dims
+            ],
+        )
+
+        # One chunk per tile in Y and X, other dims keep their chunking
+        region_chunks: List[Tuple[int, ...]] = []
+        for dim_index, (dim, size) in enumerate(zip(mosaic_dims, region_shape)):
+            if dim in [DimensionNames.SpatialY, DimensionNames.SpatialX]:
+                dim_starts = [
+                    dest_index[dim_index].start  # type: ignore
+                    for _, dest_index in region_regions
+                ]
+                starts = sorted({0} | {s for s in dim_starts if 0 < s < size})
+                region_chunks.append(tuple(np.diff(starts + [size]).tolist()))
+            else:
+                region_chunks.append(self.dask_data.chunks[self.dims.order.index(dim)])
+
+        return dask_utils.paste_regions(
+            data=self.dask_data,
+            shape=region_shape,
+            chunks=region_chunks,
+            regions=region_regions,
+            name="lif-mosaic-region",
+        )
+
     @property
     def physical_pixel_sizes(self) -> types.PhysicalPixelSizes:
         """
@@ -697,13 +851,26 @@ class LifReader(Reader):
         if DimensionNames.MosaicTile not in self.dims.order:
             raise exceptions.UnexpectedShapeError("No mosaic dimension in image.")
 
-        # LIFs are packed from bottom right to top left
-        # To counter: subtract 1 + M from list index to get from back of list
-        index_y, index_x, _, _ = self._scene_short_info["mosaic_position"][
-            -(mosaic_tile_index + 1)
-        ]
+        top, left, _, _ = self.get_mosaic_tile_positions()[mosaic_tile_index]
+        return int(top), int(left)
 
-        return (
-            (index_y * self.dims.Y) - index_y,
-            (index_x * self.dims.X) - index_x,
-        )
+    def _get_mosaic_tile_positions(self) -> np.ndarray:
+        # LIFs are packed from bottom right to top left
+        # To counter: reverse the list of mosaic positions
+        mosaic_positions = np.array(
+            [
+                (index_y, index_x)
+                for index_y, index_x, _, _ in self._scene_short_info["mosaic_position"][
+                    ::-1
+                ]
+            ],
+            dtype=np.int64,
+        ).reshape((-1, 2))[: self.dims.M]
+
+        # LIF image stitching has a 1 pixel overlap
+        positions = np.empty((len(mosaic_positions), 4), dtype=np.int64)
+        positions[:, 0] = mosaic_positions[:, 0] * (self.dims.Y - 1)
+        positions[:, 1] = mosaic_positions[:, 1] * (self.dims.X - 1)
+        positions[:, 2] = self.dims.Y
+        positions[:, 3] = self.dims.X
+        return positions
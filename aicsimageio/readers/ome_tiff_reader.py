@@ -15,10 +15,16 @@ from tifffile.tifffile import TiffFile, TiffFileError, TiffTags
 from xmlschema import XMLSchemaValidationError
 
 from .. import constants, exceptions, transforms, types
-from ..dimensions import DEFAULT_CHUNK_DIMS, DEFAULT_DIMENSION_ORDER, DimensionNames
+from ..dimensions import (
+    AUTO_CHUNK_DIMS,
+    DEFAULT_CHUNK_DIMS,
+    DEFAULT_DIMENSION_ORDER,
+    DimensionNames,
+)
 from ..metadata import utils as metadata_utils
 from ..types import PhysicalPixelSizes
 from ..utils import io_utils
+from .reader import Reader
 from .tiff_reader import TiffReader
 
 ###############################################################################
@@ -37,8 +43,9 @@ class OmeTiffReader(TiffReader):
     ----------
     image: types.PathLike
         Path to image file to construct Reader for.
-    chunk_dims: List[str]
-        Which dimensions to create chunks for.
+    chunk_dims: Union[str, List[str]]
+        Which dimensions to create chunks for, or "auto" (AUTO_CHUNK_DIMS) to pick
+        them from the stored layout of each scene (see `guess_chunk_dims`).
         Default: DEFAULT_CHUNK_DIMS
         Note: Dimensions.SpatialY, Dimensions.SpatialX, and DimensionNames.Samples,
         will always be added to the list if not present during dask array
@@ -50,6 +57,17 @@ class OmeTiffReader(TiffReader):
     fs_kwargs: Dict[str, Any]
         Any specific keyword arguments to pass down to the fsspec created filesystem.
         Default: {}
+    chunk_access_hint: Optional[str]
+        How the image will be accessed ("plane", "stack", "timeseries", or
+        "channels"), used to pick the chunk dims when chunk_dims is "auto".
+        Default: None (chunks grow along the stored order up to the dask
+        "array.chunk-size")
+    tile_chunk_bytes: Optional[int]
+        The planes of tiled images with chunks larger than this number of bytes are
+        chunked along Y and X into blocks of whole tiles no larger than this (unless
+        a single tile is larger), i.e. 2**20. Reads of Y and X regions then only
+        decode the intersecting tiles.
+        Default: None (Y and X are read in whole planes)
 
     Notes
     -----
@@ -118,6 +136,8 @@ class OmeTiffReader(TiffReader):
         chunk_dims: Union[str, List[str]] = DEFAULT_CHUNK_DIMS,
         clean_metadata: bool = True,
         fs_kwargs: Dict[str, Any] = {},
+        chunk_access_hint: Optional[str] = None,
+        tile_chunk_bytes: Optional[int] = None,
         **kwargs: Any,
     ):
         # Expand details of provided image
@@ -128,7 +148,13 @@ class OmeTiffReader(TiffReader):
         )
 
         # Store params
-        if isinstance(chunk_dims, str):
+        # Auto chunk dims are picked for each scene during dask array construction
+        self._auto_chunk_dims = chunk_dims == AUTO_CHUNK_DIMS
+        self._chunk_access_hint = chunk_access_hint
+        self._tile_chunk_bytes = tile_chunk_bytes
+        if self._auto_chunk_dims:
+            chunk_dims = []
+        elif isinstance(chunk_dims, str):
             chunk_dims = list(chunk_dims)
 
         self.chunk_dims = chunk_dims
@@ -240,6 +266,10 @@ class OmeTiffReader(TiffReader):
         # Reset dims after transform
         dims = [d for d in out_order]
 
+        # Lower resolution levels have fewer, larger, Y and X pixels
+        if self.current_resolution_level != 0:
+            coords = self._get_resolution_level_coords(image_data, dims, coords)
+
         return xr.DataArray(
             image_data,
             dims=dims,
@@ -250,6 +280,27 @@ class OmeTiffReader(TiffReader):
             },
         )
 
+    def _get_resolution_level_coords(
+        self,
+        image_data: types.ArrayLike,
+        dims: List[str],
+        coords: Dict[str, Union[List[Any], types.ArrayLike]],
+    ) -> Dict[str, Union[List[Any], types.ArrayLike]]:
+        # Regenerate the Y and X coordinate planes for the current resolution level
+        sizes = metadata_utils.physical_pixel_sizes(self._ome, self.current_scene_index)
+        y_scale, x_scale = self._get_resolution_level_scale()
+        level_coords = dict(coords)
+        for dim, size, scale in (
+            (DimensionNames.SpatialY, sizes.Y, y_scale),
+            (DimensionNames.SpatialX, sizes.X, x_scale),
+        ):
+            if dim in level_coords and size is not None:
+                level_coords[dim] = Reader._generate_coord_array(
+                    0, image_data.shape[dims.index(dim)], size * scale
+                )
+
+        return level_coords
+
     def _read_delayed(self) -> xr.DataArray:
         """
         Construct the delayed xarray DataArray object for the image.
@@ -320,7 +371,7 @@ class OmeTiffReader(TiffReader):
                 )
 
                 # Read image into memory
-                image_data = tiff.series[self.current_scene_index].asarray()
+                image_data = self._get_resolution_level_series(tiff).asarray()
 
                 return self._general_data_array_constructor(
                     image_data,
@@ -346,7 +397,19 @@ class OmeTiffReader(TiffReader):
         -----
         We currently do not handle unit attachment to these values. Please see the file
         metadata for unit information.
+
+        The Y and X sizes of lower resolution levels are scaled by the downsampling
+        factor of the level.
         """
-        return metadata_utils.physical_pixel_sizes(
+        sizes = metadata_utils.physical_pixel_sizes(
             self.metadata, self.current_scene_index
         )
+        if self.current_resolution_level == 0:
+            return sizes
+
+        y_scale, x_scale = self._get_resolution_level_scale()
+        return PhysicalPixelSizes(
+            sizes.Z,
+            sizes.Y * y_scale if sizes.Y is not None else None,
+            sizes.X * x_scale if sizes.X is not None else None,
+        )
@@ -0,0 +1,422 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+from typing import Any, Dict, List, Optional, Tuple, Union
+
+import dask.array as da
+import numpy as np
+import xarray as xr
+import zarr
+from fsspec.spec import AbstractFileSystem
+from ome_types import from_xml
+from ome_types.model.ome import OME
+
+from .. import constants, exceptions, types
+from ..dimensions import DEFAULT_DIMENSION_ORDER, DimensionNames
+from ..metadata import utils as metadata_utils
+from ..types import PhysicalPixelSizes
+from ..utils import io_utils
+from .reader import Reader
+
+###############################################################################
+
+# The conversion factors from NGFF spatial units to microns
+NGFF_SPACE_UNITS_TO_MICRONS = {
+    "angstrom": 1e-4,
+    "nanometer": 1e-3,
+    "micrometer": 1.0,
+    "millimeter": 1e3,
+    "centimeter": 1e4,
+    "meter": 1e6,
+}
+
+###############################################################################
+
+
+class OmeZarrReader(Reader):
+    """
+    Wraps the zarr API to provide the same aicsimageio Reader API but for OME-Zarr
+    (OME-NGFF) stores.
+
+    Parameters
+    ----------
+    image: types.PathLike
+        Path to the root group of the OME-Zarr store.
+    fs_kwargs: Dict[str, Any]
+        Any specific keyword arguments to pass down to the fsspec created filesystem.
+        Default: {}
+
+    Raises
+    ------
+    exceptions.UnsupportedFileFormatError
+        The store doesn't contain NGFF multiscales images.
+
+    Notes
+    -----
+    Every NGFF multiscales image is a scene. Stores with the bioformats2raw layout
+    have a scene for each image of their series. The datasets of a multiscales image
+    are its resolution levels.
+
+    The delayed arrays are constructed directly from the chunk grid of the stored
+    arrays, i.e. every dask chunk is a single stored zarr chunk.
+    """
+
+    @staticmethod
+    def _open_root(fs: AbstractFileSystem, path: str) -> zarr.Group:
+        return zarr.open_group(zarr.storage.FSStore(path, fs=fs, mode="r"), mode="r")
+
+    @staticmethod
+    def _get_image_groups(root: zarr.Group) -> List[Tuple[str, int]]:
+        # A single image (or multiple images) described at the root group
+        if "multiscales" in root.attrs:
+            return [("", index) for index in range(len(root.attrs["multiscales"]))]
+
+        if "bioformats2raw.layout" not in root.attrs:
+            return []
+
+        # The series are listed by the OME group or are the consecutive numbered groups
+        if (
+            metadata_utils.OME_GROUP in root
+            and "series" in root[metadata_utils.OME_GROUP].attrs
+        ):
+            series = list(root[metadata_utils.OME_GROUP].attrs["series"])
+        else:
+            series = []
+            while str(len(series)) in root:
+                series.append(str(len(series)))
+
+        return [
+            (group_path, index)
+            for group_path in series
+            for index in range(len(root[group_path].attrs.get("multiscales", [])))
+        ]
+
+    @staticmethod
+    def _is_supported_image(fs: AbstractFileSystem, path: str, **kwargs: Any) -> bool:
+        try:
+            root = OmeZarrReader._open_root(fs, path)
+            return len(OmeZarrReader._get_image_groups(root)) > 0
+
+        except (ValueError, KeyError, TypeError):
+            return False
+
+    def __init__(self, image: types.PathLike, fs_kwargs: Dict[str, Any] = {}):
+        # Expand details of provided image
+        self._fs, self._path = io_utils.pathlike_to_fs(
+            image,
+            enforce_exists=True,
+            fs_kwargs=fs_kwargs,
+        )
+
+        # Validate the store and find its images
+        try:
+            self._root = self._open_root(self._fs, self._path)
+            self._image_groups = self._get_image_groups(self._root)
+        except (ValueError, KeyError, TypeError):
+            self._image_groups = []
+
+        if len(self._image_groups) == 0:
+            raise exceptions.UnsupportedFileFormatError(
+                self.__class__.__name__, self._path
+            )
+
+        self._ome: Optional[OME] = None
+
+    def _get_multiscales(self, scene_index: int) -> Tuple[zarr.Group, Dict[str, Any]]:
+        group_path, multiscales_index = self._image_groups[scene_index]
+        group = self._root[group_path] if group_path else self._root
+        return group, group.attrs["multiscales"][multiscales_index]
+
+    @property
+    def scenes(self) -> Tuple[str, ...]:
+        if self._scenes is None:
+            names = [
+                self._get_multiscales(scene_index)[1].get("name")
+                for scene_index in range(len(self._image_groups))
+            ]
+
+            # Fall back to generated ids when the images aren't uniquely named
+            if None in names or len(set(names)) != len(names):
+                names = [
+                    metadata_utils.generate_ome_image_id(scene_index)
+                    for scene_index in range(len(self._image_groups))
+                ]
+
+            self._scenes = tuple(str(name) for name in names)
+
+        return self._scenes
+
+    @property
+    def resolution_levels(self) -> Tuple[int, ...]:
+        """
+        Returns
+        -------
+        resolution_levels: Tuple[int, ...]
+            A tuple of valid resolution level indices for the current scene, one for
+            each dataset of the NGFF multiscales image.
+        """
+        _, multiscales = self._get_multiscales(self.current_scene_index)
+        return tuple(range(len(multiscales["datasets"])))
+
+    @staticmethod
+    def _get_dims(multiscales: Dict[str, Any]) -> List[str]:
+        axes = multiscales.get("axes")
+
+        # Axes were introduced in NGFF 0.3, earlier images are always TCZYX
+        if axes is None:
+            return list(DEFAULT_DIMENSION_ORDER)
+
+        return [
+            (axis["name"] if isinstance(axis, dict) else axis).upper() for axis in axes
+        ]
+
+    @staticmethod
+    def _get_scale(multiscales: Dict[str, Any], resolution_level: int) -> List[float]:
+        n_dims = len(OmeZarrReader._get_dims(multiscales))
+        scale = [1.0] * n_dims
+
+        # Dataset scales are further scaled by any multiscales wide scale
+        for transformations in [
+            multiscales["datasets"][resolution_level].get(
+                "coordinateTransformations", []
+            ),
+            multiscales.get("coordinateTransformations", []),
+        ]:
+            for transformation in transformations:
+                if transformation.get("type") == "scale":
+                    scale = [
+                        current * float(dim_scale)
+                        for current, dim_scale in zip(scale, transformation["scale"])
+                    ]
+
+        # Convert spatial scales to microns
+        axes = multiscales.get("axes") or []
+        for dim_index, axis in enumerate(axes):
+            if isinstance(axis, dict) and axis.get("type") == "space":
+                scale[dim_index] *= NGFF_SPACE_UNITS_TO_MICRONS.get(
+                    axis.get("unit", "micrometer"), 1.0
+                )
+
+        return scale
+
+    @staticmethod
+    def _get_physical_pixel_sizes(
+        multiscales: Dict[str, Any], resolution_level: int
+    ) -> PhysicalPixelSizes:
+        dims = OmeZarrReader._get_dims(multiscales)
+        scale = OmeZarrReader._get_scale(multiscales, resolution_level)
+
+        return PhysicalPixelSizes(
+            *[
+                scale[dims.index(dim)] if dim in dims else None
+                for dim in [
+                    DimensionNames.SpatialZ,
+                    DimensionNames.SpatialY,
+                    DimensionNames.SpatialX,
+                ]
+            ]
+        )
+
+    def _get_channel_names(
+        self, group: zarr.Group, n_channels: int, scene_index: int
+    ) -> List[str]:
+        channels = group.attrs.get("omero", {}).get("channels", [])
+        labels = [channel.get("label") for channel in channels]
+        if len(labels) == n_channels and None not in labels:
+            return labels
+
+        # Generate channel names when the omero metadata doesn't describe them
+        image_id = metadata_utils.generate_ome_image_id(scene_index)
+        return [
+            metadata_utils.generate_ome_channel_id(image_id, channel_index)
+            for channel_index in range(n_channels)
+        ]
+
+    def _get_coords(
+        self,
+        dims: List[str],
+        shape: Tuple[int, ...],
+        scale: List[float],
+        channel_names: Optional[List[str]],
+    ) -> Dict[str, Union[List[Any], np.ndarray]]:
+        coords: Dict[str, Union[List[Any], np.ndarray]] = {}
+
+        if channel_names is not None:
+            coords[DimensionNames.Channel] = channel_names
+
+        # Time is only given coords when the time scale is known
+        if DimensionNames.Time in dims:
+            t_index = dims.index(DimensionNames.Time)
+            if scale[t_index] != 1.0:
+                coords[DimensionNames.Time] = Reader._generate_coord_array(
+                    0, shape[t_index], scale[t_index]
+                )
+
+        for dim in [
+            DimensionNames.SpatialZ,
+            DimensionNames.SpatialY,
+            DimensionNames.SpatialX,
+        ]:
+            if dim in dims:
+                dim_index = dims.index(dim)
+                coords[dim] = Reader._generate_coord_array(
+                    0, shape[dim_index], scale[dim_index]
+                )
+
+        return coords
+
+    def _read(self, delayed: bool) -> xr.DataArray:
+        group, multiscales = self._get_multiscales(self.current_scene_index)
+        dataset = multiscales["datasets"][self.current_resolution_level]
+        array = group[dataset["path"]]
+
+        # Every dask chunk is a single stored chunk
+        image_data = da.from_zarr(array) if delayed else array[...]
+
+        dims = self._get_dims(multiscales)
+        channel_names = None
+        if DimensionNames.Channel in dims:
+            channel_names = self._get_channel_names(
+                group,
+                array.shape[dims.index(DimensionNames.Channel)],
+                self.current_scene_index,
+            )
+
+        return xr.DataArray(
+            image_data,
+            dims=dims,
+            coords=self._get_coords(
+                dims,
+                array.shape,
+                self._get_scale(multiscales, self.current_resolution_level),
+                channel_names,
+            ),
+            attrs={constants.METADATA_UNPROCESSED: group.attrs.asdict()},
+        )
+
+    def _read_delayed(self) -> xr.DataArray:
+        """
+        Construct the delayed xarray DataArray object for the image.
+
+        Returns
+        -------
+        image: xr.DataArray
+            The fully constructed and fully delayed image as a DataArray object.
+            Metadata is attached in some cases as coords, dims, and attrs.
+        """
+        return self._read(delayed=True)
+
+    def _read_immediate(self) -> xr.DataArray:
+        """
+        Construct the in-memory xarray DataArray object for the image.
+
+        Returns
+        -------
+        image: xr.DataArray
+            The fully constructed and fully read into memory image as a DataArray.
+            Metadata is attached in some cases as coords, dims, and attrs.
+        """
+        return self._read(delayed=False)
+
+    @property
+    def physical_pixel_sizes(self) -> PhysicalPixelSizes:
+        """
+        Returns
+        -------
+        sizes: PhysicalPixelSizes
+            Using available metadata, the floats representing physical pixel sizes for
+            dimensions Z, Y, and X.
+
+        Notes
+        -----
+        NGFF spatial units are converted to microns. The sizes of lower resolution
+        levels are the scale of the level's dataset.
+        """
+        _, multiscales = self._get_multiscales(self.current_scene_index)
+        return self._get_physical_pixel_sizes(
+            multiscales, self.current_resolution_level
+        )
+
+    @property
+    def ome_metadata(self) -> OME:
+        """
+        Returns
+        -------
+        metadata: OME
+            The OME-XML metadata of a bioformats2raw layout store, or the NGFF
+            metadata of every image transformed into the OME specification.
+
+        Raises
+        ------
+        exceptions.InvalidDimensionOrderingError
+            The NGFF axes of an image can't be described by OME metadata.
+        """
+        if self._ome is None:
+            store = self._root.store
+            if (
+                "bioformats2raw.layout" in self._root.attrs
+                and metadata_utils.OME_METADATA_KEY in store
+            ):
+                self._ome = from_xml(store[metadata_utils.OME_METADATA_KEY].decode())
+            else:
+                self._ome = self._build_ome()
+
+        return self._ome
+
+    def _build_ome(self) -> OME:
+        shapes: List[Tuple[int, ...]] = []
+        dtypes: List[np.dtype] = []
+        dim_orders: List[Optional[str]] = []
+        channel_names: List[Optional[List[str]]] = []
+        channel_colors: List[Optional[List[List[int]]]] = []
+        pps: List[PhysicalPixelSizes] = []
+        for scene_index in range(len(self._image_groups)):
+            group, multiscales = self._get_multiscales(scene_index)
+            array = group[multiscales["datasets"][0]["path"]]
+            dims = self._get_dims(multiscales)
+
+            shapes.append(array.shape)
+            dtypes.append(array.dtype)
+            dim_orders.append("".join(dims))
+            pps.append(self._get_physical_pixel_sizes(multiscales, 0))
+
+            # Channel metadata is only available with a channel dimension
+            if DimensionNames.Channel not in dims:
+                channel_names.append(None)
+                channel_colors.append(None)
+                continue
+
+            n_channels = array.shape[dims.index(DimensionNames.Channel)]
+            channel_names.append(
+                self._get_channel_names(group, n_channels, scene_index)
+            )
+            colors = [
+                channel.get("color")
+                for channel in group.attrs.get("omero", {}).get("channels", [])
+            ]
+            if len(colors) == n_channels and None not in colors:
+                channel_colors.append(
+                    [
+                        [int(color[i : i + 2], 16) for i in range(0, 6, 2)]
+                        for color in colors
+                    ]
+                )
+            else:
+                channel_colors.append(None)
+
+        ome = metadata_utils.build_ome(
+            shapes,
+            dtypes,
+            dimension_order=dim_orders,
+            channel_names=channel_names,
+            image_name=list(self.scenes),
+            physical_pixel_sizes=pps,
+            channel_colors=channel_colors,
+        )
+
+        # The pixels are stored in the zarr arrays, not in TIFF IFDs
+        for image in ome.images:
+            image.pixels.tiff_data_blocks = []
+            image.pixels.metadata_only = True
+
+        return ome
@@ -1,13 +1,25 @@
 #!/usr/bin/env python
 # -*- coding: utf-8 -*-
 
+import tempfile
 from abc import ABC, abstractmethod
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Tuple, Union
+from typing import (
+    Any,
+    Dict,
+    Hashable,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    Union,
+    cast,
+)
 
 import dask.array as da
 import numpy as np
 import xarray as xr
+import zarr
 from fsspec.spec import AbstractFileSystem
 from ome_types import OME
 
@@ -16,6 +28,36 @@ from ..dimensions import DEFAULT_DIMENSION_ORDER, DimensionNames, Dimensions
 from ..image_container import ImageContainer
 from ..types import PhysicalPixelSizes
 from ..utils import io_utils
+from ..utils.chunk_cache import CHUNK_CACHE, get_chunk_cache_key
+from ..utils.disk_chunk_cache import (
+    DEFAULT_DISK_CHUNK_CACHE_MAX_BYTES,
+    DiskChunkCache,
+)
+from ..utils.scene_cache import (
+    DEFAULT_MAX_CACHED_SCENES,
+    DEFAULT_MAX_IN_MEMORY_CACHED_SCENES,
+    SceneCache,
+)
+
+###############################################################################
+
+# The per-scene attributes reset on scene change and stored in the scene cache
+SCENE_STATE_ATTRS = (
+    "_xarray_dask_data",
+    "_xarray_data",
+    "_mosaic_xarray_dask_data",
+    "_mosaic_xarray_data",
+    "_dims",
+    "_metadata",
+    "_mosaic_tile_positions",
+    "_resolution_levels",
+)
+
+# The in-memory per-scene attributes and the attributes derived from them
+SCENE_IN_MEMORY_ATTRS = {
+    "_xarray_data": ("_xarray_dask_data",),
+    "_mosaic_xarray_data": (),
+}
 
 ###############################################################################
 
@@ -45,8 +87,13 @@ class Reader(ImageContainer, ABC):
     _mosaic_xarray_data: Optional[xr.DataArray] = None
     _dims: Optional[Dimensions] = None
     _metadata: Optional[Any] = None
+    _mosaic_tile_positions: Optional[np.ndarray] = None
+    _resolution_levels: Optional[Tuple[int, ...]] = None
     _scenes: Optional[Tuple[str, ...]] = None
     _current_scene_index: int = 0
+    _current_resolution_level: int = 0
+    _disk_chunk_cache: Optional[DiskChunkCache] = None
+    _scene_cache: Optional[SceneCache] = None
     # Do not default because they aren't used by all readers
     _fs: AbstractFileSystem
     _path: str
@@ -202,6 +249,119 @@ class Reader(ImageContainer, ABC):
         self._mosaic_xarray_data = None
         self._dims = None
         self._metadata = None
+        self._mosaic_tile_positions = None
+
+    def set_disk_chunk_cache(
+        self,
+        directory: Optional[types.PathLike],
+        max_bytes: int = DEFAULT_DISK_CHUNK_CACHE_MAX_BYTES,
+    ) -> None:
+        """
+        Set (or unset) the persistent on-disk cache that decoded chunks are read
+        through. Useful for repeatedly reading the same remote images across processes.
+
+        Parameters
+        ----------
+        directory: Optional[types.PathLike]
+            The directory to store cached chunks in. The same directory can be shared
+            by many images and processes.
+            Use None to stop using an on-disk cache.
+        max_bytes: int
+            The maximum total number of bytes of chunk files to keep on disk.
+            Default: DEFAULT_DISK_CHUNK_CACHE_MAX_BYTES (10 GiB)
+
+        Notes
+        -----
+        Only readers that construct their delayed arrays plane-wise (i.e. TIFF,
+        OME-TIFF, CZI, LIF, and imageio based readers) make use of the cache.
+        """
+        if directory is None:
+            self._disk_chunk_cache = None
+        else:
+            self._disk_chunk_cache = DiskChunkCache(directory, max_bytes=max_bytes)
+
+        # Delayed arrays were constructed with the prior cache
+        self._reset_self()
+        self._get_scene_cache().clear()
+
+    def _get_chunk_cache_key(
+        self,
+        chunk_layout: Sequence[str],
+        signature: Optional[Tuple[Hashable, ...]] = None,
+        resolution_level: int = 0,
+    ) -> Optional[Tuple[Hashable, ...]]:
+        """
+        Construct the chunk cache key for the current scene, or None when neither the
+        process-wide CHUNK_CACHE nor an on-disk chunk cache is in use. This avoids
+        retrieving the resource signature for every constructed delayed array when
+        chunks can't be cached.
+
+        See `aicsimageio.utils.chunk_cache.get_chunk_cache_key` for parameters.
+        """
+        if not CHUNK_CACHE.enabled and self._disk_chunk_cache is None:
+            return None
+
+        return get_chunk_cache_key(
+            self.__class__.__name__,
+            self._fs,
+            self._path,
+            self.current_scene_index,
+            chunk_layout,
+            signature=signature,
+            resolution_level=resolution_level,
+        )
+
+    def _get_scene_cache(self) -> SceneCache:
+        if self._scene_cache is None:
+            self._scene_cache = SceneCache(SCENE_IN_MEMORY_ATTRS)
+
+        return self._scene_cache
+
+    def set_scene_cache_size(
+        self,
+        max_scenes: int = DEFAULT_MAX_CACHED_SCENES,
+        max_in_memory_scenes: int = DEFAULT_MAX_IN_MEMORY_CACHED_SCENES,
+    ) -> None:
+        """
+        Set how many previously used scenes keep their constructed data and metadata
+        so that switching back to them with `set_scene` doesn't rebuild them.
+
+        Parameters
+        ----------
+        max_scenes: int
+            The maximum number of previously used scenes to keep the delayed arrays,
+            dims, and metadata of.
+            Default: DEFAULT_MAX_CACHED_SCENES (8)
+        max_in_memory_scenes: int
+            The maximum number of previously used scenes to keep fully read
+            (in-memory) data for.
+            Default: DEFAULT_MAX_IN_MEMORY_CACHED_SCENES (0, only the current scene's
+            in-memory data is kept)
+        """
+        self._get_scene_cache().resize(max_scenes, max_in_memory_scenes)
+
+    def _switch_scene(self, scene_index: int) -> None:
+        # Store the state of the current scene for later
+        # Only full resolution state is cached as scenes are always set at level 0
+        scene_cache = self._get_scene_cache()
+        if self._current_resolution_level == 0:
+            scene_cache.store(
+                self._current_scene_index,
+                {attr: getattr(self, attr) for attr in SCENE_STATE_ATTRS},
+            )
+
+        # Update current scene
+        self._current_scene_index = scene_index
+        self._current_resolution_level = 0
+
+        # Reset self for future read and restore any previously constructed state
+        # The resolution levels are shared by every level so only reset with the scene
+        self._reset_self()
+        self._resolution_levels = None
+        state = scene_cache.pop(scene_index)
+        if state is not None:
+            for attr, value in state.items():
+                setattr(self, attr, value)
 
     def set_scene(self, scene_id: Union[str, int]) -> None:
         """
@@ -232,11 +392,8 @@ class Reader(ImageContainer, ABC):
                         f"is not present in available image scenes: {self.scenes}"
                     )
 
-                # Update current scene
-                self._current_scene_index = self.scenes.index(scene_id)
-
-                # Reset self for future read
-                self._reset_self()
+                # Update current scene and reset self for future read
+                self._switch_scene(self.scenes.index(scene_id))
 
         # Handle index
         elif isinstance(scene_id, int):
@@ -251,11 +408,8 @@ class Reader(ImageContainer, ABC):
                         f"present in the file."
                     )
 
-                # Update current scene
-                self._current_scene_index = scene_id
-
-                # Reset set for future read
-                self._reset_self()
+                # Update current scene and reset self for future read
+                self._switch_scene(scene_id)
 
         else:
             raise TypeError(
@@ -263,6 +417,65 @@ class Reader(ImageContainer, ABC):
                 f"or integer (for scene index). Provided: {scene_id} ({type(scene_id)}."
             )
 
+    @property
+    def resolution_levels(self) -> Tuple[int, ...]:
+        """
+        Returns
+        -------
+        resolution_levels: Tuple[int, ...]
+            A tuple of valid resolution level indices for the current scene, where
+            level 0 is the full resolution image and each following level is a
+            further downsampled version of it.
+
+        Notes
+        -----
+        Readers for formats without multi-resolution pyramids only have level 0.
+        """
+        return (0,)
+
+    @property
+    def current_resolution_level(self) -> int:
+        """
+        Returns
+        -------
+        resolution_level: int
+            The current operating resolution level of the current scene.
+        """
+        return self._current_resolution_level
+
+    def set_resolution_level(self, resolution_level: int) -> None:
+        """
+        Set the operating resolution level of the current scene.
+
+        Parameters
+        ----------
+        resolution_level: int
+            The resolution level index to set as the operating level.
+
+        Raises
+        ------
+        IndexError
+            The provided level is not found in the available resolution levels.
+
+        Notes
+        -----
+        Setting a different scene resets the operating resolution level to 0.
+        """
+        # Only need to run when the level is different from current level
+        if resolution_level != self.current_resolution_level:
+
+            # Validate level
+            if resolution_level not in self.resolution_levels:
+                raise IndexError(
+                    f"Resolution level: {resolution_level} "
+                    f"is not present in available resolution levels: "
+                    f"{self.resolution_levels}"
+                )
+
+            # Update current level and reset self for future read
+            self._current_resolution_level = resolution_level
+            self._reset_self()
+
     @abstractmethod
     def _read_delayed(self) -> xr.DataArray:
         """
@@ -496,10 +709,246 @@ class Reader(ImageContainer, ABC):
 
         Notes
         -----
-        Very large images should use `mosaic_dask_data` to avoid seg-faults.
+        Very large images should use `mosaic_dask_data` or `stitch_mosaic` (to stitch
+        into an on-disk array) to avoid seg-faults.
         """
         return self.mosaic_xarray_data.data
 
+    def _get_mosaic_region_dask_data(self, y: slice, x: slice) -> da.Array:
+        """
+        Construct the delayed Y and X region of the stitched mosaic image.
+
+        Parameters
+        ----------
+        y: slice
+            The Y pixel range of the stitched mosaic to return.
+        x: slice
+            The X pixel range of the stitched mosaic to return.
+
+        Returns
+        -------
+        region: da.Array
+            The delayed region with the stitched mosaic dimension ordering.
+
+        Notes
+        -----
+        Readers that know the position of each tile can override this to only
+        construct the tiles intersecting the region instead of slicing the full
+        stitched mosaic.
+        """
+        return self.mosaic_xarray_dask_data.isel(
+            {DimensionNames.SpatialY: y, DimensionNames.SpatialX: x}
+        ).data
+
+    def get_mosaic_region_dask_data(
+        self,
+        x: int,
+        y: int,
+        w: int,
+        h: int,
+        dimension_order_out: Optional[str] = None,
+        **kwargs: Any,
+    ) -> da.Array:
+        """
+        Get a Y and X region of the stitched mosaic image as a dask array, only
+        reading the tiles that intersect the region.
+
+        Parameters
+        ----------
+        x: int
+            The left X pixel of the region in the stitched mosaic.
+        y: int
+            The top Y pixel of the region in the stitched mosaic.
+        w: int
+            The width of the region. Clipped to the stitched mosaic.
+        h: int
+            The height of the region. Clipped to the stitched mosaic.
+        dimension_order_out: Optional[str]
+            A string containing the dimension ordering desired for the returned array.
+            Default: The stitched mosaic dimension order.
+        kwargs: Any
+            The selections of the other dimensions (i.e. `C=1` or `T=range(3)`).
+            See `get_image_dask_data` for more details.
+
+        Returns
+        -------
+        region: da.Array
+            The region with the specified dimension ordering.
+
+        Raises
+        ------
+        UnexpectedShapeError
+            The image has no mosaic dimension available.
+        ValueError
+            The region has a negative position or no area.
+        """
+        if DimensionNames.MosaicTile not in self.dims.order:
+            raise exceptions.UnexpectedShapeError("No mosaic dimension in image.")
+        if x < 0 or y < 0 or w <= 0 or h <= 0:
+            raise ValueError(
+                f"Mosaic region must have a non-negative position and a positive "
+                f"size (x: {x}, y: {y}, w: {w}, h: {h})."
+            )
+
+        mosaic_dims = self.dims.order.replace(DimensionNames.MosaicTile, "")
+        if self._mosaic_xarray_data is not None:
+            region = da.from_array(
+                self._mosaic_xarray_data.isel(
+                    {
+                        DimensionNames.SpatialY: slice(y, y + h),
+                        DimensionNames.SpatialX: slice(x, x + w),
+                    }
+                ).data
+            )
+        else:
+            region = self._get_mosaic_region_dask_data(
+                y=slice(y, y + h), x=slice(x, x + w)
+            )
+
+        return cast(
+            da.Array,
+            transforms.reshape_data(
+                data=region,
+                given_dims=mosaic_dims,
+                return_dims=dimension_order_out or mosaic_dims,
+                **kwargs,
+            ),
+        )
+
+    def get_mosaic_region(
+        self,
+        x: int,
+        y: int,
+        w: int,
+        h: int,
+        dimension_order_out: Optional[str] = None,
+        **kwargs: Any,
+    ) -> np.ndarray:
+        """
+        Get a Y and X region of the stitched mosaic image as a numpy array, only
+        reading the tiles that intersect the region.
+
+        Parameters
+        ----------
+        x: int
+            The left X pixel of the region in the stitched mosaic.
+        y: int
+            The top Y pixel of the region in the stitched mosaic.
+        w: int
+            The width of the region. Clipped to the stitched mosaic.
+        h: int
+            The height of the region. Clipped to the stitched mosaic.
+        dimension_order_out: Optional[str]
+            A string containing the dimension ordering desired for the returned array.
+            Default: The stitched mosaic dimension order.
+        kwargs: Any
+            The selections of the other dimensions (i.e. `C=1` or `T=range(3)`).
+            See `get_image_data` for more details.
+
+        Returns
+        -------
+        region: np.ndarray
+            The region with the specified dimension ordering.
+
+        Raises
+        ------
+        UnexpectedShapeError
+            The image has no mosaic dimension available.
+        ValueError
+            The region has a negative position or no area.
+
+        Examples
+        --------
+        Pan over a large stitched scan
+
+        >>> reader = CziReader("very-large-mosaic.czi")
+        ... view = reader.get_mosaic_region(20000, 10000, 1024, 1024, "YX", C=0)
+        """
+        return self.get_mosaic_region_dask_data(
+            x, y, w, h, dimension_order_out, **kwargs
+        ).compute()
+
+    def stitch_mosaic(self, out: Optional[Union[types.PathLike, Any]] = None) -> Any:
+        """
+        Stitch the mosaic tiles together directly into an on-disk (or otherwise
+        caller-provided) array, tile by tile, without holding the full stitched
+        mosaic in memory.
+
+        Parameters
+        ----------
+        out: Optional[Union[types.PathLike, Any]]
+            Where to write the stitched mosaic. Either a path to create a `.zarr`
+            store or a `.npy` memory-mapped file at, or an existing array supporting
+            slice assignment (i.e. `np.memmap` or `zarr.Array`) with the shape and
+            dtype of `mosaic_dask_data`.
+            Default: None (an anonymous temporary memory-mapped file, its disk space
+            is released once the returned array is garbage collected)
+
+        Returns
+        -------
+        mosaic: Any
+            The array the stitched mosaic was written to.
+
+        Raises
+        ------
+        InvalidDimensionOrderingError
+            No MosaicTile dimension available to reader.
+        ValueError
+            The provided array doesn't match the shape or dtype of the mosaic.
+
+        Notes
+        -----
+        Tiles are read and written with the chunks of `mosaic_dask_data` so working
+        memory is bounded by the number of chunks being processed at once rather
+        than by the size of the mosaic. Zarr stores are chunked with the largest
+        mosaic chunk and the mosaic is rechunked to the zarr chunks before writing.
+        """
+        mosaic = self.mosaic_dask_data
+
+        target: Any
+        if out is None:
+            # The anonymous file is deleted by the OS once the map is released
+            with tempfile.TemporaryFile() as tmp_file:
+                target = np.memmap(
+                    tmp_file, dtype=mosaic.dtype, mode="w+", shape=mosaic.shape
+                )
+        elif isinstance(out, (str, Path)):
+            if str(out).endswith(".zarr"):
+                target = zarr.open(
+                    str(out),
+                    mode="w",
+                    shape=mosaic.shape,
+                    chunks=mosaic.chunksize,
+                    dtype=mosaic.dtype,
+                )
+            else:
+                target = np.lib.format.open_memmap(
+                    out, mode="w+", dtype=mosaic.dtype, shape=mosaic.shape
+                )
+        elif tuple(out.shape) != mosaic.shape or out.dtype != mosaic.dtype:
+            raise ValueError(
+                f"Provided output array (shape: {out.shape}, dtype: {out.dtype}) "
+                f"does not match the mosaic (shape: {mosaic.shape}, "
+                f"dtype: {mosaic.dtype})."
+            )
+        else:
+            target = out
+
+        # Use the already stitched mosaic if it is in memory
+        if self._mosaic_xarray_data is not None:
+            target[...] = self._mosaic_xarray_data.data
+        elif isinstance(target, zarr.Array):
+            # Write whole zarr chunks (the mosaic chunks follow the tile grid) so no
+            # lock is needed
+            da.store(mosaic.rechunk(target.chunks), target, lock=False)
+        else:
+            da.store(mosaic, target)
+
+        if isinstance(target, np.memmap):
+            target.flush()
+
+        return target
+
     @property
     def dtype(self) -> np.dtype:
         """
@@ -672,7 +1121,10 @@ class Reader(ImageContainer, ABC):
         -----
         * If a requested dimension is not present in the data the dimension is
           added with a depth of 1.
-        * This will preload the entire image before returning the requested data.
+        * This will preload the entire image before returning the requested data
+          unless the request selects a Y or X region of an image that isn't already
+          in memory, in which case only the chunks (i.e. tiles of tiled TIFFs)
+          intersecting the request are read.
 
         See `aicsimageio.transforms.reshape_data` for more details.
         """
@@ -680,6 +1132,12 @@ class Reader(ImageContainer, ABC):
         if dimension_order_out is None:
             return self.data
 
+        # Only read the requested region of images that aren't already in memory
+        if self._xarray_data is None and (
+            DimensionNames.SpatialY in kwargs or DimensionNames.SpatialX in kwargs
+        ):
+            return self.get_image_dask_data(dimension_order_out, **kwargs).compute()
+
         # Transform and return
         return transforms.reshape_data(
             data=self.data,
@@ -821,6 +1279,61 @@ class Reader(ImageContainer, ABC):
         """
         raise NotImplementedError()
 
+    def _get_mosaic_tile_positions(self) -> np.ndarray:
+        """
+        Get the position and size of every mosaic tile of the current scene.
+
+        Returns
+        -------
+        positions: np.ndarray
+            An integer array with one row per mosaic tile (in M index order) and
+            columns: Y (top), X (left), height, and width.
+
+        Notes
+        -----
+        Defaults to calling `get_mosaic_tile_position` for each tile. Readers that
+        can retrieve every tile position from a single metadata pass should override.
+        """
+        positions = np.empty((self.dims.M, 4), dtype=np.int64)
+        for mosaic_tile_index in range(self.dims.M):
+            position = self.get_mosaic_tile_position(mosaic_tile_index)
+            if position is None:
+                raise exceptions.UnexpectedShapeError("No mosaic dimension in image.")
+
+            positions[mosaic_tile_index] = (*position, self.dims.Y, self.dims.X)
+
+        return positions
+
+    def get_mosaic_tile_positions(self) -> np.ndarray:
+        """
+        Get the absolute position (top left point) and size of every mosaic tile of
+        the current scene at once.
+
+        Returns
+        -------
+        positions: np.ndarray
+            A read-only integer array with one row per mosaic tile (in M index order)
+            and columns: Y (top), X (left), height, and width.
+
+        Raises
+        ------
+        UnexpectedShapeError
+            The image has no mosaic dimension available.
+
+        Notes
+        -----
+        The positions are computed once per scene and cached.
+        """
+        if DimensionNames.MosaicTile not in self.dims.order:
+            raise exceptions.UnexpectedShapeError("No mosaic dimension in image.")
+
+        if self._mosaic_tile_positions is None:
+            positions = self._get_mosaic_tile_positions()
+            positions.flags.writeable = False
+            self._mosaic_tile_positions = positions
+
+        return self._mosaic_tile_positions
+
     @property
     def mosaic_tile_dims(self) -> Optional[Dimensions]:
         """
@@ -2,10 +2,24 @@
 # -*- coding: utf-8 -*-
 
 import glob
+import json
+import logging
+import os
 import re
 from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple, Union
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    List,
+    Optional,
+    Pattern,
+    Sequence,
+    Tuple,
+    Union,
+)
 
 import dask.array as da
 import numpy as np
@@ -17,17 +31,27 @@ from tifffile.tifffile import TiffTags
 
 from .. import constants, exceptions, types
 from ..dimensions import (
+    AUTO_CHUNK_DIMS,
     DEFAULT_CHUNK_DIMS,
     DEFAULT_DIMENSION_ORDER,
+    DEFAULT_DIMENSION_ORDER_LIST,
     DEFAULT_DIMENSION_ORDER_LIST_WITH_SAMPLES,
     REQUIRED_CHUNK_DIMS,
     DimensionNames,
+    guess_chunk_dims,
 )
 from ..metadata import utils as metadata_utils
 from ..utils import io_utils
 from .reader import Reader
 
+###############################################################################
+
+log = logging.getLogger(__name__)
+
+###############################################################################
+
 TIFF_IMAGE_DESCRIPTION_TAG_INDEX = 270
+TIFF_GLOB_INDEX_VERSION = 1
 
 
 class TiffGlobReader(Reader):
@@ -40,7 +64,10 @@ class TiffGlobReader(Reader):
     glob_in: Union[PathLike, List[PathLike]]
         Glob string that identifies all files to be loaded or a list
         of paths to the files as returned by glob.
-    indexer: Union[Callable, pandas.DataFrame]
+    indexer: Union[str, Pattern, Callable, pandas.DataFrame]
+        If a regular expression (string or compiled), its named groups are the
+        dimensions and are matched against every file name at once, i.e.
+        r"_t(?P<T>\d+)_z(?P<Z>\d+)". This is the fastest option for large file sets.
         If callable, should consume each filename and return a pd.Series with series
         index corresponding to the dimensions and values corresponding to the array
         index of that image file within the larger array.
@@ -50,7 +77,8 @@ class TiffGlobReader(Reader):
         Character to represent different scenes.
         Default: "S"
     chunk_dims: Union[str, List[str]]
-        Which dimensions to create chunks for.
+        Which dimensions to create chunks for, or "auto" (AUTO_CHUNK_DIMS) to pick
+        them from the stored layout of each scene (see `guess_chunk_dims`).
         Default: DEFAULT_CHUNK_DIMS
         Note: Dimensions.SpatialY, Dimensions.SpatialX, and DimensionNames.Samples,
         will always be added to the list if not present during dask array
@@ -75,6 +103,19 @@ class TiffGlobReader(Reader):
     fs_kwargs: Dict[str, Any]
         Any specific keyword arguments to pass down to the fsspec created filesystem.
         Default: {}
+    chunk_access_hint: Optional[str]
+        How the image will be accessed ("plane", "stack", "timeseries", or
+        "channels"), used to pick the chunk dims when chunk_dims is "auto".
+        Default: None (chunks grow along the stored order up to the dask
+        "array.chunk-size")
+    trust_single_file_shape: bool
+        Whether every file is assumed to have the shape and dtype of the first file.
+        If True, no other file is opened until its data is read.
+        Default: False (the headers of the first file of every chunk are read, with
+        max_workers threads, to validate their shape and dtype)
+    max_workers: Optional[int]
+        The number of threads reading file headers.
+        Default: None (the concurrent.futures.ThreadPoolExecutor default)
 
     Examples
     --------
@@ -109,6 +150,20 @@ class TiffGlobReader(Reader):
         return series
 
     mm_reader = TiffGlobReader(files, indexer=mm_indexer)
+
+    # For large file sets a regular expression with named groups is much faster
+    # than a function called for each file
+
+    mm_reader = TiffGlobReader(
+        files,
+        indexer=r"channel(?P<C>\d+)_position(?P<S>\d+)_time(?P<T>\d+)_z(?P<Z>\d+)",
+        trust_single_file_shape=True,
+    )
+
+    # The parsed file index can be written once and re-opened without globbing
+
+    mm_reader.write_index("path/to/data/index.json")
+    mm_reader = TiffGlobReader.from_index("path/to/data/index.json")
     """
 
     @staticmethod
@@ -126,7 +181,7 @@ class TiffGlobReader(Reader):
     def __init__(
         self,
         glob_in: Union[types.PathLike, List[types.PathLike]],
-        indexer: Union[pd.DataFrame, Callable] = None,
+        indexer: Union[str, Pattern, pd.DataFrame, Callable] = None,
         scene_glob_character: str = "S",
         chunk_dims: Union[str, List[str]] = DEFAULT_CHUNK_DIMS,
         dim_order: Optional[Union[List[str], str]] = None,
@@ -137,6 +192,9 @@ class TiffGlobReader(Reader):
             DimensionNames.SpatialX,
         ),
         fs_kwargs: Dict[str, Any] = {},
+        chunk_access_hint: Optional[str] = None,
+        trust_single_file_shape: bool = False,
+        max_workers: Optional[int] = None,
         **kwargs: Any,
     ):
 
@@ -163,14 +221,27 @@ class TiffGlobReader(Reader):
 
             # By default we will attempt to parse 4 numbers out of the filename
             # and assign them in order to be the corresponding S, T, C, and Z indices.
-            # So indexer("path/to/data/S0_T1_C2_Z3.tif") returns
-            # pd.Series([0,1,2,3], index=['S','T','C', 'Z'])
-            def indexer(x: str) -> pd.Series:
-                return pd.Series(
-                    re.findall(r"\d+", Path(x).name), index=series_idx
-                ).astype(int)
-
-        if callable(indexer):
+            # So "path/to/data/S0_T1_C2_Z3.tif" is indexed as S=0, T=1, C=2, Z=3
+            file_numbers = file_series.map(os.path.basename).str.findall(r"\d+")
+            unexpected = file_numbers.str.len() != len(series_idx)
+            if unexpected.any():
+                raise ValueError(
+                    f"The default indexer expects {len(series_idx)} numbers "
+                    f"({series_idx}) in every file name. "
+                    f"Received file: '{file_series[unexpected].iloc[0]}'. "
+                    f"Provide an indexer for other file names."
+                )
+
+            self._all_files = pd.DataFrame(
+                file_numbers.tolist(), columns=series_idx
+            ).astype(int)
+            self._all_files["filename"] = file_series
+
+        elif isinstance(indexer, (str, re.Pattern)):
+            self._all_files = self._index_with_pattern(file_series, indexer)
+            self._all_files["filename"] = file_series
+
+        elif callable(indexer):
             self._all_files = file_series.apply(indexer)
             self._all_files["filename"] = file_series
         elif isinstance(indexer, pd.DataFrame):
@@ -188,7 +259,18 @@ class TiffGlobReader(Reader):
             if dim in self._all_files.columns:
                 sort_order.append(dim)
 
-        self._all_files = self._all_files.sort_values(sort_order).reset_index(drop=True)
+        # Files that are already in order (i.e. from an index) are not sorted again
+        if not pd.MultiIndex.from_frame(
+            self._all_files[sort_order]
+        ).is_monotonic_increasing:
+            self._all_files = self._all_files.sort_values(sort_order)
+        self._all_files = self._all_files.reset_index(drop=True)
+
+        # Order the columns like the sort so that dims are unpacked in the file order
+        # no matter the order the indexer returned them in
+        self._all_files = self._all_files[
+            sort_order + [c for c in self._all_files.columns if c not in sort_order]
+        ]
 
         # run tests on a single file (?)
         self._fs, self._path = io_utils.pathlike_to_fs(
@@ -197,7 +279,11 @@ class TiffGlobReader(Reader):
         )
 
         # Store params
-        if isinstance(chunk_dims, str):
+        # Auto chunk dims are picked once the single file layout is known
+        self._auto_chunk_dims = chunk_dims == AUTO_CHUNK_DIMS
+        if self._auto_chunk_dims:
+            self.chunk_dims = []
+        elif isinstance(chunk_dims, str):
             self.chunk_dims = list(chunk_dims)
         elif isinstance(chunk_dims, list) and isinstance(chunk_dims[0], str):
             self.chunk_dims = chunk_dims
@@ -230,6 +316,55 @@ class TiffGlobReader(Reader):
                     )
             self._channel_names = channel_names
 
+        # Enforce valid image
+        if not self._is_supported_image(self._fs, self._path):
+            raise exceptions.UnsupportedFileFormatError(
+                self.__class__.__name__, self._path
+            )
+
+        # The stored layout of the first file is the layout of every file
+        with self._fs.open(self._path) as open_resource:
+            with TiffFile(open_resource) as tiff:
+                self._file_shape = tiff.series[0].shape
+                self._file_dtype = tiff.series[0].dtype
+
+        self._trust_single_file_shape = trust_single_file_shape
+        self._max_workers = max_workers
+
+        self._single_file_shape = self._file_shape
+        if single_file_shape is not None:
+            self._single_file_shape = single_file_shape
+
+        if len(single_file_dims) != len(self._single_file_shape):
+            raise exceptions.ConflictingArgumentsError(
+                f"Number of single file dimensions does not match the"
+                f"number of dimensions in a test file. "
+                f"Number of dimensions in file: {len(self._single_file_shape)}, "
+                f"Provided number of dimensions: {len(single_file_dims)}."
+            )
+
+        else:
+            self._single_file_dims = list(single_file_dims)
+
+        self._single_file_sizes = dict(
+            zip(self._single_file_dims, self._single_file_shape)
+        )
+
+        # Pick the chunk dims from the file (glob) order and single file layout
+        if self._auto_chunk_dims:
+            glob_dims = [
+                d
+                for d in DEFAULT_DIMENSION_ORDER_LIST
+                if d in self._all_files.columns and d not in self._single_file_sizes
+            ]
+            glob_sizes = self._all_files[glob_dims].nunique()
+            self.chunk_dims = guess_chunk_dims(
+                glob_dims + self._single_file_dims,
+                [glob_sizes[d] for d in glob_dims] + list(self._single_file_shape),
+                self._file_dtype.itemsize,
+                access_hint=chunk_access_hint,
+            )
+
         for dim in REQUIRED_CHUNK_DIMS:
             if dim not in self.chunk_dims:
                 self.chunk_dims.append(dim)
@@ -246,34 +381,217 @@ class TiffGlobReader(Reader):
                 if d in self._all_files.columns or d in self.chunk_dims
             )
 
-        if single_file_shape is None:
-            with self._fs.open(self._path) as open_resource:
+    @staticmethod
+    def _index_with_pattern(
+        file_series: pd.Series, pattern: Union[str, Pattern]
+    ) -> pd.DataFrame:
+        pattern = re.compile(pattern)
+        if len(pattern.groupindex) == 0:
+            raise ValueError(
+                f"The indexer pattern must name a group for each dimension, "
+                f"i.e. r'_t(?P<T>\\d+)'. Received pattern: '{pattern.pattern}'."
+            )
+
+        # Match every file name at once
+        indices = file_series.map(os.path.basename).str.extract(pattern)
+        indices = indices[list(pattern.groupindex)]
+        unmatched = indices.isna().any(axis=1)
+        if unmatched.any():
+            raise ValueError(
+                f"The indexer pattern: '{pattern.pattern}' doesn't match every file "
+                f"name. Received file: '{file_series[unmatched].iloc[0]}'."
+            )
+
+        return indices.astype(int)
+
+    def _scan_file_headers(self, filenames: List[str]) -> None:
+        def read_header(filename: str) -> Tuple[Tuple[int, ...], np.dtype]:
+            with self._fs.open(filename) as open_resource:
                 with TiffFile(open_resource) as tiff:
-                    self._single_file_shape = tiff.series[0].shape
+                    return tiff.series[0].shape, tiff.series[0].dtype
+
+        # Headers are read concurrently as they are dominated by file system latency
+        with ThreadPoolExecutor(max_workers=self._max_workers) as executor:
+            for filename, (shape, dtype) in zip(
+                filenames, executor.map(read_header, filenames)
+            ):
+                if shape != self._file_shape or dtype != self._file_dtype:
+                    raise exceptions.UnexpectedShapeError(
+                        f"Every file must have the shape and dtype of the first "
+                        f"file: '{self._path}' (shape: {self._file_shape}, dtype: "
+                        f"{self._file_dtype}). Received file: '{filename}' with "
+                        f"shape: {shape}, dtype: {dtype}."
+                    )
 
-        else:
-            self._single_file_shape = single_file_shape
+    @staticmethod
+    def _get_directory_signatures(
+        filenames: pd.Series, fs_kwargs: Dict[str, Any] = {}
+    ) -> Dict[str, List]:
+        signatures = {}
+        for directory in filenames.map(os.path.dirname).unique():
+            fs, path = io_utils.pathlike_to_fs(directory or ".", fs_kwargs=fs_kwargs)
+            signatures[directory] = list(io_utils.get_resource_signature(fs, path))
+
+        return signatures
+
+    def write_index(
+        self, index_path: types.PathLike, fs_kwargs: Dict[str, Any] = {}
+    ) -> None:
+        """
+        Write the dataset index (the file names, their dimension indices, and the
+        shape and dtype of every file) to a JSON file that `TiffGlobReader.from_index`
+        re-opens the dataset from without globbing, parsing, or sorting file names.
 
-        if len(single_file_dims) != len(self._single_file_shape):
-            raise exceptions.ConflictingArgumentsError(
-                f"Number of single file dimensions does not match the"
-                f"number of dimensions in a test file. "
-                f"Number of dimensions in file: {len(self._single_file_shape)}, "
-                f"Provided number of dimensions: {len(single_file_dims)}."
+        Parameters
+        ----------
+        index_path: types.PathLike
+            The local or remote path to write the index to.
+        fs_kwargs: Dict[str, Any]
+            Any specific keyword arguments to pass down to the fsspec created
+            filesystem for the index and the dataset directories.
+            Default: {}
+
+        Raises
+        ------
+        exceptions.UnexpectedShapeError
+            The shape or dtype of a file doesn't match the first file.
+
+        Notes
+        -----
+        Unless the reader was created with trust_single_file_shape, the header of
+        every file is read to validate that all files share the shape and dtype of the
+        first file, which is then recorded once for the dataset.
+
+        File names are stored as they were provided, relative paths are resolved
+        against the working directory when the index is opened.
+        """
+        if not self._trust_single_file_shape:
+            self._scan_file_headers(self._all_files.filename.tolist())
+
+        # Create the index before recording the directory signatures, creating it
+        # modifies the dataset directory when the index is written into it
+        fs, path = io_utils.pathlike_to_fs(index_path, fs_kwargs=fs_kwargs)
+        fs.touch(path)
+
+        dims = self._all_files.columns.drop("filename").tolist()
+        index = {
+            "version": TIFF_GLOB_INDEX_VERSION,
+            "scene_glob_character": self.scene_glob_character,
+            "dims": dims,
+            "indices": self._all_files[dims].values.tolist(),
+            "filenames": self._all_files.filename.tolist(),
+            "file_shape": list(self._file_shape),
+            "file_dtype": self._file_dtype.str,
+            "single_file_shape": list(self._single_file_shape),
+            "single_file_dims": self._single_file_dims,
+            "directories": self._get_directory_signatures(
+                self._all_files.filename, fs_kwargs=fs_kwargs
+            ),
+        }
+
+        with fs.open(path, "w") as open_resource:
+            json.dump(index, open_resource)
+
+    @classmethod
+    def from_index(
+        cls,
+        index_path: types.PathLike,
+        check_staleness: bool = True,
+        fs_kwargs: Dict[str, Any] = {},
+        **kwargs: Any,
+    ) -> "TiffGlobReader":
+        """
+        Re-open a dataset from an index written by `TiffGlobReader.write_index`.
+
+        Parameters
+        ----------
+        index_path: types.PathLike
+            The local or remote path to the index.
+        check_staleness: bool
+            Whether to compare the modification signature (size and mtime) of every
+            directory holding dataset files against the signature recorded in the
+            index. Adding, removing, or renaming files in a directory changes its
+            signature, rewriting a file in place does not. Object stores (i.e. S3)
+            don't report directory modification times so their changes can't be
+            detected, a warning is logged instead.
+            Default: True
+        fs_kwargs: Dict[str, Any]
+            Any specific keyword arguments to pass down to the fsspec created
+            filesystem for the index and the dataset files.
+            Default: {}
+        kwargs: Any
+            Any other TiffGlobReader parameters (i.e. chunk_dims, dim_order, or
+            channel_names). trust_single_file_shape defaults to True as every file
+            was validated when the index was written.
+
+        Returns
+        -------
+        reader: TiffGlobReader
+            The reader for the indexed dataset.
+
+        Raises
+        ------
+        ValueError
+            The index is from an unsupported version or is stale.
+        exceptions.UnexpectedShapeError
+            The first file no longer has the recorded shape and dtype.
+        """
+        fs, path = io_utils.pathlike_to_fs(
+            index_path, enforce_exists=True, fs_kwargs=fs_kwargs
+        )
+        with fs.open(path, "r") as open_resource:
+            index = json.load(open_resource)
+
+        if index.get("version") != TIFF_GLOB_INDEX_VERSION:
+            raise ValueError(
+                f"Unsupported TiffGlobReader index version: {index.get('version')}. "
+                f"Expected version: {TIFF_GLOB_INDEX_VERSION}. Index: '{index_path}'."
             )
 
-        else:
-            self._single_file_dims = list(single_file_dims)
+        filenames = pd.Series(index["filenames"])
+        if check_staleness:
+            for directory, signature in cls._get_directory_signatures(
+                filenames, fs_kwargs=fs_kwargs
+            ).items():
+                # Object stores don't report a modification time for directories
+                if len(signature) < 2:
+                    log.warning(
+                        f"The directory: '{directory}' has no modification time, "
+                        f"changes to its files can't be detected. The staleness "
+                        f"check of TiffGlobReader indexes only covers filesystems "
+                        f"that report directory modification times (i.e. local)."
+                    )
 
-        self._single_file_sizes = dict(
-            zip(self._single_file_dims, self._single_file_shape)
+                if signature != index["directories"].get(directory):
+                    raise ValueError(
+                        f"The TiffGlobReader index: '{index_path}' is stale, the "
+                        f"directory: '{directory}' was modified after the index was "
+                        f"written. Write a new index or pass check_staleness=False."
+                    )
+
+        kwargs.setdefault("trust_single_file_shape", True)
+        reader = cls(
+            filenames.tolist(),
+            indexer=pd.DataFrame(index["indices"], columns=index["dims"]),
+            scene_glob_character=index["scene_glob_character"],
+            single_file_shape=tuple(index["single_file_shape"]),
+            single_file_dims=index["single_file_dims"],
+            fs_kwargs=fs_kwargs,
+            **kwargs,
         )
-        # Enforce valid image
-        if not self._is_supported_image(self._fs, self._path):
-            raise exceptions.UnsupportedFileFormatError(
-                self.__class__.__name__, self._path
+
+        if reader._file_shape != tuple(index["file_shape"]) or (
+            reader._file_dtype != np.dtype(index["file_dtype"])
+        ):
+            raise exceptions.UnexpectedShapeError(
+                f"The first file: '{reader._path}' (shape: {reader._file_shape}, "
+                f"dtype: {reader._file_dtype}) no longer matches the TiffGlobReader "
+                f"index: '{index_path}' (shape: {tuple(index['file_shape'])}, "
+                f"dtype: {index['file_dtype']})."
             )
 
+        return reader
+
     @property
     def scenes(self) -> Tuple[str, ...]:
         if self._scenes is None:
@@ -331,12 +649,22 @@ class TiffGlobReader(Reader):
             group_sizes, chunk_sizes
         )
 
+        # Every file is read with the layout of the first file, validated against the
+        # first file of every chunk unless trusted
+        if not self._trust_single_file_shape:
+            if len(group_dims) > 0:
+                chunk_files = scene_files.groupby(group_dims).filename.first()
+                self._scan_file_headers(chunk_files.tolist())
+            else:
+                self._scan_file_headers(scene_files.filename.iloc[:1].tolist())
+        file_layout = dict(chunkshape=self._file_shape, dtype=self._file_dtype)
+
         # Assemble the dask array
         if len(group_dims) > 0:  # use groupby to assemble array out of chunks
             blocks = np.zeros(tuple(group_sizes.values()), dtype="object")
             for i, (idx, val) in enumerate(scene_files.groupby(group_dims)):
                 with TiffSequence(val.filename.tolist()) as tif:
-                    with tif.aszarr() as zarr_im:
+                    with tif.aszarr(**file_layout) as zarr_im:
                         darr = da.from_zarr(zarr_im).rechunk(-1)
 
                 # unpack the first dimension if it contains multiple axes
@@ -356,8 +684,9 @@ class TiffGlobReader(Reader):
             dims = list(expanded_blocks_sizes.keys())
 
         else:  # assemble array in a single chunk
-            zarr_im = imread(scene_files.filename.tolist(), aszarr=True, level=0)
-            darr = da.from_zarr(zarr_im).rechunk(-1)
+            with TiffSequence(scene_files.filename.tolist()) as tif:
+                with tif.aszarr(level=0, **file_layout) as zarr_im:
+                    darr = da.from_zarr(zarr_im).rechunk(-1)
             darr = darr.reshape(reshape_sizes)
             darr = darr.transpose(axes_order)
             d_data = darr.reshape(tuple(chunk_sizes.values()))
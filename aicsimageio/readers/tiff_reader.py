@@ -1,20 +1,28 @@
 #!/usr/bin/env python
 # -*- coding: utf-8 -*-
 
-from typing import Any, Dict, List, Optional, Tuple, Union
+import math
+from functools import partial
+from typing import Any, Dict, Hashable, List, Optional, Tuple, Union
 
 import dask.array as da
 import numpy as np
 import xarray as xr
-from dask import delayed
 from fsspec.spec import AbstractFileSystem
-from tifffile import TiffFile, TiffFileError, imread
+from tifffile import TiffFile, TiffFileError, TiffPageSeries
 from tifffile.tifffile import TiffTags
 
 from .. import constants, exceptions, types
-from ..dimensions import DEFAULT_CHUNK_DIMS, REQUIRED_CHUNK_DIMS, DimensionNames
+from ..dimensions import (
+    AUTO_CHUNK_DIMS,
+    DEFAULT_CHUNK_DIMS,
+    REQUIRED_CHUNK_DIMS,
+    DimensionNames,
+    guess_chunk_dims,
+)
 from ..metadata import utils as metadata_utils
-from ..utils import io_utils
+from ..utils import dask_utils, io_utils
+from ..utils.tiff_handle_pool import TIFF_HANDLE_POOL
 from .reader import Reader
 
 ###############################################################################
@@ -37,7 +45,8 @@ class TiffReader(Reader):
     image: types.PathLike
         Path to image file to construct Reader for.
     chunk_dims: Union[str, List[str]]
-        Which dimensions to create chunks for.
+        Which dimensions to create chunks for, or "auto" (AUTO_CHUNK_DIMS) to pick
+        them from the stored layout of each scene (see `guess_chunk_dims`).
         Default: DEFAULT_CHUNK_DIMS
         Note: Dimensions.SpatialY, Dimensions.SpatialX, and DimensionNames.Samples,
         will always be added to the list if not present during dask array
@@ -55,6 +64,17 @@ class TiffReader(Reader):
     fs_kwargs: Dict[str, Any]
         Any specific keyword arguments to pass down to the fsspec created filesystem.
         Default: {}
+    chunk_access_hint: Optional[str]
+        How the image will be accessed ("plane", "stack", "timeseries", or
+        "channels"), used to pick the chunk dims when chunk_dims is "auto".
+        Default: None (chunks grow along the stored order up to the dask
+        "array.chunk-size")
+    tile_chunk_bytes: Optional[int]
+        The planes of tiled images with chunks larger than this number of bytes are
+        chunked along Y and X into blocks of whole tiles no larger than this (unless
+        a single tile is larger), i.e. 2**20. Reads of Y and X regions then only
+        decode the intersecting tiles.
+        Default: None (Y and X are read in whole planes)
     """
 
     @staticmethod
@@ -74,6 +94,8 @@ class TiffReader(Reader):
         dim_order: Optional[Union[List[str], str]] = None,
         channel_names: Optional[Union[List[str], List[List[str]]]] = None,
         fs_kwargs: Dict[str, Any] = {},
+        chunk_access_hint: Optional[str] = None,
+        tile_chunk_bytes: Optional[int] = None,
         **kwargs: Any,
     ):
         # Expand details of provided image
@@ -84,7 +106,13 @@ class TiffReader(Reader):
         )
 
         # Store params
-        if isinstance(chunk_dims, str):
+        # Auto chunk dims are picked for each scene during dask array construction
+        self._auto_chunk_dims = chunk_dims == AUTO_CHUNK_DIMS
+        self._chunk_access_hint = chunk_access_hint
+        self._tile_chunk_bytes = tile_chunk_bytes
+        if self._auto_chunk_dims:
+            chunk_dims = []
+        elif isinstance(chunk_dims, str):
             chunk_dims = list(chunk_dims)
 
         # Run basic checks on dims and channel names
@@ -132,17 +160,54 @@ class TiffReader(Reader):
 
         return self._scenes
 
+    @property
+    def resolution_levels(self) -> Tuple[int, ...]:
+        # Counted once per scene
+        if self._resolution_levels is None:
+            with self._fs.open(self._path) as open_resource:
+                with TiffFile(open_resource) as tiff:
+                    self._resolution_levels = tuple(
+                        range(len(tiff.series[self.current_scene_index].levels))
+                    )
+
+        return self._resolution_levels
+
+    def _get_resolution_level_series(self, tiff: TiffFile) -> TiffPageSeries:
+        return tiff.series[self.current_scene_index].levels[
+            self.current_resolution_level
+        ]
+
+    def _get_resolution_level_scale(self) -> Tuple[float, float]:
+        """
+        Get the Y and X downsampling factors of the current resolution level relative
+        to the full resolution level.
+        """
+        if self.current_resolution_level == 0:
+            return 1.0, 1.0
+
+        with self._fs.open(self._path) as open_resource:
+            with TiffFile(open_resource) as tiff:
+                full = tiff.series[self.current_scene_index]
+                level = self._get_resolution_level_series(tiff)
+                return tuple(  # type: ignore
+                    full.shape[full.axes.index(dim)]
+                    / level.shape[level.axes.index(dim)]
+                    for dim in (DimensionNames.SpatialY, DimensionNames.SpatialX)
+                )
+
     @staticmethod
     def _get_image_data(
         fs: AbstractFileSystem,
         path: str,
         scene: int,
-        retrieve_indices: Tuple[Union[int, slice]],
+        retrieve_indices: Tuple[Union[int, slice], ...],
         transpose_indices: List[int],
+        signature: Optional[Tuple[Hashable, ...]] = None,
+        chunkmode: Optional[str] = "page",
+        level: int = 0,
     ) -> np.ndarray:
         """
-        Open a file for reading, construct a Zarr store, select data, and compute to
-        numpy.
+        Select data from the pooled zarr store for the file and return as numpy.
 
         Parameters
         ----------
@@ -156,25 +221,173 @@ class TiffReader(Reader):
             The image indices to retrieve.
         transpose_indices: List[int]
             The indices to transpose to prior to requesting data.
+        signature: Optional[Tuple[Hashable, ...]]
+            The resource signature used to key the open file in the handle pool.
+            Default: None (the open file is reused regardless of modification)
+        chunkmode: Optional[str]
+            The chunk mode of the zarr store, None to only decode the tiles
+            intersecting the retrieved indices.
+            Default: "page" (decode whole pages)
+        level: int
+            The resolution level to pull the chunk from.
+            Default: 0 (full resolution)
+
+        Returns
+        -------
+        chunk: np.ndarray
+            The image chunk as a numpy array.
+
+        Notes
+        -----
+        The file, TiffFile, and zarr store are shared with every other chunk read
+        of the same file in this process through the `TIFF_HANDLE_POOL`.
+        """
+        with TIFF_HANDLE_POOL.open(
+            fs,
+            path,
+            series=scene,
+            level=level,
+            signature=signature,
+            chunkmode=chunkmode,
+        ) as arr:
+            # Map the requested indices (which are in the transposed order)
+            # back to the stored order so that only the chunk is read from the store
+            stored_indices: List[Union[int, slice]] = [slice(None, None, None)] * len(
+                transpose_indices
+            )
+            for index, stored_axis in zip(retrieve_indices, transpose_indices):
+                stored_indices[stored_axis] = index
+
+            chunk = arr[tuple(stored_indices)]
+
+            # Integer indexing drops dimensions, transpose the remaining dimensions
+            # from stored order into the requested order
+            kept_axes = [
+                stored_axis
+                for index, stored_axis in zip(retrieve_indices, transpose_indices)
+                if not isinstance(index, (int, np.integer))
+            ]
+            return np.transpose(chunk, np.argsort(np.argsort(kept_axes)))
+
+    @staticmethod
+    def _get_image_block(
+        block_index: Tuple[int, ...],
+        fs: AbstractFileSystem,
+        path: str,
+        scene: int,
+        chunk_steps: Tuple[Optional[int], ...],
+        transpose_indices: List[int],
+        signature: Optional[Tuple[Hashable, ...]] = None,
+        level: int = 0,
+    ) -> np.ndarray:
+        """
+        Read a single block of the blocked (non-chunk dims then chunk dims) array.
+
+        Parameters
+        ----------
+        block_index: Tuple[int, ...]
+            The index of the block along every dimension of the blocked array.
+        fs: AbstractFileSystem
+            The file system to use for reading.
+        path: str
+            The path to file to read.
+        scene: int
+            The scene index to pull the chunk from.
+        chunk_steps: Tuple[Optional[int], ...]
+            The block size along each of the chunk dimensions if the dimension is
+            split into blocks of whole tiles, otherwise None (fully retrieved).
+        transpose_indices: List[int]
+            The indices to transpose to prior to requesting data.
+        signature: Optional[Tuple[Hashable, ...]]
+            The resource signature used to key the open file in the handle pool.
+            Default: None (the open file is reused regardless of modification)
+        level: int
+            The resolution level to pull the chunk from.
+            Default: 0 (full resolution)
 
         Returns
         -------
         chunk: np.ndarray
             The image chunk as a numpy array.
         """
-        with fs.open(path) as open_resource:
-            with imread(
-                open_resource, aszarr=True, series=scene, level=0, chunkmode="page"
-            ) as store:
-                arr = da.from_zarr(store)
-                arr = arr.transpose(transpose_indices)
-
-                # By setting the compute call to always use a "synchronous" scheduler,
-                # it informs Dask not to look for an existing scheduler / client
-                # and instead simply read the data using the current thread / process.
-                # In doing so, we shouldn't run into any worker data transfer and
-                # handoff _during_ a read.
-                return arr[retrieve_indices].compute(scheduler="synchronous")
+        n_grid_dims = len(block_index) - len(chunk_steps)
+        chunk_indices = tuple(
+            slice(None, None, None)
+            if step is None
+            else slice(index * step, (index + 1) * step)
+            for index, step in zip(block_index[n_grid_dims:], chunk_steps)
+        )
+
+        # Only decode the tiles of the block when the plane is split into blocks
+        tiled = any(step is not None for step in chunk_steps)
+        return TiffReader._get_image_data(
+            fs=fs,
+            path=path,
+            scene=scene,
+            retrieve_indices=tuple(block_index[:n_grid_dims]) + chunk_indices,
+            transpose_indices=transpose_indices,
+            signature=signature,
+            chunkmode=None if tiled else "page",
+            level=level,
+        )
+
+    @staticmethod
+    def _get_tiled_chunk_steps(
+        page: Any,
+        chunk_dim_order: List[str],
+        chunk_shape: List[int],
+        itemsize: int,
+        max_chunk_bytes: Optional[int],
+    ) -> Tuple[Optional[int], ...]:
+        """
+        Determine the block size along each chunk dimension so that planes of large
+        tiled images are split into blocks of whole tiles.
+
+        Parameters
+        ----------
+        page: Any
+            The first (key frame) TiffPage of the series.
+        chunk_dim_order: List[str]
+            The chunk dimensions of the blocked array.
+        chunk_shape: List[int]
+            The size of each chunk dimension.
+        itemsize: int
+            The number of bytes per pixel sample.
+        max_chunk_bytes: Optional[int]
+            The largest chunk that isn't split into blocks of whole tiles, and the
+            size of each block. None to never split chunks.
+
+        Returns
+        -------
+        chunk_steps: Tuple[Optional[int], ...]
+            The block size along each of the chunk dimensions if the dimension is
+            split into blocks of whole tiles, otherwise None.
+        """
+        no_split: Tuple[Optional[int], ...] = (None,) * len(chunk_dim_order)
+        chunk_bytes = int(np.prod(chunk_shape)) * itemsize
+        if (
+            max_chunk_bytes is None
+            or not page.is_tiled
+            or page.imagedepth > 1
+            or chunk_bytes <= max_chunk_bytes
+        ):
+            return no_split
+
+        # Group as many tiles into each square-ish block as fit in the byte budget
+        y_index = chunk_dim_order.index(DimensionNames.SpatialY)
+        x_index = chunk_dim_order.index(DimensionNames.SpatialX)
+        tile_bytes = (
+            chunk_bytes
+            // (chunk_shape[y_index] * chunk_shape[x_index])
+            * page.tilelength
+            * page.tilewidth
+        )
+        tiles_per_side = max(1, math.isqrt(max_chunk_bytes // tile_bytes))
+
+        chunk_steps = list(no_split)
+        chunk_steps[y_index] = page.tilelength * tiles_per_side
+        chunk_steps[x_index] = page.tilewidth * tiles_per_side
+        return tuple(chunk_steps)
 
     def _get_tiff_tags(self, tiff: TiffFile) -> TiffTags:
         unprocessed_tags = tiff.series[self.current_scene_index].pages[0].tags
@@ -327,6 +540,19 @@ class TiffReader(Reader):
         image_data: da.Array
             The fully constructed and fully delayed image as a Dask Array object.
         """
+        # Construct delayed dask array
+        selected_scene = self._get_resolution_level_series(tiff)
+        selected_scene_dims = "".join(selected_scene_dims_list)
+
+        # Pick the chunk dims from the page order of this scene
+        if self._auto_chunk_dims:
+            self.chunk_dims = guess_chunk_dims(
+                selected_scene_dims,
+                selected_scene.shape,
+                selected_scene.dtype.itemsize,
+                access_hint=self._chunk_access_hint,
+            )
+
         # Always add the plane dimensions if not present already
         for dim in REQUIRED_CHUNK_DIMS:
             if dim not in self.chunk_dims:
@@ -335,10 +561,6 @@ class TiffReader(Reader):
         # Safety measure / "feature"
         self.chunk_dims = [d.upper() for d in self.chunk_dims]
 
-        # Construct delayed dask array
-        selected_scene = tiff.series[self.current_scene_index]
-        selected_scene_dims = "".join(selected_scene_dims_list)
-
         # Raise invalid dims error
         if len(selected_scene.shape) != len(selected_scene_dims):
             raise exceptions.ConflictingArgumentsError(
@@ -363,12 +585,23 @@ class TiffReader(Reader):
                 non_chunk_dim_order.append(dim)
                 non_chunk_shape.append(size)
 
-        # Fill out the rest of the blocked shape with dimension sizes of 1 to
-        # match the length of the sample chunk
-        # When dask.block happens it fills the dimensions from inner-most to
-        # outer-most with the chunks as long as the dimension is size 1
+        # The blocked array has every non-chunk dimension (chunked by one) followed
+        # by every chunk dimension (in a single chunk or, for planes of large tiled
+        # images when tile_chunk_bytes is set, Y and X in blocks of whole tiles)
         blocked_dim_order = non_chunk_dim_order + chunk_dim_order
-        blocked_shape = tuple(non_chunk_shape) + ((1,) * len(chunk_shape))
+        chunk_steps = self._get_tiled_chunk_steps(
+            selected_scene.keyframe,
+            chunk_dim_order,
+            chunk_shape,
+            selected_scene.dtype.itemsize,
+            max_chunk_bytes=self._tile_chunk_bytes,
+        )
+        blocked_chunk_shape: List[Union[int, Tuple[int, ...]]] = [
+            size
+            if step is None
+            else (step,) * (size // step) + ((size % step,) if size % step else ())
+            for size, step in zip(chunk_shape, chunk_steps)
+        ]
 
         # Construct the transpose indices that will be used to
         # transpose the array prior to pulling the chunk dims
@@ -377,30 +610,36 @@ class TiffReader(Reader):
         for dim in blocked_dim_order:
             transposer.append(match_map[dim])
 
-        # Make ndarray for lazy arrays to fill
-        lazy_arrays: np.ndarray = np.ndarray(blocked_shape, dtype=object)
-        for np_index, _ in np.ndenumerate(lazy_arrays):
-            # All dimensions get their normal index except for chunk dims
-            # which get filled with "full" slices
-            indices_with_slices = np_index[: len(non_chunk_shape)] + (
-                (slice(None, None, None),) * len(chunk_shape)
-            )
-
-            # Fill the numpy array with the delayed arrays
-            lazy_arrays[np_index] = da.from_delayed(
-                delayed(TiffReader._get_image_data)(
-                    fs=self._fs,
-                    path=self._path,
-                    scene=self.current_scene_index,
-                    retrieve_indices=indices_with_slices,
-                    transpose_indices=transposer,
-                ),
-                shape=chunk_shape,
-                dtype=selected_scene.dtype,
-            )
-
-        # Convert the numpy array of lazy readers into a dask array
-        image_data = da.block(lazy_arrays.tolist())
+        # Signature used to share open file handles between chunk reads
+        signature = io_utils.get_resource_signature(self._fs, self._path)
+
+        # Construct a single graph layer with one read task per chunk
+        image_data = dask_utils.from_block_function(
+            partial(
+                TiffReader._get_image_block,
+                fs=self._fs,
+                path=self._path,
+                scene=self.current_scene_index,
+                chunk_steps=chunk_steps,
+                transpose_indices=transposer,
+                signature=signature,
+                level=self.current_resolution_level,
+            ),
+            grid_shape=non_chunk_shape,
+            chunk_shape=blocked_chunk_shape,
+            dtype=selected_scene.dtype,
+            name="tiff-read",
+            cache_key=self._get_chunk_cache_key(
+                non_chunk_dim_order
+                + [
+                    dim if step is None else f"{dim}:{step}"
+                    for dim, step in zip(chunk_dim_order, chunk_steps)
+                ],
+                signature=signature,
+                resolution_level=self.current_resolution_level,
+            ),
+            disk_cache=self._disk_chunk_cache,
+        )
 
         # Because we have set certain dimensions to be chunked and others not
         # we will need to transpose back to original dimension ordering
@@ -496,7 +735,7 @@ class TiffReader(Reader):
                 dims = self._get_dims_for_scene(tiff)
 
                 # Read image into memory
-                image_data = tiff.series[self.current_scene_index].asarray()
+                image_data = self._get_resolution_level_series(tiff).asarray()
 
                 # Get unprocessed metadata from tags
                 tiff_tags = self._get_tiff_tags(tiff)
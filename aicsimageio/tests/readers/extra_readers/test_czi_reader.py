@@ -6,6 +6,7 @@ from pathlib import Path
 from tempfile import TemporaryDirectory
 from typing import Any, List, Optional, Tuple, Union
 
+import dask.array as da
 import numpy as np
 import pytest
 from ome_types import OME
@@ -679,3 +680,58 @@ def test_ome_metadata(filename: str) -> None:
 
     # Test the transform
     assert isinstance(img.ome_metadata, OME)
+
+
+def test_czi_reader_mosaic_chunks_jittered_tiles() -> None:
+    # A 3 x 4 grid of 100 x 120 tiles with 10% overlap and jittered stage positions
+    rng = np.random.default_rng(0)
+    regions: List[Tuple[Tuple[Any, ...], Tuple[Any, ...]]] = []
+    for row in range(3):
+        for col in range(4):
+            y = row * 90 + int(rng.integers(0, 4))
+            x = col * 108 + int(rng.integers(0, 4))
+            regions.append(((), (slice(y, y + 100), slice(x, x + 120))))
+
+    chunks = CziReader._get_mosaic_chunks(
+        data=da.zeros((12, 100, 120), chunks=(1, 100, 120)),
+        data_dims="MYX",
+        ordered_dims_present=["Y", "X"],
+        arr_shape=[285, 447],
+        regions=regions,
+    )
+
+    # About one chunk per tile row and column without slivers
+    assert len(chunks[0]) == 3
+    assert len(chunks[1]) == 4
+    assert sum(chunks[0]) == 285
+    assert sum(chunks[1]) == 447
+    assert min(chunks[0]) >= 50
+    assert min(chunks[1]) >= 60
+
+
+@pytest.mark.parametrize(
+    "x, y, w, h",
+    [
+        # Inside a single tile
+        (10, 20, 100, 80),
+        # Across tile borders
+        (1400, 400, 300, 200),
+        # Clipped at the far edge of the mosaic
+        (4500, 2900, 1000, 1000),
+    ],
+)
+def test_czi_reader_mosaic_region_matches_mosaic(
+    x: int, y: int, w: int, h: int
+) -> None:
+    reader = CziReader(get_resource_full_path("OverViewScan.czi", LOCAL))
+    reader.set_scene("TR1")
+
+    expected = reader.mosaic_xarray_dask_data.isel(
+        {
+            dimensions.DimensionNames.SpatialY: slice(y, y + h),
+            dimensions.DimensionNames.SpatialX: slice(x, x + w),
+        }
+    ).data
+    np.testing.assert_array_equal(
+        reader.get_mosaic_region(x, y, w, h), expected.compute()
+    )
@@ -2,12 +2,14 @@
 # -*- coding: utf-8 -*-
 from __future__ import annotations
 
+from pathlib import Path
 from typing import List, Optional, Tuple, Union
 
 import dask.array as da
 import numpy as np
 import pytest
 import xarray as xr
+import zarr
 
 from aicsimageio import AICSImage, dimensions, exceptions, types
 from aicsimageio.readers import ArrayLikeReader
@@ -1133,3 +1135,76 @@ def test_aicsimage_from_array(
             dict,
         ),
     )
+
+
+class RowMosaicArrayLikeReader(ArrayLikeReader):
+    # Stitches the M tiles side by side along X
+    def _get_stitched_dask_mosaic(self) -> xr.DataArray:
+        return xr.concat(
+            [
+                self.xarray_dask_data.isel({dimensions.DimensionNames.MosaicTile: m})
+                for m in range(self.dims.M)
+            ],
+            dim=dimensions.DimensionNames.SpatialX,
+        )
+
+    def get_mosaic_tile_position(self, mosaic_tile_index: int) -> Tuple[int, int]:
+        if not 0 <= mosaic_tile_index < self.dims.M:
+            raise IndexError(mosaic_tile_index)
+
+        return 0, mosaic_tile_index * self.dims.X
+
+
+def test_stitch_mosaic(tmp_path: Path) -> None:
+    tiles = da.from_array(
+        np.arange(3 * 2 * 4 * 5, dtype=np.uint16).reshape((3, 2, 4, 5)),
+        chunks=(1, 1, 4, 5),
+    )
+    reader = RowMosaicArrayLikeReader(tiles, dim_order="MCYX")
+    expected = reader.mosaic_dask_data.compute()
+    assert expected.shape == (2, 4, 15)
+
+    # Temporary, .npy, and .zarr outputs
+    np.testing.assert_array_equal(reader.stitch_mosaic(), expected)
+    npy = reader.stitch_mosaic(tmp_path / "mosaic.npy")
+    np.testing.assert_array_equal(np.load(tmp_path / "mosaic.npy"), expected)
+    assert isinstance(npy, np.memmap)
+    reader.stitch_mosaic(tmp_path / "mosaic.zarr")
+    np.testing.assert_array_equal(zarr.open(str(tmp_path / "mosaic.zarr"))[:], expected)
+
+    # The mosaic is rechunked to the chunks of a zarr output
+    out_zarr = zarr.zeros(expected.shape, chunks=(2, 3, 4), dtype=expected.dtype)
+    assert reader.stitch_mosaic(out_zarr) is out_zarr
+    np.testing.assert_array_equal(out_zarr[:], expected)
+
+    # Caller provided output
+    out = np.zeros(expected.shape, dtype=expected.dtype)
+    assert reader.stitch_mosaic(out) is out
+    np.testing.assert_array_equal(out, expected)
+    with pytest.raises(ValueError):
+        reader.stitch_mosaic(np.zeros((2, 4, 14), dtype=np.uint16))
+
+    # Mosaic regions slice the stitched mosaic
+    np.testing.assert_array_equal(
+        reader.get_mosaic_region(3, 1, 4, 10, "YX", C=1), expected[1, 1:5, 3:7]
+    )
+
+
+def test_get_mosaic_tile_positions() -> None:
+    reader = RowMosaicArrayLikeReader(
+        np.zeros((3, 2, 4, 5), dtype=np.uint8), dim_order="MCYX"
+    )
+    positions = reader.get_mosaic_tile_positions()
+    np.testing.assert_array_equal(
+        positions, [[0, 0, 4, 5], [0, 5, 4, 5], [0, 10, 4, 5]]
+    )
+
+    # Cached and read-only
+    assert reader.get_mosaic_tile_positions() is positions
+    with pytest.raises(ValueError):
+        positions[0, 0] = 1
+
+    # Non-mosaic images have no tile positions
+    plain_reader = ArrayLikeReader(np.zeros((2, 4, 5), dtype=np.uint8), dim_order="CYX")
+    with pytest.raises(exceptions.UnexpectedShapeError):
+        plain_reader.get_mosaic_tile_positions()
@@ -1,14 +1,19 @@
 #! usr/env/bin/python
+import logging
 import os
 from itertools import product
 from pathlib import Path
+from typing import Any, Hashable, Tuple
 
 import numpy as np
+import pytest
 import tifffile as tiff
 import xarray as xr
 
 import aicsimageio
+from aicsimageio import exceptions
 from aicsimageio.readers.tiff_glob_reader import TiffGlobReader
+from aicsimageio.utils import io_utils
 
 DATA_SHAPE = (3, 4, 5, 6, 7, 8)  # STCZYX
 
@@ -69,12 +74,13 @@ def test_glob_reader_2d(tmp_path: Path) -> None:
 
 
 def test_mm_indexer(tmp_path: Path) -> None:
-    _ = make_fake_data_2d(tmp_path, True)
+    reference = make_fake_data_2d(tmp_path, True)
     gr = aicsimageio.readers.TiffGlobReader(
         str(tmp_path / "2d_images/*.tif"), indexer=TiffGlobReader.MicroManagerIndexer
     )
     assert gr.dims.order == "TCZYX"
     assert gr.dims.shape == DATA_SHAPE[1:]
+    check_values(gr, reference)
 
 
 def make_fake_data_3d(path: Path) -> xr.DataArray:
@@ -205,3 +211,153 @@ def test_aics_image(tmp_path: Path) -> None:
         tmp_path / "4d_images/*.tif", single_file_dims=list("TZYX")
     )
     assert isinstance(aicsimage_tiff_glob.reader, aicsimageio.readers.TiffGlobReader)
+
+
+def test_glob_reader_auto_chunk_dims(tmp_path: Path) -> None:
+    reference = make_fake_data_2d(tmp_path)
+
+    # Small planes are grouped across files up to the target chunk size
+    gr = aicsimageio.readers.TiffGlobReader(
+        str(tmp_path / "2d_images/*.tif"), chunk_dims="auto"
+    )
+    assert gr.chunk_dims == ["Y", "X", "Z", "C", "T", "S"]
+    assert gr.xarray_dask_data.data.chunksize == DATA_SHAPE[1:]
+    check_values(gr, reference)
+
+    # Unless an access pattern is declared
+    gr = aicsimageio.readers.TiffGlobReader(
+        str(tmp_path / "2d_images/*.tif"),
+        chunk_dims="auto",
+        chunk_access_hint="timeseries",
+    )
+    assert gr.xarray_dask_data.data.chunksize == (4, 1, 1, 7, 8)
+    check_values(gr, reference)
+
+
+def test_glob_reader_pattern_indexer(tmp_path: Path) -> None:
+    reference = make_fake_data_2d(tmp_path, True)
+
+    # Named groups are matched against every file name at once
+    gr = aicsimageio.readers.TiffGlobReader(
+        str(tmp_path / "2d_images/*.tif"),
+        indexer=r"channel(?P<C>\d+)_position(?P<S>\d+)_time(?P<T>\d+)_z(?P<Z>\d+)",
+        max_workers=2,
+    )
+    assert gr.dims.order == "TCZYX"
+    assert gr.dims.shape == DATA_SHAPE[1:]
+    check_values(gr, reference)
+
+    with pytest.raises(ValueError):
+        aicsimageio.readers.TiffGlobReader(
+            str(tmp_path / "2d_images/*.tif"), indexer=r"position(?P<S>\d+)_T"
+        )
+
+
+def test_glob_reader_trust_single_file_shape(tmp_path: Path) -> None:
+    reference = make_fake_data_2d(tmp_path)
+
+    gr = aicsimageio.readers.TiffGlobReader(
+        str(tmp_path / "2d_images/*.tif"), trust_single_file_shape=True
+    )
+    check_values(gr, reference)
+
+    # A file with a different shape is only caught by the header scan
+    tiff.imwrite(
+        str(tmp_path / "2d_images/S1_T2_C0_Z0.tif"),
+        np.zeros((8, 7), dtype=np.uint16),
+    )
+    gr = aicsimageio.readers.TiffGlobReader(str(tmp_path / "2d_images/*.tif"))
+    gr.set_scene(1)
+    with pytest.raises(exceptions.UnexpectedShapeError):
+        gr.dask_data
+
+    gr = aicsimageio.readers.TiffGlobReader(
+        str(tmp_path / "2d_images/*.tif"), trust_single_file_shape=True
+    )
+    gr.set_scene(1)
+    assert gr.dask_data.shape == DATA_SHAPE[1:]
+
+
+def test_glob_reader_default_indexer_invalid(tmp_path: Path) -> None:
+    _ = make_fake_data_2d(tmp_path)
+    tiff.imwrite(str(tmp_path / "2d_images/S0_T0_C0.tif"), np.zeros((7, 8)))
+
+    with pytest.raises(ValueError):
+        aicsimageio.readers.TiffGlobReader(str(tmp_path / "2d_images/*.tif"))
+
+
+def test_glob_reader_index(tmp_path: Path) -> None:
+    reference = make_fake_data_2d(tmp_path, True)
+    index_path = tmp_path / "index.json"
+
+    gr = aicsimageio.readers.TiffGlobReader(
+        str(tmp_path / "2d_images/*.tif"), indexer=TiffGlobReader.MicroManagerIndexer
+    )
+    gr.write_index(index_path)
+
+    # Re-opened without globbing or parsing file names
+    indexed = TiffGlobReader.from_index(index_path, chunk_dims="TZ")
+    assert indexed.dims.order == "TCZYX"
+    assert indexed.dims.shape == DATA_SHAPE[1:]
+    assert indexed.xarray_dask_data.data.chunksize == (4, 1, 6, 7, 8)
+    check_values(indexed, reference)
+
+    # Adding a file to the dataset directory makes the index stale
+    tiff.imwrite(
+        str(tmp_path / "2d_images/img_channel0_position9_time0_z0.tif"),
+        np.zeros((7, 8), dtype=np.uint16),
+    )
+    with pytest.raises(ValueError):
+        TiffGlobReader.from_index(index_path)
+
+    indexed = TiffGlobReader.from_index(index_path, check_staleness=False)
+    assert len(indexed.scenes) == DATA_SHAPE[0]
+
+
+def test_glob_reader_index_in_dataset_directory(tmp_path: Path) -> None:
+    reference = make_fake_data_2d(tmp_path)
+    index_path = tmp_path / "2d_images" / "index.json"
+
+    # Writing the index doesn't make it stale
+    aicsimageio.readers.TiffGlobReader(str(tmp_path / "2d_images/*.tif")).write_index(
+        index_path
+    )
+    check_values(TiffGlobReader.from_index(index_path), reference)
+
+    # Rewriting the index doesn't either
+    TiffGlobReader.from_index(index_path).write_index(index_path)
+    check_values(TiffGlobReader.from_index(index_path), reference)
+
+
+def test_glob_reader_index_validates_files(tmp_path: Path) -> None:
+    _ = make_fake_data_2d(tmp_path)
+    tiff.imwrite(
+        str(tmp_path / "2d_images/S1_T2_C3_Z4.tif"),
+        np.zeros((8, 7), dtype=np.uint16),
+    )
+
+    gr = aicsimageio.readers.TiffGlobReader(str(tmp_path / "2d_images/*.tif"))
+    with pytest.raises(exceptions.UnexpectedShapeError):
+        gr.write_index(tmp_path / "index.json")
+
+
+def test_glob_reader_index_without_modification_times(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch, caplog: pytest.LogCaptureFixture
+) -> None:
+    _ = make_fake_data_2d(tmp_path)
+    index_path = tmp_path / "index.json"
+
+    # Like directories on object stores, which only report a size
+    def size_only_signature(fs: Any, path: str) -> Tuple[Hashable, ...]:
+        return (fs.info(path).get("size"),)
+
+    monkeypatch.setattr(io_utils, "get_resource_signature", size_only_signature)
+
+    aicsimageio.readers.TiffGlobReader(str(tmp_path / "2d_images/*.tif")).write_index(
+        index_path
+    )
+    with caplog.at_level(logging.WARNING):
+        indexed = TiffGlobReader.from_index(index_path)
+
+    assert "has no modification time" in caplog.text
+    assert len(indexed.scenes) == DATA_SHAPE[0]
@@ -8,6 +8,7 @@ from typing import Any, Dict, List, Optional, Tuple, Type, Union
 
 import numpy as np
 import pytest
+import tifffile
 from distributed import Client, LocalCluster
 from ome_types import OME
 
@@ -868,3 +869,53 @@ def test_ome_metadata(filename: str) -> None:
 
     # Test the transform
     assert isinstance(img.ome_metadata, OME)
+
+
+def test_resolution_levels(tmp_path: Path) -> None:
+    path = tmp_path / "pyramid.ome.tiff"
+    data = np.random.randint(0, 255, (5, 512, 384), dtype=np.uint8)
+    with tifffile.TiffWriter(path) as tiff:
+        tiff.write(
+            data,
+            subifds=2,
+            tile=(128, 128),
+            photometric="minisblack",
+            metadata={
+                "axes": "ZYX",
+                "PhysicalSizeZ": 2.0,
+                "PhysicalSizeY": 0.5,
+                "PhysicalSizeX": 0.5,
+            },
+        )
+        for factor in (2, 4):
+            tiff.write(
+                data[:, ::factor, ::factor],
+                subfiletype=1,
+                tile=(128, 128),
+                photometric="minisblack",
+            )
+
+    reader = OmeTiffReader(path)
+    assert reader.resolution_levels == (0, 1, 2)
+    assert reader.current_resolution_level == 0
+    assert reader.shape == (1, 1, 5, 512, 384)
+
+    # Lower levels read the downsampled data with scaled pixel sizes and coords
+    reader.set_resolution_level(2)
+    assert reader.shape == (1, 1, 5, 128, 96)
+    assert reader.physical_pixel_sizes == (2.0, 2.0, 2.0)
+    np.testing.assert_array_equal(reader.xarray_dask_data.X.values[:3], [0, 2, 4])
+    np.testing.assert_array_equal(
+        reader.get_image_dask_data("ZYX").compute(), data[:, ::4, ::4]
+    )
+    np.testing.assert_array_equal(reader.get_image_data("ZYX"), data[:, ::4, ::4])
+
+    with pytest.raises(IndexError):
+        reader.set_resolution_level(3)
+
+    # AICSImage follows the reader
+    img = AICSImage(path)
+    img.set_resolution_level(1)
+    assert img.shape == (1, 1, 5, 256, 192)
+    assert img.physical_pixel_sizes == (2.0, 1.0, 1.0)
+    np.testing.assert_array_equal(img.get_image_data("ZYX"), data[:, ::2, ::2])
@@ -0,0 +1,180 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+from pathlib import Path
+from typing import List, Optional, Tuple
+
+import numpy as np
+import pytest
+import zarr
+
+from aicsimageio import AICSImage, dimensions, exceptions, types
+from aicsimageio.readers import OmeZarrReader
+from aicsimageio.writers import OmeZarrWriter
+
+from ..image_container_test_utils import run_image_file_checks
+
+
+@pytest.mark.parametrize(
+    "write_shape, write_dim_order, channel_names, expected_shape, "
+    "expected_channel_names",
+    [
+        ((40, 50), "YX", None, (1, 1, 1, 40, 50), ["Channel:0:0"]),
+        (
+            (2, 3, 40, 50),
+            "CZYX",
+            ["A", "B"],
+            (1, 2, 3, 40, 50),
+            ["A", "B"],
+        ),
+    ],
+)
+def test_ome_zarr_reader(
+    write_shape: Tuple[int, ...],
+    write_dim_order: str,
+    channel_names: Optional[List[str]],
+    expected_shape: Tuple[int, ...],
+    expected_channel_names: List[str],
+    tmp_path: Path,
+) -> None:
+    data = np.random.randint(0, 2**16, write_shape, dtype=np.uint16)
+    save_path = tmp_path / "e.ome.zarr"
+    OmeZarrWriter.save(
+        data,
+        save_path,
+        dim_order=write_dim_order,
+        channel_names=channel_names,
+        physical_pixel_sizes=types.PhysicalPixelSizes(2.0, 0.5, 0.25),
+    )
+
+    reader = run_image_file_checks(
+        ImageContainer=OmeZarrReader,
+        image=save_path,
+        set_scene="Image:0",
+        expected_scenes=("Image:0",),
+        expected_current_scene="Image:0",
+        expected_shape=expected_shape,
+        expected_dtype=np.dtype(np.uint16),
+        expected_dims_order=dimensions.DEFAULT_DIMENSION_ORDER,
+        expected_channel_names=expected_channel_names,
+        expected_physical_pixel_sizes=(2.0, 0.5, 0.25),
+        expected_metadata_type=dict,
+    )
+    np.testing.assert_array_equal(reader.data.reshape(write_shape), data)
+
+    # NGFF metadata is transformed into OME metadata
+    pixels = reader.ome_metadata.images[0].pixels
+    assert [channel.name for channel in pixels.channels] == expected_channel_names
+    assert (pixels.physical_size_z, pixels.physical_size_x) == (2.0, 0.25)
+
+
+def test_ome_zarr_reader_chunks(tmp_path: Path) -> None:
+    data = np.random.randint(0, 2**8, (2, 3, 40, 50), dtype=np.uint8)
+    save_path = tmp_path / "chunks.ome.zarr"
+    OmeZarrWriter.save(data, save_path, dim_order="CZYX", chunks=(1, 1, 3, 16, 16))
+
+    reader = OmeZarrReader(save_path)
+    stored = zarr.open_group(str(save_path), mode="r")["0"]
+
+    # A single task for every stored chunk
+    dask_data = reader.dask_data
+    assert tuple(max(dim_chunks) for dim_chunks in dask_data.chunks) == stored.chunks
+    assert dask_data.npartitions == stored.nchunks
+    np.testing.assert_array_equal(reader.get_image_dask_data("CZYX").compute(), data)
+
+
+def test_ome_zarr_reader_resolution_levels(tmp_path: Path) -> None:
+    data = np.random.randint(0, 2**8, (2, 40, 50), dtype=np.uint8)
+    save_path = tmp_path / "pyramid.ome.zarr"
+    OmeZarrWriter.save(
+        data,
+        save_path,
+        dim_order="CYX",
+        physical_pixel_sizes=types.PhysicalPixelSizes(None, 0.5, 0.25),
+        pyramid_levels=2,
+    )
+
+    reader = OmeZarrReader(save_path)
+    assert reader.resolution_levels == (0, 1, 2)
+
+    reader.set_resolution_level(2)
+    assert reader.shape == (1, 2, 1, 10, 13)
+    assert reader.physical_pixel_sizes == types.PhysicalPixelSizes(1.0, 2.0, 1.0)
+    np.testing.assert_array_equal(
+        reader.get_image_data("CYX"),
+        zarr.open_group(str(save_path), mode="r")["2"][0, :, 0],
+    )
+
+    reader.set_resolution_level(0)
+    assert reader.shape == (1, 2, 1, 40, 50)
+
+
+def test_ome_zarr_reader_multi_image_fsspec() -> None:
+    first = np.random.randint(0, 2**8, (2, 3, 20, 30), dtype=np.uint8)
+    second = np.random.randint(0, 2**8, (20, 30), dtype=np.uint8)
+    uri = "memory://reader.ome.zarr"
+    OmeZarrWriter.save(
+        [first, second],
+        uri,
+        dim_order=["CZYX", "YX"],
+        channel_names=[["A", "B"], None],
+        image_name=["first", "second"],
+    )
+
+    reader = OmeZarrReader(uri)
+    assert reader.scenes == ("first", "second")
+    assert reader.channel_names == ["A", "B"]
+    np.testing.assert_array_equal(reader.get_image_data("CZYX"), first)
+
+    reader.set_scene("second")
+    assert reader.shape == (1, 1, 1, 20, 30)
+    np.testing.assert_array_equal(reader.get_image_data("YX"), second)
+
+    # The bioformats2raw layout OME-XML metadata is read from the store
+    assert [image.name for image in reader.ome_metadata.images] == ["first", "second"]
+
+    # Detected by the AICSImage object
+    img = AICSImage(uri)
+    assert isinstance(img.reader, OmeZarrReader)
+    assert img.scenes == ("first", "second")
+
+
+def test_ome_zarr_reader_ngff_units(tmp_path: Path) -> None:
+    save_path = tmp_path / "units.zarr"
+    group = zarr.open_group(str(save_path), mode="w")
+    group.create_dataset("0", data=np.zeros((3, 4, 5), dtype=np.uint8))
+    group.attrs["multiscales"] = [
+        {
+            "version": "0.4",
+            "axes": [
+                {"name": "z", "type": "space", "unit": "nanometer"},
+                {"name": "y", "type": "space", "unit": "micrometer"},
+                {"name": "x", "type": "space"},
+            ],
+            "datasets": [
+                {
+                    "path": "0",
+                    "coordinateTransformations": [
+                        {"type": "scale", "scale": [500.0, 0.5, 0.25]}
+                    ],
+                }
+            ],
+        }
+    ]
+
+    img = AICSImage(save_path)
+    assert isinstance(img.reader, OmeZarrReader)
+    assert img.reader.dims.order == "ZYX"
+    assert img.physical_pixel_sizes == types.PhysicalPixelSizes(0.5, 0.5, 0.25)
+    assert img.reader.channel_names is None
+
+
+def test_ome_zarr_reader_unsupported(tmp_path: Path) -> None:
+    save_path = tmp_path / "plain.zarr"
+    zarr.open_group(str(save_path), mode="w").create_dataset(
+        "0", data=np.zeros((4, 5), dtype=np.uint8)
+    )
+
+    assert not OmeZarrReader.is_supported_image(save_path)
+    with pytest.raises(exceptions.UnsupportedFileFormatError):
+        OmeZarrReader(save_path)
@@ -8,6 +8,8 @@ from typing import Any, Dict, List, Optional, Tuple, Type, Union
 
 import numpy as np
 import pytest
+import tifffile
+from dask.core import flatten
 from distributed import Client, LocalCluster
 
 from aicsimageio import AICSImage, dimensions, exceptions
@@ -748,3 +750,105 @@ def test_no_scene_prop_access(
     # Construct image and check no scene call with property access
     img = AICSImage(uri)
     assert img.shape == expected_shape
+
+
+def test_tiled_tiff_region_read(tmp_path: Path) -> None:
+    path = tmp_path / "tiled.tiff"
+    data = np.random.randint(0, 2**16, (5, 1000, 1200), dtype=np.uint16)
+    tifffile.imwrite(path, data, tile=(256, 256), photometric="minisblack")
+
+    # Tiled planes are read whole by default
+    reader = TiffReader(path)
+    assert reader.dask_data.chunks == ((5,), (1000,), (1200,))
+
+    # Large tiled planes are chunked along Y and X in blocks of whole tiles
+    reader = TiffReader(path, tile_chunk_bytes=2**20)
+    assert reader.dask_data.chunks == (
+        (5,),
+        (256, 256, 256, 232),
+        (256, 256, 256, 256, 176),
+    )
+    np.testing.assert_array_equal(reader.dask_data.compute(), data)
+    img = AICSImage(path, tile_chunk_bytes=2**20)
+    assert img.dask_data.chunks[-2:] == reader.dask_data.chunks[-2:]
+
+    # Blocks group multiple tiles when they fit in the block byte budget
+    reader = TiffReader(path, chunk_dims="YX", tile_chunk_bytes=2**20)
+    assert reader.dask_data.chunks == (
+        (1,) * 5,
+        (512, 488),
+        (512, 512, 176),
+    )
+
+    # Region reads only compute the intersecting blocks
+    region = reader.get_image_dask_data(
+        "YX", Z=3, Y=slice(600, 700), X=slice(1100, 1150)
+    )
+    culled = region.dask.cull(set(flatten(region.__dask_keys__())))
+    assert len([key for key in culled if key[0].startswith("tiff-read")]) == 1
+    np.testing.assert_array_equal(
+        reader.get_image_data("YX", Z=3, Y=slice(600, 700), X=slice(1100, 1150)),
+        data[3, 600:700, 1100:1150],
+    )
+    assert reader._xarray_data is None
+
+    # Small tiled planes are still read as whole planes
+    small_path = tmp_path / "small-tiled.tiff"
+    tifffile.imwrite(small_path, data[:, :256, :256], tile=(128, 128))
+    reader = TiffReader(small_path, tile_chunk_bytes=2**20)
+    assert reader.dask_data.chunks == ((5,), (256,), (256,))
+
+
+def test_auto_chunk_dims(tmp_path: Path) -> None:
+    path = tmp_path / "stack.tiff"
+    data = np.random.randint(0, 2**16, (3, 4, 64, 64), dtype=np.uint16)
+    tifffile.imwrite(path, data, photometric="minisblack", metadata={"axes": "TZYX"})
+
+    # Small planes are grouped into whole stacks and timeseries
+    reader = TiffReader(path, chunk_dims="auto")
+    assert reader.dask_data.chunksize == data.shape
+    assert set(reader.chunk_dims) >= {"T", "Z", "Y", "X"}
+    np.testing.assert_array_equal(reader.data, data)
+
+    # An access hint only chunks by the hinted dims
+    reader = TiffReader(path, chunk_dims="auto", chunk_access_hint="plane")
+    assert reader.dask_data.chunksize == (1, 1, 64, 64)
+    np.testing.assert_array_equal(reader.data, data)
+
+    with pytest.raises(ValueError):
+        TiffReader(path, chunk_dims="auto", chunk_access_hint="bad").dask_data
+
+
+def test_resolution_levels_per_scene(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    path = tmp_path / "scenes.tiff"
+    data = np.random.randint(0, 255, (64, 64), dtype=np.uint8)
+    with tifffile.TiffWriter(path) as tiff:
+        tiff.write(data, subifds=1, photometric="minisblack")
+        tiff.write(data[::2, ::2], subfiletype=1, photometric="minisblack")
+        tiff.write(data, photometric="minisblack")
+
+    reader = TiffReader(path)
+    assert reader.resolution_levels == (0, 1)
+
+    # Levels are counted once per scene and kept with the scene state
+    opened: List[str] = []
+    open_file = reader._fs.open
+
+    def counting_open(path: str, *args: Any, **kwargs: Any) -> Any:
+        opened.append(path)
+        return open_file(path, *args, **kwargs)
+
+    monkeypatch.setattr(reader._fs, "open", counting_open)
+    reader.set_resolution_level(1)
+    reader.set_resolution_level(0)
+    assert reader.resolution_levels == (0, 1)
+    assert len(opened) == 0
+
+    reader.set_scene(1)
+    assert reader.resolution_levels == (0,)
+    reader.set_scene(0)
+    opened.clear()
+    assert reader.resolution_levels == (0, 1)
+    assert len(opened) == 0
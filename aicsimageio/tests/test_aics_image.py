@@ -1,9 +1,17 @@
 #!/usr/bin/env python
 # -*- coding: utf-8 -*-
 
+from pathlib import Path
+from typing import Callable, List
+
+import imageio
+import numpy as np
 import pytest
+import tifffile
 
-from aicsimageio import AICSImage, exceptions
+from aicsimageio import AICSImage, exceptions, types
+from aicsimageio.types import PhysicalPixelSizes
+from aicsimageio.writers import OmeTiffWriter
 
 from .conftest import LOCAL, get_resource_full_path
 
@@ -27,3 +35,147 @@ def test_aicsimage(
     # Construct full filepath
     uri = get_resource_full_path(filename, LOCAL)
     AICSImage(uri)
+
+
+def test_aicsimage_metadata_cache(tmp_path: Path) -> None:
+    path = tmp_path / "scenes.ome.tiff"
+    cache_dir = tmp_path / "metadata"
+    first_scene = np.random.randint(0, 255, (2, 3, 16, 16), dtype=np.uint8)
+    second_scene = np.random.randint(0, 255, (4, 8, 8), dtype=np.uint16)
+    OmeTiffWriter.save(
+        [first_scene, second_scene],
+        path,
+        dim_order=["CZYX", "ZYX"],
+        physical_pixel_sizes=[
+            PhysicalPixelSizes(1.0, 0.5, 0.5),
+            PhysicalPixelSizes(2.0, 1.0, 1.0),
+        ],
+    )
+
+    # First open parses everything and stores the description of each used scene
+    img = AICSImage(path, metadata_cache_dir=cache_dir)
+    expected = {}
+    for scene in img.scenes:
+        img.set_scene(scene)
+        expected[scene] = (
+            img.dims.order,
+            img.shape,
+            img.dtype,
+            img.channel_names,
+            img.physical_pixel_sizes,
+        )
+    expected_ome = img.ome_metadata
+
+    # Re-opening is described entirely by the cache without constructing a reader
+    img = AICSImage(path, metadata_cache_dir=cache_dir)
+    assert img.scenes == tuple(expected.keys())
+    for scene in img.scenes:
+        img.set_scene(scene)
+        assert (
+            img.dims.order,
+            img.shape,
+            img.dtype,
+            img.channel_names,
+            img.physical_pixel_sizes,
+        ) == expected[scene]
+    assert img.ome_metadata == expected_ome
+    assert img._reader is None
+
+    # Reading data constructs the reader for the current scene
+    np.testing.assert_array_equal(
+        img.get_image_data("ZYX", T=0, C=0),
+        second_scene,
+    )
+    assert img._reader is not None
+
+    # Unknown scenes still error without a reader
+    img = AICSImage(path, metadata_cache_dir=cache_dir)
+    with pytest.raises(IndexError):
+        img.set_scene("not-a-scene")
+
+    # A rewritten file is parsed again
+    OmeTiffWriter.save(first_scene[0], path, dim_order="ZYX")
+    img = AICSImage(path, metadata_cache_dir=cache_dir)
+    assert img._reader is not None
+    assert img.shape == (1, 1, 3, 16, 16)
+
+
+def test_aicsimage_scene_cache() -> None:
+    scenes: List[types.MetaArrayLike] = [
+        np.random.rand(2, 8, 8),
+        np.random.rand(3, 4, 4),
+    ]
+    img = AICSImage(scenes, dim_order="CYX")
+    img.set_scene_cache_size(max_in_memory_scenes=1)
+
+    # Switching back to a recently used scene reuses the read data
+    first_data = img.data
+    img.set_scene(1)
+    second_dask_data = img.dask_data
+    assert img.dims.C == 3
+    img.set_scene(0)
+    assert img.data is first_data
+    assert img.dims.C == 2
+    img.set_scene(1)
+    assert img.dask_data is second_dask_data
+    assert img.dims.C == 3
+
+
+def _write_tiff(path: Path) -> None:
+    tifffile.imwrite(path, np.zeros((2, 8, 8), dtype=np.uint8))
+
+
+def _write_bigtiff(path: Path) -> None:
+    tifffile.imwrite(path, np.zeros((2, 8, 8), dtype=np.uint8), bigtiff=True)
+
+
+def _write_ome_tiff(path: Path) -> None:
+    OmeTiffWriter.save(np.zeros((2, 8, 8), dtype=np.uint8), path, dim_order="ZYX")
+
+
+def _write_png(path: Path) -> None:
+    imageio.imwrite(path, np.zeros((8, 8), dtype=np.uint8), format="png")
+
+
+def _write_jpeg_with_dv_magic(path: Path) -> None:
+    imageio.imwrite(path, np.zeros((8, 8), dtype=np.uint8), format="jpeg")
+
+    # Quantization table values that happen to match the (weak) DV signature
+    with open(path, "r+b") as open_resource:
+        open_resource.seek(96)
+        open_resource.write(b"\xa0\xc0")
+
+
+@pytest.mark.parametrize(
+    "writer, filename, expected_reader",
+    [
+        (_write_tiff, "5a1b3e2f", "TiffReader"),
+        (_write_bigtiff, "5a1b3e2f", "TiffReader"),
+        (_write_ome_tiff, "5a1b3e2f", "OmeTiffReader"),
+        (_write_ome_tiff, "5a1b3e2f.ome.tiff", "OmeTiffReader"),
+        (_write_tiff, "5a1b3e2f.tif", "TiffReader"),
+        # Misleading extensions are resolved by the file signature
+        (_write_tiff, "5a1b3e2f.png", "TiffReader"),
+        (_write_png, "5a1b3e2f", "DefaultReader"),
+        (_write_jpeg_with_dv_magic, "5a1b3e2f", "DefaultReader"),
+    ],
+)
+def test_determine_reader_file_signature(
+    tmp_path: Path,
+    writer: Callable[[Path], None],
+    filename: str,
+    expected_reader: str,
+) -> None:
+    path = tmp_path / filename
+    writer(path)
+
+    assert AICSImage.determine_reader(path).__name__ == expected_reader
+
+
+def test_aicsimage_mosaic_region_without_tiles() -> None:
+    img = AICSImage(np.zeros((2, 16, 16), dtype=np.uint8), dim_order="ZYX")
+
+    with pytest.raises(exceptions.UnexpectedShapeError):
+        img.get_mosaic_region(0, 0, 8, 8)
+    with pytest.raises(exceptions.UnexpectedShapeError):
+        img.reader.get_mosaic_region_dask_data(0, 0, 8, 8)
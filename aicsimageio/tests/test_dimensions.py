@@ -5,7 +5,7 @@ from typing import Collection, Tuple
 
 import pytest
 
-from aicsimageio.dimensions import Dimensions
+from aicsimageio.dimensions import Dimensions, guess_chunk_dims
 
 
 def test_dimensions_getitem() -> None:
@@ -75,3 +75,39 @@ def test_dimensions_bad_iterable_of_characters(
 ) -> None:
     # Just check success
     assert Dimensions(dims, shape)
+
+
+@pytest.mark.parametrize(
+    "dims, shape, access_hint, expected",
+    [
+        # Grow along the stored order while the chunk fits
+        ("TCZYX", (10, 3, 60, 600, 900), None, ["Y", "X", "Z"]),
+        ("TZCYX", (10, 60, 3, 600, 900), None, ["Y", "X", "C"]),
+        # Planes larger than the target are never grown
+        ("TCZYX", (10, 3, 60, 8000, 8000), None, ["Y", "X"]),
+        # Mosaic tiles are never chunked
+        ("MZYX", (4, 3, 256, 256), None, ["Y", "X", "Z"]),
+        # Access hints always chunk their dims
+        ("TCZYX", (10, 3, 60, 600, 900), "plane", ["Y", "X"]),
+        ("TCZYX", (10, 3, 60, 8000, 8000), "stack", ["Y", "X", "Z"]),
+        ("TCZYX", (10, 3, 60, 600, 900), "timeseries", ["Y", "X", "T"]),
+        ("ZYXS", (60, 600, 900, 3), "channels", ["Y", "X", "S"]),
+    ],
+)
+def test_guess_chunk_dims(
+    dims: str,
+    shape: Tuple[int, ...],
+    access_hint: str,
+    expected: Collection[str],
+) -> None:
+    assert (
+        guess_chunk_dims(
+            dims, shape, 2, access_hint=access_hint, target_chunk_bytes=2**27
+        )
+        == expected
+    )
+
+
+def test_guess_chunk_dims_bad_access_hint() -> None:
+    with pytest.raises(ValueError):
+        guess_chunk_dims("ZYX", (3, 4, 5), 1, access_hint="blarg")
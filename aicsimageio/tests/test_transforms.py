@@ -14,9 +14,11 @@ from aicsimageio import AICSImage, types
 from aicsimageio.exceptions import ConflictingArgumentsError, UnexpectedShapeError
 from aicsimageio.readers import ArrayLikeReader
 from aicsimageio.transforms import (
+    downsample,
     generate_stack,
     reduce_to_slice,
     reshape_data,
+    resolve_downsample_factors,
     transpose_to_dims,
 )
 
@@ -552,3 +554,70 @@ def test_convert_list_to_slice(
     list_to_test: Union[List, Tuple], expected: Union[int, List, slice, Tuple]
 ) -> None:
     assert reduce_to_slice(list_to_test) == expected
+
+
+@pytest.mark.parametrize(
+    "method, expected",
+    [
+        ("mean", [[4, 6, 8, 10], [18, 20, 22, 24], [28, 30, 32, 34]]),
+        ("nearest", [[0, 2, 4, 6], [14, 16, 18, 20], [28, 30, 32, 34]]),
+        ("max", [[8, 10, 12, 13], [22, 24, 26, 27], [29, 31, 33, 34]]),
+    ],
+)
+@pytest.mark.parametrize("as_dask", [False, True])
+def test_downsample(method: str, expected: List[List[int]], as_dask: bool) -> None:
+    data = np.arange(2 * 5 * 7, dtype=np.uint16).reshape(2, 5, 7)
+    if as_dask:
+        data = da.from_array(data, chunks=(1, 3, 3))
+
+    downsampled = downsample(data, (1, 2, 2), method=method)
+    assert isinstance(downsampled, type(data))
+    assert downsampled.dtype == np.uint16
+    assert downsampled.shape == (2, 3, 4)
+    np.testing.assert_array_equal(np.asarray(downsampled)[0], expected)
+
+
+@pytest.mark.parametrize(
+    "factors, method",
+    [
+        pytest.param((2, 2), "mean", marks=pytest.mark.xfail(raises=ValueError)),
+        pytest.param((1, 0, 2), "mean", marks=pytest.mark.xfail(raises=ValueError)),
+        pytest.param((1, 2, 2), "median", marks=pytest.mark.xfail(raises=ValueError)),
+    ],
+)
+def test_downsample_invalid(factors: Tuple[int, ...], method: str) -> None:
+    downsample(np.zeros((2, 5, 7)), factors, method=method)
+
+
+@pytest.mark.parametrize(
+    "pyramid_levels, downsample_factors, method, expected",
+    [
+        (None, None, "mean", []),
+        (0, None, "mean", []),
+        (3, None, "max", [2, 2, 2]),
+        (None, [3, 4], "nearest", [3, 4]),
+        pytest.param(
+            2,
+            [2],
+            "mean",
+            None,
+            marks=pytest.mark.xfail(raises=ConflictingArgumentsError),
+        ),
+        pytest.param(
+            None, [2, 1], "mean", None, marks=pytest.mark.xfail(raises=ValueError)
+        ),
+        pytest.param(
+            2, None, "median", None, marks=pytest.mark.xfail(raises=ValueError)
+        ),
+    ],
+)
+def test_resolve_downsample_factors(
+    pyramid_levels: Optional[int],
+    downsample_factors: Optional[List[int]],
+    method: str,
+    expected: List[int],
+) -> None:
+    assert (
+        resolve_downsample_factors(pyramid_levels, downsample_factors, method=method)
+        == expected
+    )
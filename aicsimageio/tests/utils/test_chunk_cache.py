@@ -0,0 +1,98 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+from pathlib import Path
+from typing import Iterator
+
+import numpy as np
+import pytest
+import tifffile
+
+from aicsimageio.readers import TiffReader
+from aicsimageio.utils.chunk_cache import CHUNK_CACHE, ChunkCache
+
+
+@pytest.fixture
+def enabled_chunk_cache() -> Iterator[ChunkCache]:
+    CHUNK_CACHE.clear()
+    CHUNK_CACHE.resize(2**20)
+    yield CHUNK_CACHE
+    CHUNK_CACHE.resize(0)
+    CHUNK_CACHE.clear()
+
+
+def test_chunk_cache_byte_budget() -> None:
+    cache = ChunkCache(max_bytes=200)
+    for i in range(3):
+        cache.put(i, np.full(10, i, dtype=np.uint64))
+
+    # Only two 80 byte chunks fit, the least recently used was evicted
+    assert len(cache) == 2
+    assert cache.get(0) is None
+    chunk = cache.get(2)
+    assert chunk is not None
+    np.testing.assert_array_equal(chunk, 2)
+
+    # Chunks larger than the budget are never stored
+    cache.put(3, np.zeros(100, dtype=np.uint64))
+    assert cache.get(3) is None
+
+    # Returned chunks are copies
+    chunk = cache.get(1)
+    assert chunk is not None
+    chunk[:] = 100
+    chunk = cache.get(1)
+    assert chunk is not None
+    np.testing.assert_array_equal(chunk, 1)
+
+    assert cache.stats.hits == 3
+    assert cache.stats.misses == 2
+    assert cache.stats.evictions == 1
+    assert cache.stats.current_bytes == 160
+
+
+def test_chunk_cache_disabled() -> None:
+    cache = ChunkCache()
+    cache.put("a", np.zeros(4))
+    assert cache.get("a") is None
+    assert len(cache) == 0
+    assert cache.stats.misses == 0
+
+
+def test_tiff_reader_chunk_cache(
+    tmp_path: Path, enabled_chunk_cache: ChunkCache
+) -> None:
+    path = tmp_path / "stack.tiff"
+    data = np.arange(5 * 16 * 16, dtype=np.uint16).reshape((5, 16, 16))
+    tifffile.imwrite(path, data)
+
+    reader = TiffReader(path, chunk_dims="YX")
+    np.testing.assert_array_equal(reader.dask_data.compute(), data)
+    assert enabled_chunk_cache.stats.misses == 5
+    assert enabled_chunk_cache.stats.hits == 0
+
+    # A new reader of the same unchanged file is served from the cache
+    reader = TiffReader(path, chunk_dims="YX")
+    np.testing.assert_array_equal(reader.dask_data.compute(), data)
+    assert enabled_chunk_cache.stats.hits == 5
+
+    # A rewritten file is never served stale chunks
+    tifffile.imwrite(path, data[:, :8, :8] + 1)
+    reader = TiffReader(path, chunk_dims="YX")
+    np.testing.assert_array_equal(reader.dask_data.compute(), data[:, :8, :8] + 1)
+    assert enabled_chunk_cache.stats.hits == 5
+
+
+def test_chunk_cache_key_skipped_when_disabled(tmp_path: Path) -> None:
+    path = tmp_path / "plane.tiff"
+    tifffile.imwrite(path, np.zeros((16, 16), dtype=np.uint8))
+    reader = TiffReader(path)
+
+    # The resource signature is only retrieved when chunks can be cached
+    assert reader._get_chunk_cache_key(["Y", "X"]) is None
+
+    CHUNK_CACHE.resize(2**20)
+    try:
+        assert reader._get_chunk_cache_key(["Y", "X"]) is not None
+    finally:
+        CHUNK_CACHE.resize(0)
@@ -0,0 +1,156 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+from typing import Tuple
+
+import dask.array as da
+import numpy as np
+import pytest
+from dask.core import flatten
+
+from aicsimageio.utils.dask_utils import (
+    crop_regions,
+    from_block_function,
+    iter_planes,
+    paste_regions,
+)
+
+
+def _block_sum(block_index: Tuple[int, ...]) -> np.ndarray:
+    return np.full((2, 3), sum(block_index), dtype=np.uint16)
+
+
+@pytest.mark.parametrize(
+    "grid_shape, expected_shape",
+    [
+        ((), (2, 3)),
+        ((4,), (4, 2, 3)),
+        ((4, 5), (4, 5, 2, 3)),
+    ],
+)
+def test_from_block_function(
+    grid_shape: Tuple[int, ...], expected_shape: Tuple[int, ...]
+) -> None:
+    arr = from_block_function(_block_sum, grid_shape, (2, 3), np.uint16)
+
+    # A single graph layer regardless of the number of blocks
+    assert len(arr.dask.layers) == 1
+    assert arr.shape == expected_shape
+    assert arr.dtype == np.uint16
+
+    data = arr.compute()
+    for block_index in np.ndindex(*grid_shape):
+        np.testing.assert_array_equal(data[block_index], sum(block_index))
+
+    # Slicing a single block only reads that block
+    if len(grid_shape) > 0:
+        last = tuple(size - 1 for size in grid_shape)
+        np.testing.assert_array_equal(arr[last].compute(), sum(last))
+
+
+def test_from_block_function_split_chunk_dims() -> None:
+    read = []
+
+    def read_block(block_index: Tuple[int, ...]) -> np.ndarray:
+        read.append(block_index)
+        y_size = (4, 4, 2)[block_index[1]]
+        return np.full((y_size, 5), block_index[1], dtype=np.uint8)
+
+    arr = from_block_function(read_block, (3,), ((4, 4, 2), 5), np.uint8)
+    assert arr.shape == (3, 10, 5)
+    assert arr.chunks == ((1, 1, 1), (4, 4, 2), (5,))
+    np.testing.assert_array_equal(arr[0, :, 0].compute(), [0] * 4 + [1] * 4 + [2] * 2)
+
+    # Only the blocks intersecting a selection are read
+    read.clear()
+    arr[2, 5:7].compute()
+    assert read == [(2, 1, 0)]
+
+
+def test_paste_regions() -> None:
+    # Three channels of four overlapping 6x8 tiles, tile index first
+    tiles = np.random.randint(1, 255, (4, 3, 6, 8), dtype=np.uint8)
+    data = da.from_array(tiles, chunks=(1, 1, 6, 8))
+    positions = [(0, 0), (0, 6), (5, 0), (5, 6)]
+
+    regions = []
+    expected = np.zeros((3, 11, 14), dtype=np.uint8)
+    for channel in range(3):
+        for tile, (y, x) in enumerate(positions):
+            dest = (channel, slice(y, y + 6), slice(x, x + 8))
+            regions.append(((tile, channel, slice(None), slice(None)), dest))
+            expected[dest] = tiles[tile, channel]
+
+    chunks = ((1, 1, 1), (5, 6), (6, 8))
+    arr = paste_regions(data, (3, 11, 14), chunks, regions)
+
+    # A single graph layer on top of the data
+    assert len(arr.dask.layers) == 2
+    assert arr.chunks == chunks
+    np.testing.assert_array_equal(arr.compute(), expected)
+
+    # An output chunk only depends on the tiles it overlaps
+    selection = arr[1, :5, :6]
+    culled = selection.dask.cull(set(flatten(selection.__dask_keys__())))
+    assert {key[1:] for key in culled if key[0] == data.name} == {(0, 1, 0, 0)}
+
+    # Regions spanning multiple source and output chunks are split between them
+    split_data = da.from_array(tiles, chunks=(2, 2, 4, 3))
+    split_chunks = ((2, 1), (4, 4, 3), (7, 7))
+    arr = paste_regions(split_data, (3, 11, 14), split_chunks, regions)
+    assert arr.chunks == split_chunks
+    np.testing.assert_array_equal(arr.compute(), expected)
+
+    with pytest.raises(ValueError):
+        paste_regions(data, (3, 11, 14), ((3,), (11,), (13,)), regions)
+    with pytest.raises(ValueError):
+        paste_regions(
+            data, (3, 11, 14), chunks, [((0, 0, 0, slice(None)), (0, 0, slice(4)))]
+        )
+
+
+def test_crop_regions() -> None:
+    tiles = np.random.randint(1, 255, (4, 6, 8), dtype=np.uint8)
+    positions = [(0, 0), (0, 6), (5, 0), (5, 6)]
+    regions = [
+        ((tile, slice(None), slice(None)), (slice(y, y + 6), slice(x, x + 8)))
+        for tile, (y, x) in enumerate(positions)
+    ]
+    expected = np.zeros((11, 14), dtype=np.uint8)
+    for source, dest in regions:
+        expected[dest] = tiles[source]
+
+    # Only the intersecting tiles are kept
+    shape, cropped = crop_regions(
+        regions, tiles.shape, (11, 14), [slice(1, 4), slice(7, 20)]
+    )
+    assert shape == [3, 7]
+    assert [source[0] for source, _ in cropped] == [0, 1]
+
+    arr = paste_regions(
+        da.from_array(tiles, chunks=(1, 6, 8)), shape, ((3,), (7,)), cropped
+    )
+    np.testing.assert_array_equal(arr.compute(), expected[1:4, 7:20])
+
+
+def test_iter_planes() -> None:
+    data = np.arange(3 * 4 * 5 * 6, dtype=np.uint16).reshape((3, 4, 5, 6))
+    arr = da.from_array(data, chunks=(1, 2, 5, 6))
+
+    planes = iter_planes(arr, n_plane_dims=2, max_batches_in_flight=1)
+    assert isinstance(next(planes), np.ndarray)
+    np.testing.assert_array_equal(
+        np.stack([data[0, 0]] + list(planes)), data.reshape((12, 5, 6))
+    )
+
+    # Batches computed concurrently are still yielded in order
+    planes = iter_planes(arr, n_plane_dims=2, max_batches_in_flight=4, max_workers=3)
+    np.testing.assert_array_equal(np.stack(list(planes)), data.reshape((12, 5, 6)))
+
+    # Irregular chunks are still read whole
+    arr = da.from_array(data, chunks=((2, 1), (3, 1), 5, 6))
+    planes = iter_planes(arr, n_plane_dims=2, max_batches_in_flight=2)
+    np.testing.assert_array_equal(np.stack(list(planes)), data.reshape((12, 5, 6)))
+
+    # Without leading dims the whole array is a single plane
+    assert len(list(iter_planes(arr[0, 0], n_plane_dims=0))) == 1
@@ -0,0 +1,78 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+import os
+import pickle
+from pathlib import Path
+
+import numpy as np
+import tifffile
+
+from aicsimageio import AICSImage
+from aicsimageio.utils.disk_chunk_cache import DiskChunkCache
+
+
+def test_disk_chunk_cache_lru_eviction(tmp_path: Path) -> None:
+    # Each 100 element uint64 chunk is 800 bytes of data plus the npy header
+    cache = DiskChunkCache(tmp_path / "cache", max_bytes=2000)
+    for i in range(2):
+        cache.put(("chunk", i), np.full(100, i, dtype=np.uint64))
+
+    # Make chunk 0 the oldest then mark it as recently used by reading it
+    chunk_0_path = cache._chunk_path(("chunk", 0))
+    os.utime(chunk_0_path, (0, 0))
+    chunk = cache.get(("chunk", 0))
+    assert chunk is not None
+    np.testing.assert_array_equal(chunk, 0)
+
+    # Adding a third chunk evicts the least recently used (chunk 1)
+    cache.put(("chunk", 2), np.full(100, 2, dtype=np.uint64))
+    assert len(cache) == 2
+    assert cache.current_bytes <= 2000
+    assert cache.get(("chunk", 1)) is None
+    for i in [0, 2]:
+        chunk = cache.get(("chunk", i))
+        assert chunk is not None
+        np.testing.assert_array_equal(chunk, i)
+
+    # Chunks larger than the cap are never written
+    cache.put(("chunk", 3), np.zeros(1000, dtype=np.uint64))
+    assert cache.get(("chunk", 3)) is None
+
+    cache.clear()
+    assert len(cache) == 0
+
+
+def test_disk_chunk_cache_shared_between_instances(tmp_path: Path) -> None:
+    cache = DiskChunkCache(tmp_path)
+    cache.put("a", np.arange(10))
+
+    # Another process (here a pickled copy) sees the same chunks
+    other = pickle.loads(pickle.dumps(cache))
+    np.testing.assert_array_equal(other.get("a"), np.arange(10))
+    assert other.get("b") is None
+
+    # No temporary files are left behind
+    assert [p.suffix for p in tmp_path.iterdir() if p.name != ".lock"] == [".npy"]
+
+
+def test_aicsimage_disk_chunk_cache(tmp_path: Path) -> None:
+    path = tmp_path / "stack.tiff"
+    cache_dir = tmp_path / "cache"
+    data = np.arange(5 * 16 * 16, dtype=np.uint16).reshape((5, 16, 16))
+    tifffile.imwrite(path, data, photometric="minisblack")
+
+    img = AICSImage(path, chunk_dims="YX", chunk_cache_dir=cache_dir)
+    np.testing.assert_array_equal(img.get_image_dask_data("ZYX").compute(), data)
+    assert len(DiskChunkCache(cache_dir)) == 5
+
+    # A later reader of the unchanged file reuses the cached chunks
+    img = AICSImage(path, chunk_dims="YX", chunk_cache_dir=cache_dir)
+    np.testing.assert_array_equal(img.get_image_dask_data("ZYX").compute(), data)
+    assert len(DiskChunkCache(cache_dir)) == 5
+
+    # A rewritten file produces new chunks
+    tifffile.imwrite(path, data + 1, photometric="minisblack")
+    img = AICSImage(path, chunk_dims="YX", chunk_cache_dir=cache_dir)
+    np.testing.assert_array_equal(img.get_image_dask_data("ZYX").compute(), data + 1)
+    assert len(DiskChunkCache(cache_dir)) == 10
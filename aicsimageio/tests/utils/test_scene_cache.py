@@ -0,0 +1,87 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+from pathlib import Path
+from typing import List
+
+import numpy as np
+
+from aicsimageio import types
+from aicsimageio.readers import OmeTiffReader
+from aicsimageio.utils.scene_cache import SceneCache
+from aicsimageio.writers import OmeTiffWriter
+
+
+def _state(i: int) -> dict:
+    return {"_data": np.full(4, i), "_dask_data": f"dask-{i}", "_dims": f"dims-{i}"}
+
+
+def test_scene_cache_limits() -> None:
+    cache = SceneCache({"_data": ("_dask_data",)}, max_scenes=2, max_in_memory_scenes=1)
+    for i in range(3):
+        cache.store(i, _state(i))
+
+    # Only the two most recently used scenes are kept
+    assert len(cache) == 2
+    assert 0 not in cache
+
+    # Only the most recently used scene keeps its in-memory data
+    state = cache.pop(1)
+    assert state is not None
+    assert state["_data"] is None
+    assert state["_dask_data"] is None
+    assert state["_dims"] == "dims-1"
+    state = cache.pop(2)
+    assert state is not None
+    np.testing.assert_array_equal(state["_data"], 2)
+    assert len(cache) == 0
+
+    # Empty states are never stored
+    cache.store(0, {"_data": None, "_dask_data": None, "_dims": None})
+    assert 0 not in cache
+
+    # Shrinking drops the least recently used scenes
+    cache.resize(max_scenes=8, max_in_memory_scenes=8)
+    for i in range(3):
+        cache.store(i, _state(i))
+    cache.resize(max_scenes=1, max_in_memory_scenes=0)
+    assert len(cache) == 1
+    state = cache.pop(2)
+    assert state is not None
+    assert state["_data"] is None
+    assert state["_dims"] == "dims-2"
+
+
+def test_reader_scene_round_trip(tmp_path: Path) -> None:
+    path = tmp_path / "scenes.ome.tiff"
+    scenes: List[types.ArrayLike] = [np.random.rand(5, 8, 8), np.random.rand(6, 4, 4)]
+    OmeTiffWriter.save(scenes, path, dim_order=["ZYX", "ZYX"])
+    reader = OmeTiffReader(path)
+
+    # Switching back to a recently used scene reuses the constructed data
+    first_dask_data = reader.xarray_dask_data
+    reader.set_scene(1)
+    second_dask_data = reader.xarray_dask_data
+    reader.set_scene(0)
+    assert reader.xarray_dask_data is first_dask_data
+    reader.set_scene(1)
+    assert reader.xarray_dask_data is second_dask_data
+
+    # In-memory data is only kept for the current scene by default
+    first_data = reader.data
+    reader.set_scene(0)
+    reader.set_scene(1)
+    assert reader._xarray_data is None
+    np.testing.assert_array_equal(reader.data, first_data)
+
+    # Unless requested
+    reader.set_scene_cache_size(max_in_memory_scenes=1)
+    second_data = reader.data
+    reader.set_scene(0)
+    reader.set_scene(1)
+    assert reader.data is second_data
+
+    # Or the cache is disabled entirely
+    reader.set_scene_cache_size(max_scenes=0)
+    reader.set_scene(0)
+    assert reader.xarray_dask_data is not first_dask_data
@@ -0,0 +1,82 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+import numpy as np
+import tifffile
+from fsspec.implementations.local import LocalFileSystem
+
+from aicsimageio.readers import TiffReader
+from aicsimageio.utils.io_utils import get_resource_signature
+from aicsimageio.utils.tiff_handle_pool import TIFF_HANDLE_POOL, TiffHandlePool
+
+
+def test_tiff_handle_pool_reuse_and_eviction(tmp_path: Path) -> None:
+    fs = LocalFileSystem()
+    paths = []
+    for i in range(3):
+        path = str(tmp_path / f"{i}.tiff")
+        tifffile.imwrite(path, np.full((2, 4, 4), i, dtype=np.uint8))
+        paths.append(path)
+
+    pool = TiffHandlePool(max_size=2)
+    with pool.open(fs, paths[0]) as arr:
+        first = arr
+        assert arr[1, 0, 0] == 0
+
+    # Reopening the same file reuses the same zarr array
+    with pool.open(fs, paths[0]) as arr:
+        assert arr is first
+
+    # Opening more files than the pool size evicts the least recently used
+    for path in paths[1:]:
+        with pool.open(fs, path):
+            pass
+
+    assert len(pool) == 2
+    with pool.open(fs, paths[0]) as arr:
+        assert arr is not first
+
+    pool.clear()
+    assert len(pool) == 0
+
+
+def test_tiff_handle_pool_signature_change(tmp_path: Path) -> None:
+    fs = LocalFileSystem()
+    path = str(tmp_path / "rewritten.tiff")
+    pool = TiffHandlePool()
+
+    tifffile.imwrite(path, np.zeros((4, 4), dtype=np.uint8))
+    with pool.open(fs, path, signature=get_resource_signature(fs, path)) as arr:
+        assert arr[0, 0] == 0
+
+    tifffile.imwrite(path, np.ones((8, 8), dtype=np.uint16))
+    with pool.open(fs, path, signature=get_resource_signature(fs, path)) as arr:
+        assert arr.shape == (8, 8)
+        assert arr[0, 0] == 1
+
+    pool.clear()
+
+
+def test_tiff_reader_threaded_chunk_reads(tmp_path: Path) -> None:
+    path = tmp_path / "planes.tiff"
+    data = np.arange(10 * 3 * 16 * 16, dtype=np.uint16).reshape((10, 3, 16, 16))
+    tifffile.imwrite(path, data, metadata={"axes": "TCYX"})
+
+    TIFF_HANDLE_POOL.clear()
+    reader = TiffReader(path, chunk_dims="CYX")
+    np.testing.assert_array_equal(reader.dask_data.compute(scheduler="threads"), data)
+
+    # Every chunk of the file was read through a single pooled handle
+    assert len(TIFF_HANDLE_POOL) == 1
+
+    with ThreadPoolExecutor(4) as exe:
+        planes = list(
+            exe.map(
+                lambda t: reader.get_image_dask_data("CYX", T=t).compute(), range(10)
+            )
+        )
+
+    np.testing.assert_array_equal(np.stack(planes), data)
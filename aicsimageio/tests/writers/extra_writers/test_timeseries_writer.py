@@ -1,8 +1,9 @@
 #!/usr/bin/env python
 # -*- coding: utf-8 -*-
 
-from typing import Callable, Tuple
+from typing import Callable, List, Tuple
 
+import dask.array as da
 import numpy as np
 import pytest
 
@@ -159,3 +160,46 @@ def test_timeseries_writer_ffmpeg(
     assert reader.dims.order == read_dim_order
 
     # Can't do "easy" testing because compression + shape mismatches on RGB data
+
+
+@pytest.mark.parametrize("max_chunks_in_flight, max_workers", [(1, 1), (4, 3)])
+def test_timeseries_writer_streams_dask(
+    max_chunks_in_flight: int, max_workers: int
+) -> None:
+    data = np.random.randint(0, 2**8, (30, 40, 50), dtype=np.uint8)
+    save_uri = get_resource_write_full_path("streamed.gif", LOCAL)
+
+    # Chunks span multiple frames and are split along Y
+    TimeseriesWriter.save(
+        da.from_array(data, chunks=(4, 20, 50)),
+        save_uri,
+        max_chunks_in_flight=max_chunks_in_flight,
+        max_workers=max_workers,
+    )
+
+    # Greyscale GIF frames are lossless
+    reader = DefaultReader(save_uri)
+    assert reader.dims.order == "TYX"
+    np.testing.assert_array_equal(reader.data, data)
+
+
+@pytest.mark.parametrize("chunks", [(30,), (24, 3, 3), (7, 11, 12)])
+def test_timeseries_writer_reads_each_chunk_once(chunks: Tuple[int, ...]) -> None:
+    data = np.random.randint(0, 2**8, (30, 40, 50), dtype=np.uint8)
+    save_uri = get_resource_write_full_path("single_chunk.gif", LOCAL)
+
+    read_chunk_sizes: List[int] = []
+
+    def record_read(block: np.ndarray) -> np.ndarray:
+        # Skip the empty blocks dask uses to infer the output metadata
+        if block.size > 1:
+            read_chunk_sizes.append(block.shape[0])
+        return block
+
+    TimeseriesWriter.save(
+        da.from_array(data, chunks=(chunks, 40, 50)).map_blocks(record_read), save_uri
+    )
+
+    assert sorted(read_chunk_sizes) == sorted(chunks)
+    reader = DefaultReader(save_uri)
+    np.testing.assert_array_equal(reader.data, data)
@@ -1,7 +1,8 @@
 #!/usr/bin/env python
 # -*- coding: utf-8 -*-
 
-from typing import Callable, Tuple
+from pathlib import Path
+from typing import Callable, Optional, Tuple, Union
 
 import numpy as np
 import pytest
@@ -83,3 +84,87 @@ def test_two_d_writer(
     # but remember, the reader returns data in standard read order
     # so we need to get it back as write order
     np.testing.assert_array_equal(arr, reader.get_image_data(write_dim_order))
+
+
+@array_constructor
+@pytest.mark.parametrize(
+    "write_shape, write_dim_order, uri_template, expected_n_planes, " "expected_plane",
+    [
+        # Dims default to a TCZYX ordering
+        ((2, 3, 40, 50), None, "C{C}_Z{Z:02d}.png", 6, ("C1_Z02.png", (1, 2))),
+        # Samples are kept with each plane
+        ((40, 3, 50, 3), "YZXS", "Z{Z}.png", 3, ("Z2.png", (slice(None), 2))),
+        # Dims with a single plane don't need to be in the template
+        ((1, 4, 40, 50), "TZYX", "Z{Z}.png", 4, ("Z3.png", (0, 3))),
+    ],
+)
+@pytest.mark.parametrize("use_processes", [True, False])
+def test_two_d_writer_save_planes(
+    array_constructor: Callable,
+    write_shape: Tuple[int, ...],
+    write_dim_order: Optional[str],
+    uri_template: str,
+    expected_n_planes: int,
+    expected_plane: Tuple[str, Tuple[Union[int, slice], ...]],
+    use_processes: bool,
+    tmp_path: Path,
+) -> None:
+    arr = array_constructor(write_shape, dtype=np.uint8)
+
+    uris = TwoDWriter.save_planes(
+        arr,
+        str(tmp_path / uri_template),
+        dim_order=write_dim_order,
+        max_workers=2,
+        use_processes=use_processes,
+    )
+    assert len(uris) == expected_n_planes
+
+    filename, plane_index = expected_plane
+    assert str(tmp_path / filename) in uris
+    reader = DefaultReader(tmp_path / filename)
+    np.testing.assert_array_equal(np.squeeze(reader.data), np.asarray(arr)[plane_index])
+
+
+@pytest.mark.parametrize(
+    "write_shape, write_dim_order, uri_template",
+    [
+        pytest.param(
+            (2, 3, 4),
+            "ZYX",
+            "{T}.png",
+            marks=pytest.mark.raises(exception=ValueError),
+        ),
+        pytest.param(
+            (2, 3, 3, 4),
+            "CZYX",
+            "{C}.png",
+            marks=pytest.mark.raises(exception=ValueError),
+        ),
+        pytest.param(
+            (2, 3, 4),
+            "ZYXS",
+            "{Z}.png",
+            marks=pytest.mark.raises(exception=exceptions.UnexpectedShapeError),
+        ),
+        pytest.param(
+            (2, 3, 4),
+            "ZCY",
+            "{Z}_{C}.png",
+            marks=pytest.mark.raises(
+                exception=exceptions.InvalidDimensionOrderingError
+            ),
+        ),
+    ],
+)
+def test_two_d_writer_save_planes_invalid(
+    write_shape: Tuple[int, ...],
+    write_dim_order: str,
+    uri_template: str,
+    tmp_path: Path,
+) -> None:
+    TwoDWriter.save_planes(
+        np.zeros(write_shape, dtype=np.uint8),
+        str(tmp_path / uri_template),
+        dim_order=write_dim_order,
+    )
@@ -0,0 +1,142 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+from pathlib import Path
+from typing import Optional, Tuple
+
+import numpy as np
+import pytest
+
+from aicsimageio import exceptions
+from aicsimageio.readers import OmeTiffReader
+from aicsimageio.writers import OmeTiffAppendWriter
+
+
+def test_ome_tiff_append_writer(tmp_path: Path) -> None:
+    data = np.random.randint(0, 2**16, (4, 2, 3, 20, 30), dtype=np.uint16)
+    save_path = tmp_path / "appended.ome.tiff"
+
+    with OmeTiffAppendWriter(
+        save_path,
+        shape=data.shape[1:],
+        dtype=data.dtype,
+        channel_names=["A", "B"],
+        tile=(16, 16),
+    ) as writer:
+        # Whole timepoint, multiple timepoints, a single channel stack, and planes
+        writer.append(data[0])
+        writer.append(data[1:3])
+        writer.append(data[3, 0])
+        for plane in data[3, 1]:
+            writer.append(plane)
+
+        assert writer.shape == data.shape
+
+    reader = OmeTiffReader(save_path)
+    assert reader.dims.order == "TCZYX"
+    assert reader.shape == data.shape
+    assert reader.channel_names == ["A", "B"]
+    np.testing.assert_array_equal(reader.data, data)
+
+
+def test_ome_tiff_append_writer_readable_before_close(tmp_path: Path) -> None:
+    data = np.random.randint(0, 2**8, (3, 2, 20, 30), dtype=np.uint8)
+    save_path = tmp_path / "appended.ome.tiff"
+
+    writer = OmeTiffAppendWriter(
+        save_path, shape=(2, 20, 30), dtype=np.uint8, dim_order="CYX"
+    )
+    writer.append(data[0])
+    writer.append(data[1])
+
+    # Only complete timepoints are described
+    writer.append(data[2, 0])
+
+    # Every complete timepoint can be read from an unclosed (i.e. crashed) writer
+    reader = OmeTiffReader(save_path)
+    assert reader.shape == (2, 2, 1, 20, 30)
+    np.testing.assert_array_equal(reader.get_image_data("TCYX"), data[:2])
+
+    writer.append(data[2, 1])
+    writer.close()
+
+    reader = OmeTiffReader(save_path)
+    assert reader.shape == (3, 2, 1, 20, 30)
+    np.testing.assert_array_equal(reader.get_image_data("TCYX"), data)
+
+
+def test_ome_tiff_append_writer_rgb(tmp_path: Path) -> None:
+    data = np.random.randint(0, 2**8, (3, 20, 30, 3), dtype=np.uint8)
+    save_path = tmp_path / "appended.ome.tiff"
+
+    with OmeTiffAppendWriter(
+        save_path, shape=data.shape[1:], dtype=data.dtype, dim_order="YXS"
+    ) as writer:
+        for timepoint in data:
+            writer.append(timepoint)
+
+    reader = OmeTiffReader(save_path)
+    assert reader.dims.order == "TCZYXS"
+    np.testing.assert_array_equal(reader.get_image_data("TYXS"), data)
+
+
+@pytest.mark.parametrize(
+    "shape, dim_order",
+    [
+        pytest.param(
+            (2, 20, 30),
+            "TYX",
+            marks=pytest.mark.xfail(raises=exceptions.InvalidDimensionOrderingError),
+        ),
+        pytest.param(
+            (2, 20, 30),
+            "YX",
+            marks=pytest.mark.xfail(raises=exceptions.InvalidDimensionOrderingError),
+        ),
+    ],
+)
+def test_ome_tiff_append_writer_invalid_dims(
+    shape: Tuple[int, ...], dim_order: Optional[str], tmp_path: Path
+) -> None:
+    OmeTiffAppendWriter(
+        tmp_path / "appended.ome.tiff", shape=shape, dtype=np.uint8, dim_order=dim_order
+    )
+
+
+@pytest.mark.parametrize(
+    "appended_shape, next_shape",
+    [
+        pytest.param(
+            None,
+            (20, 20),
+            marks=pytest.mark.xfail(raises=exceptions.UnexpectedShapeError),
+        ),
+        pytest.param(
+            None,
+            (3, 20, 30),
+            marks=pytest.mark.xfail(raises=exceptions.UnexpectedShapeError),
+        ),
+        pytest.param(
+            (20, 30),
+            (2, 20, 30),
+            marks=pytest.mark.xfail(raises=exceptions.UnexpectedShapeError),
+        ),
+        pytest.param(
+            (20, 30),
+            (1, 2, 20, 30),
+            marks=pytest.mark.xfail(raises=exceptions.UnexpectedShapeError),
+        ),
+    ],
+)
+def test_ome_tiff_append_writer_invalid_shape(
+    appended_shape: Optional[Tuple[int, ...]],
+    next_shape: Tuple[int, ...],
+    tmp_path: Path,
+) -> None:
+    with OmeTiffAppendWriter(
+        tmp_path / "appended.ome.tiff", shape=(2, 20, 30), dtype=np.uint8
+    ) as writer:
+        if appended_shape is not None:
+            writer.append(np.zeros(appended_shape, dtype=np.uint8))
+
+        writer.append(np.zeros(next_shape, dtype=np.uint8))
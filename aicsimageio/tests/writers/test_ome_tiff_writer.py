@@ -2,15 +2,19 @@
 # -*- coding: utf-8 -*-
 
 import urllib
+from pathlib import Path
 from typing import Callable, List, Optional, Tuple, Union
 
+import dask.array as da
 import numpy as np
 import pytest
+import tifffile
 from ome_types import to_xml
 from ome_types.model import OME
 
 from aicsimageio import exceptions, types
 from aicsimageio.readers import OmeTiffReader
+from aicsimageio.transforms import downsample
 from aicsimageio.writers import OmeTiffWriter
 
 from ..conftest import LOCAL, array_constructor, get_resource_write_full_path
@@ -473,3 +477,181 @@ def test_ome_tiff_writer_common_metadata(
         assert reader.shape == read_shapes[i]
         assert reader.dims.order == read_dim_order[i]
         assert reader.physical_pixel_sizes == expected_pixel_size[i]
+
+
+def test_ome_tiff_writer_streams_dask_planes(tmp_path: Path) -> None:
+    data = np.random.randint(0, 2**16, (3, 2, 4, 16, 16), dtype=np.uint16)
+    save_path = tmp_path / "streamed.ome.tiff"
+
+    # Chunks are streamed to the file plane by plane
+    OmeTiffWriter.save(da.from_array(data, chunks=(1, 1, 2, 16, 16)), save_path)
+
+    reader = OmeTiffReader(save_path)
+    assert reader.shape == data.shape
+    np.testing.assert_array_equal(reader.data, data)
+
+
+@array_constructor
+@pytest.mark.parametrize(
+    "tile, compression, compression_level, predictor, expected_compression",
+    [
+        (None, None, None, None, tifffile.TIFF.COMPRESSION.NONE),
+        ((16, 16), "zlib", 9, True, tifffile.TIFF.COMPRESSION.ADOBE_DEFLATE),
+        ((32, 16), "zstd", 3, "horizontal", tifffile.TIFF.COMPRESSION.ZSTD),
+        ((16, 32), "lzw", None, None, tifffile.TIFF.COMPRESSION.LZW),
+    ],
+)
+def test_ome_tiff_writer_tiles_and_compression(
+    array_constructor: Callable,
+    tile: Optional[Tuple[int, int]],
+    compression: Optional[str],
+    compression_level: Optional[int],
+    predictor: Optional[Union[bool, str]],
+    expected_compression: tifffile.TIFF.COMPRESSION,
+    tmp_path: Path,
+) -> None:
+    data = array_constructor((2, 3, 40, 50), dtype=np.uint16)
+    save_path = tmp_path / "tiled.ome.tiff"
+
+    OmeTiffWriter.save(
+        data,
+        save_path,
+        dim_order="CZYX",
+        tile=tile,
+        compression=compression,
+        compression_level=compression_level,
+        predictor=predictor,
+        maxworkers=2,
+    )
+
+    with tifffile.TiffFile(save_path) as tiff:
+        page = tiff.pages[0]
+        assert page.compression == expected_compression
+        assert page.is_tiled == (tile is not None)
+        if tile is not None:
+            assert (page.tilelength, page.tilewidth) == tile
+
+    np.testing.assert_array_equal(OmeTiffReader(save_path).get_image_data("CZYX"), data)
+
+
+@pytest.mark.parametrize("as_dask", [False, True])
+@pytest.mark.parametrize(
+    "shape, dim_order",
+    [((2, 40, 50), "ZYX"), ((2, 40, 50, 3), "ZYXS")],
+)
+def test_ome_tiff_writer_tiled_jpeg(
+    as_dask: bool,
+    shape: Tuple[int, ...],
+    dim_order: str,
+    tmp_path: Path,
+) -> None:
+    # A smooth gradient survives lossy compression almost unchanged
+    gradient = np.add.outer(np.arange(shape[1]), np.arange(shape[2])) * 2
+    expected = np.broadcast_to(
+        gradient.reshape(gradient.shape + (1,) * (len(shape) - 3)), shape
+    ).astype(np.uint8)
+    data: types.ArrayLike = expected
+    if as_dask:
+        data = da.from_array(expected, chunks=(1,) + shape[1:])
+    save_path = tmp_path / "tiled_jpeg.ome.tiff"
+
+    OmeTiffWriter.save(
+        data, save_path, dim_order=dim_order, tile=(16, 16), compression="jpeg"
+    )
+
+    with tifffile.TiffFile(save_path) as tiff:
+        assert tiff.pages[0].compression == tifffile.TIFF.COMPRESSION.JPEG
+        assert (tiff.pages[0].tilelength, tiff.pages[0].tilewidth) == (16, 16)
+
+    read = OmeTiffReader(save_path).get_image_data(dim_order)
+    assert read.shape == shape
+    assert np.abs(read.astype(int) - expected).mean() < 2
+
+
+def test_ome_tiff_writer_jpeg_requires_uint8(tmp_path: Path) -> None:
+    with pytest.raises(ValueError):
+        OmeTiffWriter.save(
+            np.zeros((32, 32), dtype=np.uint16),
+            tmp_path / "jpeg.ome.tiff",
+            compression="jpeg",
+        )
+
+
+@array_constructor
+@pytest.mark.parametrize(
+    "pyramid_levels, downsample_factors, downsample_method, expected_level_shapes",
+    [
+        (None, None, "mean", [(40, 50)]),
+        (2, None, "mean", [(40, 50), (20, 25), (10, 13)]),
+        (None, [3], "nearest", [(40, 50), (14, 17)]),
+        (None, [2, 4], "max", [(40, 50), (20, 25), (5, 7)]),
+    ],
+)
+def test_ome_tiff_writer_pyramid(
+    array_constructor: Callable,
+    pyramid_levels: Optional[int],
+    downsample_factors: Optional[List[int]],
+    downsample_method: str,
+    expected_level_shapes: List[Tuple[int, int]],
+    tmp_path: Path,
+) -> None:
+    data = array_constructor((2, 3, 40, 50), dtype=np.uint16)
+    save_path = tmp_path / "pyramid.ome.tiff"
+
+    OmeTiffWriter.save(
+        data,
+        save_path,
+        dim_order="CZYX",
+        tile=(16, 16),
+        pyramid_levels=pyramid_levels,
+        downsample_factors=downsample_factors,
+        downsample_method=downsample_method,
+    )
+
+    # Reduced levels are stored as SubIFDs, not as additional pages
+    with tifffile.TiffFile(save_path) as tiff:
+        assert len(tiff.pages) == 6
+
+    reader = OmeTiffReader(save_path)
+    assert reader.resolution_levels == tuple(range(len(expected_level_shapes)))
+
+    expected: types.ArrayLike = np.asarray(data)
+    for level, expected_level_shape in enumerate(expected_level_shapes):
+        reader.set_resolution_level(level)
+        assert reader.dims.shape == (1, 2, 3, *expected_level_shape)
+        np.testing.assert_array_equal(reader.get_image_data("CZYX"), expected)
+
+        if level + 1 < len(expected_level_shapes):
+            factor = (downsample_factors or [2] * len(expected_level_shapes))[level]
+            expected = downsample(
+                expected, (1, 1, factor, factor), method=downsample_method
+            )
+
+
+def test_ome_tiff_writer_pyramid_reads_source_twice(tmp_path: Path) -> None:
+    data = np.random.randint(0, 2**16, (2, 3, 64, 64), dtype=np.uint16)
+    computed_chunks: List[Tuple[int, ...]] = []
+
+    def count_chunk(block: np.ndarray) -> np.ndarray:
+        # Skip the empty blocks dask uses to infer the output metadata
+        if block.size > 1:
+            computed_chunks.append(block.shape)
+        return block
+
+    source = da.from_array(data, chunks=(1, 1, 64, 64)).map_blocks(count_chunk)
+    OmeTiffWriter.save(
+        source, tmp_path / "pyramid.ome.tiff", dim_order="CZYX", pyramid_levels=3
+    )
+
+    # Once for the full resolution level, once to build the first reduced level
+    assert len(computed_chunks) == 2 * data.shape[0] * data.shape[1]
+
+
+def test_ome_tiff_writer_pyramid_conflicting_arguments(tmp_path: Path) -> None:
+    with pytest.raises(exceptions.ConflictingArgumentsError):
+        OmeTiffWriter.save(
+            np.zeros((32, 32), dtype=np.uint8),
+            tmp_path / "pyramid.ome.tiff",
+            pyramid_levels=2,
+            downsample_factors=[2, 2],
+        )
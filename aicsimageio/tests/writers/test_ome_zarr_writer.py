@@ -0,0 +1,216 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+from pathlib import Path
+from typing import Callable, List, Optional, Tuple
+
+import numpy as np
+import pytest
+import zarr
+from ome_types import from_xml
+
+from aicsimageio import AICSImage, exceptions, types
+from aicsimageio.transforms import downsample, reshape_data
+from aicsimageio.writers import OmeZarrWriter
+
+from ..conftest import array_constructor
+
+
+@array_constructor
+@pytest.mark.parametrize(
+    "write_shape, write_dim_order, chunks, expected_shape, expected_chunks, "
+    "data_dims",
+    [
+        ((40, 50), None, None, (1, 1, 1, 40, 50), (1, 1, 1, 40, 50), "YX"),
+        ((2, 3, 40, 50), "CZYX", None, (1, 2, 3, 40, 50), (1, 1, 1, 40, 50), "CZYX"),
+        (
+            (3, 2, 40, 50),
+            "ZCYX",
+            (1, 2, 3, 16, 16),
+            (1, 2, 3, 40, 50),
+            (1, 2, 3, 16, 16),
+            "ZCYX",
+        ),
+        # RGB samples are written as channels
+        ((4, 40, 50, 3), "TYXS", None, (4, 3, 1, 40, 50), (1, 1, 1, 40, 50), "TYXC"),
+    ],
+)
+def test_ome_zarr_writer(
+    array_constructor: Callable,
+    write_shape: Tuple[int, ...],
+    write_dim_order: Optional[str],
+    chunks: Optional[Tuple[int, ...]],
+    expected_shape: Tuple[int, ...],
+    expected_chunks: Tuple[int, ...],
+    data_dims: str,
+    tmp_path: Path,
+) -> None:
+    data = array_constructor(write_shape, dtype=np.uint8)
+    save_path = tmp_path / "e.ome.zarr"
+
+    OmeZarrWriter.save(
+        data,
+        save_path,
+        dim_order=write_dim_order,
+        chunks=chunks,
+        physical_pixel_sizes=types.PhysicalPixelSizes(2.0, 0.5, 0.25),
+    )
+
+    group = zarr.open_group(str(save_path), mode="r")
+    assert group["0"].shape == expected_shape
+    assert group["0"].chunks == expected_chunks
+    np.testing.assert_array_equal(
+        group["0"][:], reshape_data(np.asarray(data), data_dims, "TCZYX")
+    )
+
+    multiscales = group.attrs["multiscales"][0]
+    assert [axis["name"] for axis in multiscales["axes"]] == ["t", "c", "z", "y", "x"]
+    assert multiscales["datasets"] == [
+        {
+            "path": "0",
+            "coordinateTransformations": [
+                {"type": "scale", "scale": [1.0, 1.0, 2.0, 0.5, 0.25]}
+            ],
+        }
+    ]
+    assert len(group.attrs["omero"]["channels"]) == expected_shape[1]
+
+
+@array_constructor
+@pytest.mark.parametrize(
+    "pyramid_levels, downsample_factors, downsample_method, expected_yx_shapes",
+    [
+        (2, None, "mean", [(40, 50), (20, 25), (10, 13)]),
+        (None, [3], "nearest", [(40, 50), (14, 17)]),
+        (None, [2, 4], "max", [(40, 50), (20, 25), (5, 7)]),
+    ],
+)
+def test_ome_zarr_writer_pyramid(
+    array_constructor: Callable,
+    pyramid_levels: Optional[int],
+    downsample_factors: Optional[List[int]],
+    downsample_method: str,
+    expected_yx_shapes: List[Tuple[int, int]],
+    tmp_path: Path,
+) -> None:
+    data = array_constructor((2, 40, 50), dtype=np.uint16)
+    save_path = tmp_path / "pyramid.ome.zarr"
+
+    OmeZarrWriter.save(
+        data,
+        save_path,
+        dim_order="CYX",
+        chunks=(1, 1, 1, 16, 16),
+        pyramid_levels=pyramid_levels,
+        downsample_factors=downsample_factors,
+        downsample_method=downsample_method,
+    )
+
+    group = zarr.open_group(str(save_path), mode="r")
+    datasets = group.attrs["multiscales"][0]["datasets"]
+    assert [dataset["path"] for dataset in datasets] == [
+        str(level) for level in range(len(expected_yx_shapes))
+    ]
+
+    expected: types.ArrayLike = np.asarray(data)[np.newaxis, :, np.newaxis]
+    factors = downsample_factors or [2] * len(expected_yx_shapes)
+    for level, expected_yx_shape in enumerate(expected_yx_shapes):
+        assert group[str(level)].shape == (1, 2, 1, *expected_yx_shape)
+        np.testing.assert_array_equal(group[str(level)][:], expected)
+
+        if level + 1 < len(expected_yx_shapes):
+            expected = downsample(
+                expected,
+                (1, 1, 1, factors[level], factors[level]),
+                method=downsample_method,
+            )
+
+
+def test_ome_zarr_writer_multi_image_fsspec() -> None:
+    first = np.random.randint(0, 2**8, (2, 3, 20, 30), dtype=np.uint8)
+    second = np.random.randint(0, 2**8, (20, 30), dtype=np.uint8)
+    uri = "memory://multi.ome.zarr"
+
+    OmeZarrWriter.save(
+        [first, second],
+        uri,
+        dim_order=["CZYX", "YX"],
+        channel_names=[["A", "B"], None],
+        image_name=["first", "second"],
+        channel_colors=[[[255, 0, 0], [0, 255, 0]], None],
+    )
+
+    # Written with the bioformats2raw layout
+    store = zarr.storage.FSStore(uri)
+    group = zarr.open_group(store, mode="r")
+    assert group.attrs["bioformats2raw.layout"] == 3
+    assert group["OME"].attrs["series"] == ["0", "1"]
+    np.testing.assert_array_equal(group["0/0"][0], first)
+    np.testing.assert_array_equal(group["1/0"][0, 0, 0], second)
+
+    assert group["0"].attrs["multiscales"][0]["name"] == "first"
+    channels = group["0"].attrs["omero"]["channels"]
+    assert [channel["label"] for channel in channels] == ["A", "B"]
+    assert [channel["color"] for channel in channels] == ["FF0000", "00FF00"]
+
+    ome = from_xml(store["OME/METADATA.ome.xml"].decode())
+    assert [image.name for image in ome.images] == ["first", "second"]
+    assert [channel.name for channel in ome.images[0].pixels.channels] == ["A", "B"]
+    assert ome.images[1].pixels.size_c == 1
+
+
+@pytest.mark.parametrize(
+    "write_shape, write_dim_order, kwargs",
+    [
+        pytest.param(
+            (2, 3, 3),
+            "CYXS",
+            {},
+            marks=pytest.mark.xfail(raises=exceptions.InvalidDimensionOrderingError),
+        ),
+        pytest.param(
+            (2, 3),
+            "ZYX",
+            {},
+            marks=pytest.mark.xfail(raises=exceptions.InvalidDimensionOrderingError),
+        ),
+        pytest.param(
+            (2, 3),
+            None,
+            {"chunks": (1, 1, 2, 3)},
+            marks=pytest.mark.xfail(raises=ValueError),
+        ),
+        pytest.param(
+            (2, 3),
+            None,
+            {"pyramid_levels": 1, "downsample_factors": [2]},
+            marks=pytest.mark.xfail(raises=exceptions.ConflictingArgumentsError),
+        ),
+    ],
+)
+def test_ome_zarr_writer_invalid_arguments(
+    write_shape: Tuple[int, ...],
+    write_dim_order: Optional[str],
+    kwargs: dict,
+    tmp_path: Path,
+) -> None:
+    OmeZarrWriter.save(
+        np.zeros(write_shape, dtype=np.uint8),
+        tmp_path / "e.ome.zarr",
+        dim_order=write_dim_order,
+        **kwargs,
+    )
+
+
+def test_aicsimage_save_zarr(tmp_path: Path) -> None:
+    data = np.random.randint(0, 2**8, (2, 3, 20, 30), dtype=np.uint8)
+    img = AICSImage(data, dim_order="CZYX", channel_names=["A", "B"])
+    save_path = tmp_path / "saved.ome.zarr"
+
+    # The writer is chosen by extension
+    img.save(save_path)
+
+    group = zarr.open_group(str(save_path), mode="r")
+    np.testing.assert_array_equal(group["0"][0], data)
+    channels = group.attrs["omero"]["channels"]
+    assert [channel["label"] for channel in channels] == ["A", "B"]
@@ -274,6 +274,145 @@ def reshape_data(
     )  # don't pass kwargs or 2 copies
 
 
+DOWNSAMPLE_METHODS = ("mean", "nearest", "max")
+DEFAULT_DOWNSAMPLE_FACTOR = 2
+
+
+def _coarsen(reduction: Any, data: np.ndarray, factors: Tuple[int, ...]) -> Any:
+    # Split each axis into (blocks, factor) then reduce the factor axes
+    shape: List[int] = []
+    for size, factor in zip(data.shape, factors):
+        shape += [size // factor, factor]
+
+    return reduction(data.reshape(shape), axis=tuple(range(1, len(shape), 2)))
+
+
+def downsample(
+    data: types.ArrayLike,
+    factors: Tuple[int, ...],
+    method: str = "mean",
+) -> types.ArrayLike:
+    """
+    Reduce the resolution of an array by an integer factor along each axis.
+
+    Parameters
+    ----------
+    data: types.ArrayLike
+        Either a dask array or numpy.ndarray to downsample.
+    factors: Tuple[int, ...]
+        The downsampling factor of each axis of the data. Use 1 for any axis that
+        should be left untouched.
+    method: str
+        How each block of `factors` pixels is reduced to a single pixel, one of
+        "mean", "nearest" (the first pixel of the block), or "max".
+        Default: "mean"
+
+    Returns
+    -------
+    data: types.ArrayLike
+        The downsampled data, of the same type and dtype as the provided data. Each
+        axis has ceil(size / factor) pixels, incomplete blocks at the end of an axis
+        are reduced as if their last pixel was repeated.
+
+    Raises
+    ------
+    ValueError
+        Unknown method or invalid factors provided.
+    """
+    if method not in DOWNSAMPLE_METHODS:
+        raise ValueError(
+            f"Unknown downsample method: '{method}'. "
+            f"Valid methods are: {DOWNSAMPLE_METHODS}."
+        )
+    if len(factors) != len(data.shape) or any(factor < 1 for factor in factors):
+        raise ValueError(
+            f"Downsample factors must be a positive integer for each of the "
+            f"{len(data.shape)} axes of the data. Received factors: {factors}."
+        )
+
+    if method == "nearest":
+        return data[tuple(slice(None, None, factor) for factor in factors)]
+
+    # Repeat the edge pixels to complete any incomplete blocks
+    pad_width = [(0, -size % factor) for size, factor in zip(data.shape, factors)]
+    if any(after > 0 for _, after in pad_width):
+        if isinstance(data, da.Array):
+            data = da.pad(data, pad_width, mode="edge")
+        else:
+            data = np.pad(data, pad_width, mode="edge")
+
+    reduction = np.mean if method == "mean" else np.max
+    if isinstance(data, da.Array):
+        reduced = da.coarsen(reduction, data, dict(enumerate(factors)))
+    else:
+        reduced = _coarsen(reduction, data, factors)
+
+    # Averages of integer data are rounded back to the original dtype
+    if method == "mean" and np.issubdtype(data.dtype, np.integer):
+        reduced = reduced.round()
+
+    return reduced.astype(data.dtype)
+
+
+def resolve_downsample_factors(
+    pyramid_levels: Optional[int] = None,
+    downsample_factors: Optional[List[int]] = None,
+    method: str = "mean",
+) -> List[int]:
+    """
+    Validate the pyramid arguments of a writer and resolve the downsampling factor
+    of each reduced resolution level.
+
+    Parameters
+    ----------
+    pyramid_levels: Optional[int]
+        The number of reduced resolution levels, each downsampled by
+        DEFAULT_DOWNSAMPLE_FACTOR (2) from the level above.
+        Default: None
+    downsample_factors: Optional[List[int]]
+        The downsampling factor of each reduced resolution level relative to the
+        level above.
+        Default: None
+    method: str
+        The downsampling method, one of DOWNSAMPLE_METHODS.
+        Default: "mean"
+
+    Returns
+    -------
+    downsample_factors: List[int]
+        The downsampling factor of each reduced resolution level, empty when no
+        reduced resolution levels are requested.
+
+    Raises
+    ------
+    ConflictingArgumentsError
+        Both pyramid_levels and downsample_factors provided.
+    ValueError
+        Invalid downsample factors or method provided.
+    """
+    if pyramid_levels is not None and downsample_factors is not None:
+        raise ConflictingArgumentsError(
+            "Received both pyramid_levels and downsample_factors. "
+            "Only one of them can be provided."
+        )
+    if pyramid_levels is not None:
+        downsample_factors = [DEFAULT_DOWNSAMPLE_FACTOR] * pyramid_levels
+    elif downsample_factors is None:
+        downsample_factors = []
+    if any(factor < 2 for factor in downsample_factors):
+        raise ValueError(
+            f"Downsample factors must be integers of at least 2. "
+            f"Received downsample_factors: {downsample_factors}."
+        )
+    if method not in DOWNSAMPLE_METHODS:
+        raise ValueError(
+            f"Unknown downsample method: '{method}'. "
+            f"Valid methods are: {DOWNSAMPLE_METHODS}."
+        )
+
+    return list(downsample_factors)
+
+
 def generate_stack(
     image_container: ImageContainer,
     mode: Literal["data", "dask_data", "xarray_data", "xarray_dask_data"],
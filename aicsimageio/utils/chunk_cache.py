@@ -0,0 +1,220 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+import threading
+from collections import OrderedDict
+from typing import Hashable, NamedTuple, Optional, Sequence, Tuple
+
+import numpy as np
+from fsspec.spec import AbstractFileSystem
+
+from .io_utils import get_resource_signature
+
+###############################################################################
+
+
+class ChunkCacheStats(NamedTuple):
+    hits: int
+    misses: int
+    evictions: int
+    current_bytes: int
+    max_bytes: int
+
+
+class ChunkCache:
+    """
+    A thread-safe, byte-budgeted, least-recently-used cache of decoded image chunks.
+
+    Parameters
+    ----------
+    max_bytes: int
+        The maximum total number of bytes of chunk data to hold.
+        Default: 0 (disabled, nothing is stored and no counters are updated)
+
+    Notes
+    -----
+    Readers key chunks by (reader, path, resource signature, scene, resolution level,
+    chunk layout, chunk index) so that chunks of a modified file or of a different
+    chunking are never returned.
+
+    Chunks larger than the full budget are never stored. Every chunk returned from
+    the cache is a copy so that callers can't modify the cached data.
+    """
+
+    def __init__(self, max_bytes: int = 0):
+        self._lock = threading.Lock()
+        self._chunks: "OrderedDict[Hashable, np.ndarray]" = OrderedDict()
+        self._max_bytes = max_bytes
+        self._current_bytes = 0
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+    @property
+    def enabled(self) -> bool:
+        return self._max_bytes > 0
+
+    @property
+    def max_bytes(self) -> int:
+        return self._max_bytes
+
+    @property
+    def stats(self) -> ChunkCacheStats:
+        with self._lock:
+            return ChunkCacheStats(
+                hits=self._hits,
+                misses=self._misses,
+                evictions=self._evictions,
+                current_bytes=self._current_bytes,
+                max_bytes=self._max_bytes,
+            )
+
+    def resize(self, max_bytes: int) -> None:
+        """
+        Change the byte budget of the cache, evicting the least recently used chunks
+        if needed.
+
+        Parameters
+        ----------
+        max_bytes: int
+            The new maximum total number of bytes of chunk data to hold.
+            Use 0 to disable the cache.
+        """
+        with self._lock:
+            self._max_bytes = max_bytes
+            self._evict()
+
+    def clear(self) -> None:
+        """
+        Remove every chunk from the cache and reset the counters.
+        """
+        with self._lock:
+            self._chunks.clear()
+            self._current_bytes = 0
+            self._hits = 0
+            self._misses = 0
+            self._evictions = 0
+
+    def __len__(self) -> int:
+        return len(self._chunks)
+
+    def _evict(self) -> None:
+        while self._current_bytes > max(self._max_bytes, 0):
+            _, chunk = self._chunks.popitem(last=False)
+            self._current_bytes -= chunk.nbytes
+            self._evictions += 1
+
+    def get(self, key: Hashable) -> Optional[np.ndarray]:
+        """
+        Get a copy of a cached chunk.
+
+        Parameters
+        ----------
+        key: Hashable
+            The key of the chunk.
+
+        Returns
+        -------
+        chunk: Optional[np.ndarray]
+            A copy of the chunk if it was cached, otherwise None.
+        """
+        if not self.enabled:
+            return None
+
+        with self._lock:
+            chunk = self._chunks.get(key)
+            if chunk is None:
+                self._misses += 1
+                return None
+
+            self._chunks.move_to_end(key)
+            self._hits += 1
+
+        return chunk.copy()
+
+    def put(self, key: Hashable, chunk: np.ndarray) -> None:
+        """
+        Store a copy of a chunk, evicting the least recently used chunks to stay
+        within the byte budget.
+
+        Parameters
+        ----------
+        key: Hashable
+            The key of the chunk.
+        chunk: np.ndarray
+            The decoded chunk data.
+        """
+        if not self.enabled or chunk.nbytes > self._max_bytes:
+            return
+
+        chunk = chunk.copy()
+        with self._lock:
+            previous = self._chunks.pop(key, None)
+            if previous is not None:
+                self._current_bytes -= previous.nbytes
+
+            self._chunks[key] = chunk
+            self._current_bytes += chunk.nbytes
+            self._evict()
+
+
+###############################################################################
+
+
+def get_chunk_cache_key(
+    reader_name: str,
+    fs: AbstractFileSystem,
+    path: str,
+    scene: int,
+    chunk_layout: Sequence[str],
+    signature: Optional[Tuple[Hashable, ...]] = None,
+    resolution_level: int = 0,
+) -> Tuple[Hashable, ...]:
+    """
+    Construct the key identifying a single image, scene, resolution level, and chunk
+    layout in the chunk cache. The chunk index is added to this key for each chunk.
+
+    Parameters
+    ----------
+    reader_name: str
+        The name of the reader producing the chunks.
+    fs: AbstractFileSystem
+        The file system the image is read from.
+    path: str
+        The path to the image.
+    scene: int
+        The scene index the chunks are read from.
+    chunk_layout: Sequence[str]
+        The dimension order of the blocked array (non-chunk dims then chunk dims).
+    signature: Optional[Tuple[Hashable, ...]]
+        The already retrieved resource signature of the image.
+        Default: None (retrieve the resource signature)
+    resolution_level: int
+        The resolution level the chunks are read from.
+        Default: 0
+
+    Returns
+    -------
+    key: Tuple[Hashable, ...]
+        The chunk cache key.
+    """
+    if signature is None:
+        signature = get_resource_signature(fs, path)
+
+    return (
+        reader_name,
+        fs.protocol,
+        path,
+        signature,
+        scene,
+        resolution_level,
+        tuple(chunk_layout),
+    )
+
+
+###############################################################################
+
+# The process-wide chunk cache shared by every plane-wise reader
+# Disabled by default, enable with `CHUNK_CACHE.resize(max_bytes)` before constructing
+# delayed arrays
+CHUNK_CACHE = ChunkCache()
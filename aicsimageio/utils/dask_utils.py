@@ -0,0 +1,516 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from itertools import groupby, product
+from typing import (
+    Any,
+    Callable,
+    Deque,
+    Dict,
+    Hashable,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    Union,
+)
+
+import dask.array as da
+import numpy as np
+from dask.base import tokenize
+from dask.highlevelgraph import HighLevelGraph
+
+from .chunk_cache import CHUNK_CACHE
+from .disk_chunk_cache import DiskChunkCache
+
+###############################################################################
+
+
+def _read_block(
+    func: Callable[[Tuple[int, ...]], np.ndarray],
+    block_index: Tuple[int, ...],
+    n_grid_dims: int,
+    cache_key: Optional[Hashable] = None,
+    disk_cache: Optional[DiskChunkCache] = None,
+) -> np.ndarray:
+    # Only go through the chunk caches when the reader provided a key for the image
+    use_memory_cache = cache_key is not None and CHUNK_CACHE.enabled
+    use_disk_cache = cache_key is not None and disk_cache is not None
+    chunk_key = (cache_key, block_index)
+
+    chunk = None
+    if use_memory_cache:
+        chunk = CHUNK_CACHE.get(chunk_key)
+
+    if chunk is None:
+        if use_disk_cache:
+            chunk = disk_cache.get(chunk_key)  # type: ignore
+
+        if chunk is None:
+            chunk = func(block_index)
+            if use_disk_cache:
+                disk_cache.put(chunk_key, chunk)  # type: ignore
+
+        if use_memory_cache:
+            CHUNK_CACHE.put(chunk_key, chunk)
+
+    # Add the singleton grid dimensions back to the front of the chunk
+    return chunk[(np.newaxis,) * n_grid_dims]
+
+
+def from_block_function(
+    func: Callable[[Tuple[int, ...]], np.ndarray],
+    grid_shape: Sequence[int],
+    chunk_shape: Sequence[Union[int, Sequence[int]]],
+    dtype: Any,
+    name: str = "read-block",
+    cache_key: Optional[Hashable] = None,
+    disk_cache: Optional[DiskChunkCache] = None,
+) -> da.Array:
+    """
+    Construct a dask array whose chunks are each produced by a single call to `func`.
+
+    The resulting array has shape `grid_shape + chunk_shape`. Every grid dimension is
+    chunked with size one and every chunk dimension is a single chunk unless it is
+    split into multiple blocks (i.e. along the tiles of a tiled image). All tasks live
+    in one graph layer keyed by block index, so constructing the graph is linear in
+    the number of chunks and does not require the `da.block` concatenation tree.
+
+    Parameters
+    ----------
+    func: Callable[[Tuple[int, ...]], np.ndarray]
+        A function that accepts the index of a block along every dimension (grid
+        dimensions then chunk dimensions) and returns the block data without the grid
+        dimensions (i.e. with shape `chunk_shape` when no chunk dimension is split).
+        Must be serializable if used with a distributed scheduler.
+    grid_shape: Sequence[int]
+        The number of chunks along each of the leading (non-chunked) dimensions.
+    chunk_shape: Sequence[Union[int, Sequence[int]]]
+        The size of each chunk dimension of the data returned by `func`, or the size
+        of each block along the dimension if it is split into multiple blocks.
+    dtype: Any
+        The dtype of the data returned by `func`.
+    name: str
+        A prefix for the dask graph layer name.
+        Default: "read-block"
+    cache_key: Optional[Hashable]
+        A key identifying the image and chunk layout that `func` reads from. When
+        provided, blocks are read through the process-wide `CHUNK_CACHE` (if it is
+        enabled) keyed by this key and the block index.
+        Default: None (never use the chunk caches)
+    disk_cache: Optional[DiskChunkCache]
+        A persistent on-disk chunk cache to read blocks through (after the in-memory
+        cache). Only used when a `cache_key` is provided.
+        Default: None (no on-disk caching)
+
+    Returns
+    -------
+    array: da.Array
+        The fully delayed array.
+    """
+    grid_shape = tuple(grid_shape)
+    chunks = tuple((1,) * size for size in grid_shape) + tuple(
+        (size,) if isinstance(size, (int, np.integer)) else tuple(size)
+        for size in chunk_shape
+    )
+
+    name = f"{name}-{tokenize(func, chunks, dtype, cache_key)}"
+    dsk: Dict[Any, Any] = {}
+    for block_index in np.ndindex(*(len(dim_chunks) for dim_chunks in chunks)):
+        key = (name, *block_index)
+        dsk[key] = (
+            _read_block,
+            func,
+            block_index,
+            len(grid_shape),
+            cache_key,
+            disk_cache,
+        )
+
+    graph = HighLevelGraph.from_collections(name, dsk, dependencies=())
+    return da.Array(graph, name, chunks, dtype=dtype)
+
+
+###############################################################################
+
+# A region of an array, a single index (dimension dropped) or a slice per dimension
+RegionIndex = Tuple[Union[int, slice], ...]
+
+
+def _paste_block(
+    shape: Tuple[int, ...],
+    dtype: Any,
+    sources: List[np.ndarray],
+    placements: List[Tuple[RegionIndex, RegionIndex]],
+) -> np.ndarray:
+    block = np.zeros(shape, dtype=dtype)
+    for source, (source_index, block_index) in zip(sources, placements):
+        block[block_index] = source[source_index]
+
+    return block
+
+
+# The output block, local output index, and (dim, block, local index) of the source
+_RegionPiece = Tuple[int, Any, Optional[Tuple[int, int, slice]]]
+
+
+def _find_block(bounds: np.ndarray, index: int) -> int:
+    return int(np.searchsorted(bounds, index, "right")) - 1
+
+
+def _normalize_region(
+    index: RegionIndex, shape: Sequence[int]
+) -> List[Union[int, Tuple[int, int]]]:
+    # Ints stay ints, slices become (start, stop)
+    normalized: List[Union[int, Tuple[int, int]]] = []
+    for dim_index, size in zip(index, shape):
+        if isinstance(dim_index, slice):
+            start, stop, _ = dim_index.indices(size)
+            normalized.append((start, stop))
+        else:
+            normalized.append(int(dim_index))
+
+    return normalized
+
+
+def _region_size(region: List[Union[int, Tuple[int, int]]]) -> List[int]:
+    return [
+        dim_index[1] - dim_index[0]
+        for dim_index in region
+        if isinstance(dim_index, tuple)
+    ]
+
+
+def paste_regions(
+    data: da.Array,
+    shape: Sequence[int],
+    chunks: Sequence[Sequence[int]],
+    regions: Sequence[Tuple[RegionIndex, RegionIndex]],
+    name: str = "paste-regions",
+) -> da.Array:
+    """
+    Construct a dask array of zeros with regions of `data` pasted into it.
+
+    Equivalent to allocating the output and assigning `out[dest] = data[source]` for
+    each region in order (later regions overwrite earlier regions), but without a
+    graph layer per assignment. Every output chunk is a single task in one graph
+    layer that depends only on the chunks of `data` holding the regions that
+    overlap it, so constructing the graph is linear in the number of regions and
+    output chunks, and computing a selection only reads the regions it overlaps.
+
+    Parameters
+    ----------
+    data: da.Array
+        The array to pull regions from.
+    shape: Sequence[int]
+        The shape of the output array.
+    chunks: Sequence[Sequence[int]]
+        The size of each chunk along each dimension of the output array.
+    regions: Sequence[Tuple[RegionIndex, RegionIndex]]
+        The (source, destination) index pairs. Each index has an int or a slice
+        (with step one) per dimension of `data` or the output respectively, and the
+        sliced dimensions of the source and destination must match in order and
+        size.
+    name: str
+        A prefix for the dask graph layer name.
+        Default: "paste-regions"
+
+    Returns
+    -------
+    array: da.Array
+        The fully delayed array.
+
+    Notes
+    -----
+    Regions spanning multiple chunks of `data` or of the output are split at the
+    chunk boundaries so that no chunk of `data` is rechunked or read more than
+    needed.
+    """
+    shape = tuple(shape)
+    chunks = tuple(tuple(dim_chunks) for dim_chunks in chunks)
+    if tuple(sum(dim_chunks) for dim_chunks in chunks) != shape:
+        raise ValueError(
+            f"Provided chunks ({chunks}) do not match the provided shape ({shape})."
+        )
+
+    normalized_regions = [
+        (
+            _normalize_region(source_index, data.shape),
+            _normalize_region(dest_index, shape),
+        )
+        for source_index, dest_index in regions
+    ]
+
+    data_bounds = [np.cumsum((0, *dim_chunks)) for dim_chunks in data.chunks]
+    out_bounds = [np.cumsum((0, *dim_chunks)) for dim_chunks in chunks]
+
+    # Find the output blocks each region overlaps and the part of the region in each
+    block_placements: Dict[Tuple[int, ...], List[Tuple[Any, ...]]] = {}
+    for source_index, dest_index in normalized_regions:
+        # Pair the sliced output dims with the sliced source dims
+        source_sliced = [d for d, i in enumerate(source_index) if isinstance(i, tuple)]
+        dest_sliced = [d for d, i in enumerate(dest_index) if isinstance(i, tuple)]
+        if _region_size(source_index) != _region_size(dest_index):
+            raise ValueError(
+                f"Source and destination regions do not match in size "
+                f"(source: {source_index}, destination: {dest_index})."
+            )
+        source_dims = dict(zip(dest_sliced, source_sliced))
+
+        # Split the region along each output dim at output and source chunk bounds
+        dim_pieces: List[List[_RegionPiece]] = []
+        for dim, dim_index in enumerate(dest_index):
+            bounds = out_bounds[dim]
+            if not isinstance(dim_index, tuple):
+                block = _find_block(bounds, dim_index)
+                dim_pieces.append([(block, dim_index - int(bounds[block]), None)])
+                continue
+
+            start, stop = dim_index
+            source_dim = source_dims[dim]
+            source_bounds = data_bounds[source_dim]
+            offset = start - source_index[source_dim][0]  # type: ignore
+            cuts = sorted(
+                {start, stop}
+                | {int(bound) for bound in bounds if start < bound < stop}
+                | {
+                    int(bound) + offset
+                    for bound in source_bounds
+                    if start < bound + offset < stop
+                }
+            )
+
+            pieces: List[_RegionPiece] = []
+            for piece_start, piece_stop in zip(cuts[:-1], cuts[1:]):
+                block = _find_block(bounds, piece_start)
+                block_start = int(bounds[block])
+                source_block = _find_block(source_bounds, piece_start - offset)
+                source_start = piece_start - offset - int(source_bounds[source_block])
+                pieces.append(
+                    (
+                        block,
+                        slice(piece_start - block_start, piece_stop - block_start),
+                        (
+                            source_dim,
+                            source_block,
+                            slice(
+                                source_start, source_start + piece_stop - piece_start
+                            ),
+                        ),
+                    )
+                )
+
+            dim_pieces.append(pieces)
+
+        # The source dims dropped by an int index are read from a single block
+        source_blocks = [0] * data.ndim
+        local_source: List[Any] = [None] * data.ndim
+        for dim, dim_index in enumerate(source_index):
+            if not isinstance(dim_index, tuple):
+                source_blocks[dim] = _find_block(data_bounds[dim], dim_index)
+                local_source[dim] = dim_index - int(
+                    data_bounds[dim][source_blocks[dim]]
+                )
+
+        for region_pieces in product(*dim_pieces):
+            for _, _, source_piece in region_pieces:
+                if source_piece is not None:
+                    source_dim, source_block, source_slice = source_piece
+                    source_blocks[source_dim] = source_block
+                    local_source[source_dim] = source_slice
+
+            block_placements.setdefault(
+                tuple(block for block, _, _ in region_pieces), []
+            ).append(
+                (
+                    (data.name, *source_blocks),
+                    (
+                        tuple(local_source),
+                        tuple(local for _, local, _ in region_pieces),
+                    ),
+                )
+            )
+
+    out_name = f"{name}-{tokenize(data.name, shape, chunks, regions)}"
+    dsk: Dict[Any, Any] = {}
+    for block_index in np.ndindex(*(len(dim_chunks) for dim_chunks in chunks)):
+        placements = block_placements.get(block_index, [])
+        dsk[(out_name, *block_index)] = (
+            _paste_block,
+            tuple(chunks[dim][block] for dim, block in enumerate(block_index)),
+            data.dtype,
+            [source_key for source_key, _ in placements],
+            [placement for _, placement in placements],
+        )
+
+    graph = HighLevelGraph.from_collections(
+        out_name, dsk, dependencies=[data]  # type: ignore
+    )
+    return da.Array(graph, out_name, chunks, dtype=data.dtype)
+
+
+def crop_regions(
+    regions: Sequence[Tuple[RegionIndex, RegionIndex]],
+    data_shape: Sequence[int],
+    shape: Sequence[int],
+    crop: Sequence[slice],
+) -> Tuple[List[int], List[Tuple[RegionIndex, RegionIndex]]]:
+    """
+    Restrict a set of (source, destination) regions (see `paste_regions`) to a crop
+    of the output array, dropping the regions that don't intersect the crop.
+
+    Parameters
+    ----------
+    regions: Sequence[Tuple[RegionIndex, RegionIndex]]
+        The (source, destination) index pairs.
+    data_shape: Sequence[int]
+        The shape of the array the regions are pulled from.
+    shape: Sequence[int]
+        The shape of the full output array.
+    crop: Sequence[slice]
+        The slice (with step one) to keep along each dimension of the output array.
+
+    Returns
+    -------
+    shape: List[int]
+        The shape of the cropped output array.
+    regions: List[Tuple[RegionIndex, RegionIndex]]
+        The (source, destination) index pairs relative to the cropped output array.
+    """
+    crop_bounds = [dim_crop.indices(size)[:2] for dim_crop, size in zip(crop, shape)]
+    cropped_shape = [max(stop - start, 0) for start, stop in crop_bounds]
+
+    cropped_regions: List[Tuple[RegionIndex, RegionIndex]] = []
+    for source_index, dest_index in regions:
+        source = _normalize_region(source_index, data_shape)
+        dest = _normalize_region(dest_index, shape)
+        source_sliced = iter(d for d, i in enumerate(source) if isinstance(i, tuple))
+
+        new_source: List[Union[int, slice]] = [
+            i if isinstance(i, int) else slice(*i) for i in source
+        ]
+        new_dest: List[Union[int, slice]] = []
+        for dim_index, (crop_start, crop_stop) in zip(dest, crop_bounds):
+            if isinstance(dim_index, int):
+                if not crop_start <= dim_index < crop_stop:
+                    break
+
+                new_dest.append(dim_index - crop_start)
+                continue
+
+            start, stop = dim_index
+            overlap_start, overlap_stop = max(start, crop_start), min(stop, crop_stop)
+            if overlap_start >= overlap_stop:
+                break
+
+            new_dest.append(
+                slice(overlap_start - crop_start, overlap_stop - crop_start)
+            )
+            source_dim = next(source_sliced)
+            source_start = source[source_dim][0]  # type: ignore
+            new_source[source_dim] = slice(
+                source_start + overlap_start - start,
+                source_start + overlap_stop - start,
+            )
+
+        else:
+            # Only keep the regions intersecting the crop along every dim
+            cropped_regions.append((tuple(new_source), tuple(new_dest)))
+
+    return cropped_shape, cropped_regions
+
+
+###############################################################################
+
+# The number of batches of planes computed ahead of the consumer by `iter_planes`
+DEFAULT_MAX_BATCHES_IN_FLIGHT = 2
+
+# The number of threads `iter_planes` computes batches of planes with
+DEFAULT_MAX_WORKERS = 1
+
+
+def _compute_planes(
+    data: da.Array, plane_indices: List[Tuple[int, ...]]
+) -> Tuple[np.ndarray, ...]:
+    # Read the region of the chunk holding the planes once and slice the planes out
+    # of it rather than computing each plane from the graph
+    starts = np.min(plane_indices, axis=0)
+    stops = np.max(plane_indices, axis=0) + 1
+    region = data[tuple(slice(start, stop) for start, stop in zip(starts, stops))]
+    computed = np.asarray(region.compute())
+    return tuple(
+        computed[tuple(np.subtract(plane_index, starts))]
+        for plane_index in plane_indices
+    )
+
+
+def iter_planes(
+    data: da.Array,
+    n_plane_dims: int,
+    max_batches_in_flight: int = DEFAULT_MAX_BATCHES_IN_FLIGHT,
+    max_workers: int = DEFAULT_MAX_WORKERS,
+) -> Iterator[np.ndarray]:
+    """
+    Iterate over the planes of a dask array in C order, computing them in batches
+    ahead of the consumer with a bounded number of batches in memory.
+
+    Parameters
+    ----------
+    data: da.Array
+        The array to iterate over.
+    n_plane_dims: int
+        The number of leading dimensions to iterate over. Each yielded plane has the
+        remaining (trailing) dimensions, i.e. YX or YXS.
+    max_batches_in_flight: int
+        The maximum number of batches being computed or waiting to be consumed.
+        Default: DEFAULT_MAX_BATCHES_IN_FLIGHT (2)
+    max_workers: int
+        The number of background threads computing batches concurrently. Only useful
+        up to max_batches_in_flight, i.e. when a single batch can't keep the dask
+        scheduler busy (such as batches of a single plane).
+        Default: DEFAULT_MAX_WORKERS (1)
+
+    Yields
+    ------
+    plane: np.ndarray
+        The next plane.
+
+    Notes
+    -----
+    Each batch holds the consecutive planes of a single chunk of `data` so every
+    chunk is read once when the chunks are aligned with the plane order (i.e. the
+    trailing iterated dimensions are not split into multiple chunks). Each batch is
+    computed with the active dask scheduler while the previous batches are consumed.
+    Peak memory is therefore bounded by `max_batches_in_flight` chunks of `data`,
+    no matter the number of chunks.
+    """
+    # Batches are runs of consecutive planes from the same chunk so that no chunk
+    # is split across batches, and read more than once, even when chunks are
+    # irregular
+    plane_blocks = [
+        np.repeat(np.arange(len(dim_chunks)), dim_chunks)
+        for dim_chunks in data.chunks[:n_plane_dims]
+    ]
+    batches_of_planes = groupby(
+        np.ndindex(*data.shape[:n_plane_dims]),
+        key=lambda plane_index: tuple(
+            blocks[index] for blocks, index in zip(plane_blocks, plane_index)
+        ),
+    )
+
+    with ThreadPoolExecutor(max_workers=max(max_workers, 1)) as executor:
+        batches: Deque[Any] = deque()
+        for _, batch_plane_indices in batches_of_planes:
+            # Wait for the oldest batch to be consumed before computing more
+            if len(batches) >= max(max_batches_in_flight, 1):
+                yield from batches.popleft().result()
+
+            batches.append(
+                executor.submit(_compute_planes, data, list(batch_plane_indices))
+            )
+
+        while len(batches) > 0:
+            yield from batches.popleft().result()
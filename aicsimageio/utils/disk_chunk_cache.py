@@ -0,0 +1,221 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+import hashlib
+import os
+import tempfile
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Hashable, Iterator, List, Optional, Tuple
+
+import numpy as np
+
+from .. import types
+
+try:
+    import fcntl
+
+except ImportError:  # pragma: no cover
+    # Windows, writes are still atomic but eviction isn't serialized across processes
+    fcntl = None  # type: ignore
+
+###############################################################################
+
+# 10 GiB
+DEFAULT_DISK_CHUNK_CACHE_MAX_BYTES = 10 * 2**30
+
+CHUNK_SUFFIX = ".npy"
+LOCK_FILE_NAME = ".lock"
+
+###############################################################################
+
+
+class DiskChunkCache:
+    """
+    A size-capped, least-recently-used, on-disk cache of decoded image chunks that is
+    safe to share between processes.
+
+    Parameters
+    ----------
+    directory: types.PathLike
+        The directory to store cached chunks in. Created if it doesn't exist.
+    max_bytes: int
+        The maximum total number of bytes of chunk files to keep on disk.
+        Default: DEFAULT_DISK_CHUNK_CACHE_MAX_BYTES (10 GiB)
+
+    Notes
+    -----
+    Each chunk is stored as its own `.npy` file named by a hash of its chunk cache key
+    (see `aicsimageio.utils.chunk_cache.get_chunk_cache_key`), which includes the
+    resource signature of the image so a modified image is never served stale chunks.
+
+    Chunk files are written to a temporary file and atomically moved into place so
+    concurrent readers and writers never see partial chunks. Reading a chunk updates
+    its modification time, and eviction removes the oldest chunk files while holding
+    an exclusive lock on the cache directory.
+
+    The cap is enforced by each process based on the last directory scan plus the
+    bytes it has written since, so it may be briefly exceeded when many processes
+    write at once.
+    """
+
+    def __init__(
+        self,
+        directory: types.PathLike,
+        max_bytes: int = DEFAULT_DISK_CHUNK_CACHE_MAX_BYTES,
+    ):
+        self._directory = Path(directory).expanduser().resolve()
+        self._directory.mkdir(parents=True, exist_ok=True)
+        self._max_bytes = max_bytes
+        self._estimated_bytes: Optional[int] = None
+        self._bytes_since_scan = 0
+
+    @property
+    def directory(self) -> Path:
+        return self._directory
+
+    @property
+    def max_bytes(self) -> int:
+        return self._max_bytes
+
+    def __repr__(self) -> str:
+        return f"<DiskChunkCache [{self._directory}, max_bytes: {self._max_bytes}]>"
+
+    def __getstate__(self) -> Tuple[Path, int]:
+        # Size estimates are process specific
+        return self._directory, self._max_bytes
+
+    def __setstate__(self, state: Tuple[Path, int]) -> None:
+        self._directory, self._max_bytes = state
+        self._estimated_bytes = None
+        self._bytes_since_scan = 0
+
+    def _chunk_path(self, key: Hashable) -> Path:
+        digest = hashlib.sha256(repr(key).encode("utf-8")).hexdigest()
+        return self._directory / f"{digest}{CHUNK_SUFFIX}"
+
+    @contextmanager
+    def _lock(self) -> Iterator[None]:
+        with open(self._directory / LOCK_FILE_NAME, "a") as lock_file:
+            if fcntl is not None:
+                fcntl.flock(lock_file, fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                if fcntl is not None:
+                    fcntl.flock(lock_file, fcntl.LOCK_UN)
+
+    def _scan(self) -> List[Tuple[float, int, Path]]:
+        chunk_files = []
+        for chunk_path in self._directory.glob(f"*{CHUNK_SUFFIX}"):
+            try:
+                stat = chunk_path.stat()
+            except FileNotFoundError:
+                continue
+
+            chunk_files.append((stat.st_mtime, stat.st_size, chunk_path))
+
+        return chunk_files
+
+    @property
+    def current_bytes(self) -> int:
+        return sum(size for _, size, _ in self._scan())
+
+    def __len__(self) -> int:
+        return len(self._scan())
+
+    def get(self, key: Hashable) -> Optional[np.ndarray]:
+        """
+        Read a cached chunk from disk.
+
+        Parameters
+        ----------
+        key: Hashable
+            The key of the chunk.
+
+        Returns
+        -------
+        chunk: Optional[np.ndarray]
+            The chunk if it was cached, otherwise None.
+        """
+        chunk_path = self._chunk_path(key)
+        try:
+            chunk = np.load(chunk_path, allow_pickle=False)
+            # Mark as recently used
+            os.utime(chunk_path)
+        except (OSError, ValueError):
+            return None
+
+        return chunk
+
+    def put(self, key: Hashable, chunk: np.ndarray) -> None:
+        """
+        Write a chunk to disk, evicting the least recently used chunks to stay within
+        the size cap.
+
+        Parameters
+        ----------
+        key: Hashable
+            The key of the chunk.
+        chunk: np.ndarray
+            The decoded chunk data.
+        """
+        if chunk.nbytes > self._max_bytes:
+            return
+
+        # Write next to the final location then atomically move into place
+        fd, tmp_path = tempfile.mkstemp(dir=self._directory, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as open_resource:
+                np.save(open_resource, chunk, allow_pickle=False)
+
+            written = os.path.getsize(tmp_path)
+            os.replace(tmp_path, self._chunk_path(key))
+        except BaseException:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
+
+        # Only rescan the directory once this process may have pushed it over the cap
+        # or has written a sizable portion of the cap since the last scan
+        self._bytes_since_scan += written
+        if self._estimated_bytes is not None:
+            self._estimated_bytes += written
+        if (
+            self._estimated_bytes is None
+            or self._estimated_bytes > self._max_bytes
+            or self._bytes_since_scan > self._max_bytes // 16
+        ):
+            self._evict()
+
+    def _evict(self) -> None:
+        with self._lock():
+            chunk_files = sorted(self._scan())
+            total = sum(size for _, size, _ in chunk_files)
+            for _, size, chunk_path in chunk_files:
+                if total <= self._max_bytes:
+                    break
+
+                try:
+                    chunk_path.unlink()
+                except FileNotFoundError:
+                    pass
+
+                total -= size
+
+        self._estimated_bytes = total
+        self._bytes_since_scan = 0
+
+    def clear(self) -> None:
+        """
+        Remove every chunk file from the cache directory.
+        """
+        with self._lock():
+            for _, _, chunk_path in self._scan():
+                try:
+                    chunk_path.unlink()
+                except FileNotFoundError:
+                    pass
+
+        self._estimated_bytes = 0
+        self._bytes_since_scan = 0
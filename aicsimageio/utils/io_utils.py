@@ -2,7 +2,7 @@
 # -*- coding: utf-8 -*-
 
 from pathlib import Path
-from typing import Any, Dict, Tuple
+from typing import Any, Dict, Hashable, Tuple
 
 from fsspec.core import url_to_fs
 from fsspec.spec import AbstractFileSystem
@@ -60,3 +60,54 @@ def pathlike_to_fs(
     # any open file buffers _after_ any API call. API calls must themselves call
     # fs.open and complete their function during the context of the opened buffer.
     return fs, path
+
+
+def get_resource_signature(fs: AbstractFileSystem, path: str) -> Tuple[Hashable, ...]:
+    """
+    Get a small hashable signature for a resource that changes when the resource is
+    rewritten.
+
+    Parameters
+    ----------
+    fs: AbstractFileSystem
+        The filesystem the resource is stored on.
+    path: str
+        The full path to the resource.
+
+    Returns
+    -------
+    signature: Tuple[Hashable, ...]
+        The size and last modified marker for the resource.
+
+    Notes
+    -----
+    Not every filesystem reports the same modification details. We use the first
+    available of: mtime (local), LastModified (S3), ETag, and created.
+    """
+    info = fs.info(path)
+    for modified_key in ["mtime", "LastModified", "last_modified", "ETag", "created"]:
+        if info.get(modified_key) is not None:
+            return (info.get("size"), str(info[modified_key]))
+
+    return (info.get("size"),)
+
+
+def read_file_head(fs: AbstractFileSystem, path: str, n_bytes: int) -> bytes:
+    """
+    Read the leading bytes of a file with a single (range) request.
+
+    Parameters
+    ----------
+    fs: AbstractFileSystem
+        The filesystem to operate on.
+    path: str
+        The full path to the target resource.
+    n_bytes: int
+        The maximum number of bytes to read.
+
+    Returns
+    -------
+    head: bytes
+        The leading bytes of the file (fewer than n_bytes if the file is smaller).
+    """
+    return fs.cat_file(path, start=0, end=n_bytes)
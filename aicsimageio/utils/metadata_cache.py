@@ -0,0 +1,150 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+import hashlib
+import json
+import logging
+import os
+import tempfile
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+from fsspec.spec import AbstractFileSystem
+
+from .. import types
+from .io_utils import get_resource_signature
+
+###############################################################################
+
+log = logging.getLogger(__name__)
+
+###############################################################################
+
+METADATA_CACHE_SUFFIX = ".json"
+
+###############################################################################
+
+
+def get_metadata_cache_key(
+    fs: AbstractFileSystem,
+    path: str,
+    **kwargs: Any,
+) -> str:
+    """
+    Construct the key identifying a single image, version of the image, version of
+    aicsimageio, and set of read options in the metadata cache.
+
+    Parameters
+    ----------
+    fs: AbstractFileSystem
+        The file system the image is read from.
+    path: str
+        The path to the image.
+    kwargs: Any
+        Any options that change how the image is read and its metadata is produced
+        (i.e. the reader, reader kwargs, and mosaic reconstruction).
+
+    Returns
+    -------
+    key: str
+        The metadata cache key.
+    """
+    from .. import get_module_version
+
+    key = (
+        fs.protocol,
+        path,
+        get_resource_signature(fs, path),
+        get_module_version(),
+        sorted((name, repr(value)) for name, value in kwargs.items()),
+    )
+    return hashlib.sha256(repr(key).encode("utf-8")).hexdigest()
+
+
+class MetadataCache:
+    """
+    A directory of JSON sidecar files storing the metadata needed to describe an
+    image (reader, scenes, and per-scene dims, shape, dtype, channel names, and
+    physical pixel sizes, and the OME metadata) without parsing the image.
+
+    Parameters
+    ----------
+    directory: types.PathLike
+        The directory to store metadata sidecars in. Created if it doesn't exist.
+
+    Notes
+    -----
+    Sidecars are keyed with `get_metadata_cache_key` which includes the resource
+    signature of the image so that a modified image is never described by stale
+    metadata. Sidecars are written to a temporary file and atomically moved into
+    place so concurrent readers never see partial sidecars.
+    """
+
+    def __init__(self, directory: types.PathLike):
+        self._directory = Path(directory).expanduser().resolve()
+        self._directory.mkdir(parents=True, exist_ok=True)
+
+    @property
+    def directory(self) -> Path:
+        return self._directory
+
+    def __repr__(self) -> str:
+        return f"<MetadataCache [{self._directory}]>"
+
+    def _sidecar_path(self, key: str) -> Path:
+        return self._directory / f"{key}{METADATA_CACHE_SUFFIX}"
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """
+        Read a cached metadata entry.
+
+        Parameters
+        ----------
+        key: str
+            The metadata cache key.
+
+        Returns
+        -------
+        entry: Optional[Dict[str, Any]]
+            The cached metadata entry if present and readable, otherwise None.
+        """
+        try:
+            with open(self._sidecar_path(key), "r") as open_resource:
+                return json.load(open_resource)
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError) as e:
+            log.warning(f"Ignoring unreadable metadata cache entry ({key}): {e}")
+            return None
+
+    def put(self, key: str, entry: Dict[str, Any]) -> None:
+        """
+        Write a metadata entry, replacing any prior entry with the same key.
+
+        Parameters
+        ----------
+        key: str
+            The metadata cache key.
+        entry: Dict[str, Any]
+            The JSON serializable metadata entry.
+        """
+        fd, tmp_path = tempfile.mkstemp(dir=self._directory, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w") as open_resource:
+                json.dump(entry, open_resource)
+
+            os.replace(tmp_path, self._sidecar_path(key))
+        except BaseException:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
+
+    def clear(self) -> None:
+        """
+        Remove every metadata sidecar from the cache directory.
+        """
+        for sidecar_path in self._directory.glob(f"*{METADATA_CACHE_SUFFIX}"):
+            try:
+                sidecar_path.unlink()
+            except FileNotFoundError:
+                pass
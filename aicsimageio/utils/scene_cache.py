@@ -0,0 +1,140 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+from collections import OrderedDict
+from typing import Any, Dict, Mapping, Optional, Sequence
+
+###############################################################################
+
+DEFAULT_MAX_CACHED_SCENES = 8
+DEFAULT_MAX_IN_MEMORY_CACHED_SCENES = 0
+
+###############################################################################
+
+
+class SceneCache:
+    """
+    A bounded, least-recently-used store of the per-scene state (delayed arrays,
+    in-memory arrays, dims, metadata) of scenes that are not the current scene.
+
+    Parameters
+    ----------
+    in_memory_attrs: Mapping[str, Sequence[str]]
+        The state attributes that hold fully read (in-memory) data, each mapped to
+        the other state attributes that were derived from (and keep a reference to)
+        that in-memory data.
+    max_scenes: int
+        The maximum number of non-current scenes to keep the state of.
+        Default: DEFAULT_MAX_CACHED_SCENES (8)
+    max_in_memory_scenes: int
+        The maximum number of non-current scenes to keep in-memory data for.
+        Default: DEFAULT_MAX_IN_MEMORY_CACHED_SCENES (0, only the current scene's
+        in-memory data is kept)
+
+    Notes
+    -----
+    When a scene's in-memory data is dropped, its delayed state (which is cheap to
+    hold) is kept so that switching back to the scene is still immediate.
+    """
+
+    def __init__(
+        self,
+        in_memory_attrs: Mapping[str, Sequence[str]],
+        max_scenes: int = DEFAULT_MAX_CACHED_SCENES,
+        max_in_memory_scenes: int = DEFAULT_MAX_IN_MEMORY_CACHED_SCENES,
+    ):
+        self._in_memory_attrs = in_memory_attrs
+        self._states: "OrderedDict[int, Dict[str, Any]]" = OrderedDict()
+        self._max_scenes = max_scenes
+        self._max_in_memory_scenes = max_in_memory_scenes
+
+    @property
+    def max_scenes(self) -> int:
+        return self._max_scenes
+
+    @property
+    def max_in_memory_scenes(self) -> int:
+        return self._max_in_memory_scenes
+
+    def resize(self, max_scenes: int, max_in_memory_scenes: int) -> None:
+        """
+        Change the scene limits, dropping the least recently used state if needed.
+
+        Parameters
+        ----------
+        max_scenes: int
+            The maximum number of non-current scenes to keep the state of.
+        max_in_memory_scenes: int
+            The maximum number of non-current scenes to keep in-memory data for.
+        """
+        self._max_scenes = max_scenes
+        self._max_in_memory_scenes = max_in_memory_scenes
+        self._evict()
+
+    def clear(self) -> None:
+        self._states.clear()
+
+    def __len__(self) -> int:
+        return len(self._states)
+
+    def __contains__(self, scene_index: int) -> bool:
+        return scene_index in self._states
+
+    def _holds_memory(self, state: Dict[str, Any]) -> bool:
+        return any(state.get(attr) is not None for attr in self._in_memory_attrs)
+
+    def _evict(self) -> None:
+        # Drop the in-memory data of the least recently used scenes first
+        in_memory_scenes = [
+            scene_index
+            for scene_index, state in self._states.items()
+            if self._holds_memory(state)
+        ]
+        n_to_drop = len(in_memory_scenes) - max(self._max_in_memory_scenes, 0)
+        for scene_index in in_memory_scenes[: max(n_to_drop, 0)]:
+            state = self._states[scene_index]
+            for attr, derived_attrs in self._in_memory_attrs.items():
+                if state.get(attr) is not None:
+                    state[attr] = None
+                    for derived_attr in derived_attrs:
+                        state[derived_attr] = None
+
+        # Then drop whole scenes
+        while len(self._states) > max(self._max_scenes, 0):
+            self._states.popitem(last=False)
+
+    def store(self, scene_index: int, state: Dict[str, Any]) -> None:
+        """
+        Store the state of a scene that is no longer the current scene.
+
+        Parameters
+        ----------
+        scene_index: int
+            The index of the scene.
+        state: Dict[str, Any]
+            The state attribute names and values.
+        """
+        # Nothing worth keeping
+        if all(value is None for value in state.values()):
+            self._states.pop(scene_index, None)
+            return
+
+        self._states[scene_index] = state
+        self._states.move_to_end(scene_index)
+        self._evict()
+
+    def pop(self, scene_index: int) -> Optional[Dict[str, Any]]:
+        """
+        Remove and return the state of a scene that is becoming the current scene.
+
+        Parameters
+        ----------
+        scene_index: int
+            The index of the scene.
+
+        Returns
+        -------
+        state: Optional[Dict[str, Any]]
+            The state attribute names and values if cached, otherwise None.
+        """
+        return self._states.pop(scene_index, None)
@@ -0,0 +1,203 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+import threading
+from collections import OrderedDict
+from contextlib import contextmanager
+from typing import Any, Hashable, Iterator, Optional, Tuple
+
+import zarr
+from fsspec.spec import AbstractFileSystem
+from tifffile import TiffFile
+
+###############################################################################
+
+DEFAULT_MAX_OPEN_HANDLES = 16
+
+###############################################################################
+
+
+class _PooledTiffHandle:
+    """
+    A single open file, parsed TiffFile, zarr store, and zarr array combination.
+
+    The handle is only closed once it has been both evicted from the pool and
+    released by every reader that acquired it.
+    """
+
+    def __init__(
+        self,
+        fs: AbstractFileSystem,
+        path: str,
+        series: int,
+        level: int,
+        chunkmode: Optional[str],
+    ):
+        self.open_resource = fs.open(path)
+        try:
+            self.tiff = TiffFile(self.open_resource)
+            self.store = self.tiff.aszarr(
+                series=series, level=level, chunkmode=chunkmode
+            )
+            self.array = zarr.open(self.store, mode="r")
+        except Exception:
+            self.open_resource.close()
+            raise
+
+        self.users = 0
+        self.evicted = False
+
+    def close(self) -> None:
+        self.store.close()
+        self.tiff.close()
+        self.open_resource.close()
+
+
+class TiffHandlePool:
+    """
+    A thread-safe, least-recently-used pool of open TIFF files and their zarr stores.
+
+    Chunk reads that go through the pool only pay for opening the file and walking
+    the IFD chain once per (filesystem, path, file signature, series, level, chunk
+    mode) instead of once per chunk.
+
+    Parameters
+    ----------
+    max_size: int
+        The maximum number of handles to keep open.
+        Default: DEFAULT_MAX_OPEN_HANDLES (16)
+
+    Notes
+    -----
+    Handles are keyed by the resource signature (see
+    `aicsimageio.utils.io_utils.get_resource_signature`) so that a rewritten file is
+    never read through a stale handle.
+
+    A handle that is evicted while it is in use by another thread is only closed once
+    that thread releases it.
+    """
+
+    def __init__(self, max_size: int = DEFAULT_MAX_OPEN_HANDLES):
+        self._lock = threading.Lock()
+        self._handles: "OrderedDict[Hashable, _PooledTiffHandle]" = OrderedDict()
+        self._max_size = max_size
+
+    @property
+    def max_size(self) -> int:
+        return self._max_size
+
+    def resize(self, max_size: int) -> None:
+        """
+        Change the maximum number of open handles, closing the least recently used
+        handles if needed.
+
+        Parameters
+        ----------
+        max_size: int
+            The new maximum number of handles to keep open.
+        """
+        with self._lock:
+            self._max_size = max_size
+            self._evict()
+
+    def clear(self) -> None:
+        """
+        Close (or mark for closing if in use) every handle in the pool.
+        """
+        with self._lock:
+            while len(self._handles) > 0:
+                _, handle = self._handles.popitem(last=False)
+                self._retire(handle)
+
+    def __len__(self) -> int:
+        return len(self._handles)
+
+    def _retire(self, handle: _PooledTiffHandle) -> None:
+        handle.evicted = True
+        if handle.users == 0:
+            handle.close()
+
+    def _evict(self) -> None:
+        while len(self._handles) > max(self._max_size, 0):
+            _, handle = self._handles.popitem(last=False)
+            self._retire(handle)
+
+    @contextmanager
+    def open(
+        self,
+        fs: AbstractFileSystem,
+        path: str,
+        series: int = 0,
+        level: int = 0,
+        signature: Optional[Tuple[Hashable, ...]] = None,
+        chunkmode: Optional[str] = "page",
+    ) -> Iterator[Any]:
+        """
+        Acquire the zarr array for a TIFF series and level from the pool, opening the
+        file if it isn't already open.
+
+        Parameters
+        ----------
+        fs: AbstractFileSystem
+            The file system to use for reading.
+        path: str
+            The path to the file to read.
+        series: int
+            The series (scene) index to create the zarr array for.
+            Default: 0
+        level: int
+            The pyramid level to create the zarr array for.
+            Default: 0
+        signature: Optional[Tuple[Hashable, ...]]
+            The resource signature to use as part of the pool key.
+            Default: None (no signature, the handle is reused until evicted)
+        chunkmode: Optional[str]
+            The tifffile chunk mode of the zarr store. "page" stores each page as a
+            single chunk, None stores each tile (or strip) as a chunk so that reading
+            a Y/X region only decodes the intersecting tiles.
+            Default: "page"
+
+        Yields
+        ------
+        array: zarr.Array
+            The zarr array for the requested series and level.
+        """
+        key = (fs, path, signature, series, level, chunkmode)
+
+        with self._lock:
+            handle = self._handles.get(key)
+            if handle is not None:
+                self._handles.move_to_end(key)
+                handle.users += 1
+
+        # Open outside of the pool lock so that slow (remote) opens
+        # don't block reads of other files
+        if handle is None:
+            new_handle = _PooledTiffHandle(fs, path, series, level, chunkmode)
+            with self._lock:
+                handle = self._handles.get(key)
+
+                # Another thread opened the same file while we were, use theirs
+                if handle is not None:
+                    self._handles.move_to_end(key)
+                    handle.users += 1
+                    new_handle.close()
+                else:
+                    handle = new_handle
+                    handle.users += 1
+                    self._handles[key] = handle
+                    self._evict()
+
+        try:
+            yield handle.array
+        finally:
+            with self._lock:
+                handle.users -= 1
+                if handle.evicted and handle.users == 0:
+                    handle.close()
+
+
+###############################################################################
+
+# The process-wide pool used by TiffReader and OmeTiffReader chunk reads
+TIFF_HANDLE_POOL = TiffHandlePool()
@@ -1,4 +1,6 @@
 #!/usr/bin/env python
 # -*- coding: utf-8 -*-
 
+from .ome_tiff_append_writer import OmeTiffAppendWriter  # noqa: F401
 from .ome_tiff_writer import OmeTiffWriter  # noqa: F401
+from .ome_zarr_writer import OmeZarrWriter  # noqa: F401
@@ -0,0 +1,352 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+import logging
+from types import TracebackType
+from typing import Any, Dict, List, Optional, Tuple, Type, Union
+
+import numpy as np
+import tifffile
+from fsspec.implementations.local import LocalFileSystem
+from ome_types import to_xml
+from tifffile import TIFF
+
+from .. import exceptions, types
+from ..dimensions import DEFAULT_DIMENSION_ORDER, DimensionNames
+from ..utils import io_utils
+from .ome_tiff_writer import DEFAULT_COMPRESSION, OmeTiffWriter
+
+###############################################################################
+
+log = logging.getLogger(__name__)
+
+###############################################################################
+
+# Bytes reserved after the OME-XML description so that it can be patched in place
+# as timepoints are appended (only the SizeT and plane count digits grow)
+DESCRIPTION_RESERVE_BYTES = 1024
+
+###############################################################################
+
+
+class OmeTiffAppendWriter:
+    """
+    An OME-TIFF writer that appends timepoints (or planes of a timepoint) to a file
+    as they are produced, i.e. during acquisition.
+
+    Parameters
+    ----------
+    uri: types.PathLike
+        The URI or local path for where to save the data.
+        Note: OmeTiffAppendWriter can only write to local file systems.
+    shape: Tuple[int, ...]
+        The shape of a single timepoint.
+    dtype: Union[str, np.dtype, Type[np.generic]]
+        The dtype of the data.
+    dim_order: Optional[str]
+        The dimension order of a single timepoint, composed of some subset of CZYXS.
+        If S is present it must be last and its data count must be 3 or 4.
+        Default: None (guess the dimensions based on a CZYX ordering)
+    channel_names: Optional[List[str]]
+        The names of the data channels.
+        Default: None (generate "Channel:0:channel_index" names)
+    image_name: Optional[str]
+        The name of the image.
+        Default: None (generate the "Image:0" name)
+    physical_pixel_sizes: Optional[types.PhysicalPixelSizes]
+        The physical pixel sizes in Z, Y, X in microns.
+        Default: None
+    channel_colors: Optional[List[List[int]]]
+        The rgb color value of each channel.
+        Default: None
+    fs_kwargs: Dict[str, Any]
+        Any specific keyword arguments to pass down to the fsspec created filesystem.
+        Default: {}
+    tile: Optional[Tuple[int, int]]
+        The (Y, X) shape of the tiles to write planes as.
+        Default: None (write planes as strips)
+    compression: Optional[Union[str, int, TIFF.COMPRESSION]]
+        The compression codec to write planes with.
+        Default: DEFAULT_COMPRESSION (ADOBE_DEFLATE)
+    compression_level: Optional[int]
+        The level to compress with.
+        Default: None (the codec default)
+    predictor: Optional[Union[bool, str, int, TIFF.PREDICTOR]]
+        The predictor applied to planes before compression.
+        Default: None (no predictor)
+    bigtiff: bool
+        Whether to write a BigTIFF file. The final size of the file isn't known
+        upfront so this should only be disabled for acquisitions known to stay
+        below 4GB.
+        Default: True
+
+    Examples
+    --------
+    Write timepoints as they are acquired
+
+    >>> with OmeTiffAppendWriter(
+    ...     "file.ome.tiff", shape=(2, 10, 1024, 1024), dtype=np.uint16
+    ... ) as writer:
+    ...     for timepoint in acquisition:
+    ...         writer.append(timepoint)
+
+    Write planes as they are acquired
+
+    >>> with OmeTiffAppendWriter(
+    ...     "file.ome.tiff", shape=(2, 1024, 1024), dtype=np.uint16, dim_order="CYX"
+    ... ) as writer:
+    ...     for plane in acquisition:
+    ...         writer.append(plane)
+
+    Notes
+    -----
+    Each appended plane is written to the file immediately, so memory use doesn't
+    grow with the length of the acquisition. The OME-XML description of the file is
+    patched in place after every append to describe all complete timepoints, so a
+    crashed acquisition leaves a valid OME-TIFF of every timepoint written before
+    the crash. Planes of an incomplete timepoint are never described.
+    """
+
+    def __init__(
+        self,
+        uri: types.PathLike,
+        shape: Tuple[int, ...],
+        dtype: Union[str, np.dtype, Type[np.generic]],
+        dim_order: Optional[str] = None,
+        channel_names: Optional[List[str]] = None,
+        image_name: Optional[str] = None,
+        physical_pixel_sizes: Optional[types.PhysicalPixelSizes] = None,
+        channel_colors: Optional[List[List[int]]] = None,
+        fs_kwargs: Dict[str, Any] = {},
+        tile: Optional[Tuple[int, int]] = None,
+        compression: Optional[Union[str, int, TIFF.COMPRESSION]] = DEFAULT_COMPRESSION,
+        compression_level: Optional[int] = None,
+        predictor: Optional[Union[bool, str, int, TIFF.PREDICTOR]] = None,
+        bigtiff: bool = True,
+    ):
+        # Resolve final destination
+        fs, self._path = io_utils.pathlike_to_fs(uri, fs_kwargs=fs_kwargs)
+
+        # Catch non-local file system
+        if not isinstance(fs, LocalFileSystem):
+            raise ValueError(
+                f"Cannot write to non-local file system. "
+                f"Received URI: {uri}, which points to {type(fs)}."
+            )
+
+        # Resolve the dimensions of a single timepoint
+        if dim_order is None:
+            dim_order = DEFAULT_DIMENSION_ORDER[-len(shape) :]
+        if DimensionNames.Time in dim_order:
+            raise exceptions.InvalidDimensionOrderingError(
+                f"OmeTiffAppendWriter appends timepoints, the dimension order of a "
+                f"single timepoint can't include the {DimensionNames.Time} dimension. "
+                f"Received dim_order: {dim_order}."
+            )
+        if len(dim_order) != len(shape):
+            raise exceptions.InvalidDimensionOrderingError(
+                f"Dimension order string has {len(dim_order)} dims but timepoint "
+                f"shape has {len(shape)} dims"
+            )
+
+        self._shape = tuple(shape)
+        self._dtype = np.dtype(dtype)
+        self._dim_order = dim_order
+        self._is_rgb = dim_order[-1] == DimensionNames.Samples and (
+            shape[-1] == 3 or shape[-1] == 4
+        )
+        self._n_plane_dims = 3 if self._is_rgb else 2
+        self._plane_shape = self._shape[-self._n_plane_dims :]
+        self._planes_per_timepoint = int(
+            np.prod(self._shape[: -self._n_plane_dims], dtype=int)
+        )
+        self._channel_names = channel_names
+        self._image_name = image_name
+        self._physical_pixel_sizes = physical_pixel_sizes
+        self._channel_colors = channel_colors
+        self._write_kwargs = dict(
+            photometric=(
+                TIFF.PHOTOMETRIC.RGB if self._is_rgb else TIFF.PHOTOMETRIC.MINISBLACK
+            ),
+            planarconfig=TIFF.PLANARCONFIG.CONTIG if self._is_rgb else None,
+            tile=tile,
+            compression=compression,
+            compressionargs=(
+                {"level": compression_level} if compression_level is not None else None
+            ),
+            predictor=predictor,
+            metadata=None,
+        )
+
+        # Validates the dimensions and metadata before anything is written
+        description = self._build_description(1)
+        self._description_size = len(description) + DESCRIPTION_RESERVE_BYTES
+        self._initial_description = description.ljust(self._description_size)
+
+        self._tif: Optional[tifffile.TiffWriter] = tifffile.TiffWriter(
+            self._path, bigtiff=bigtiff
+        )
+        self._n_planes = 0
+        self._described_timepoints = 0
+
+    @property
+    def shape(self) -> Tuple[int, ...]:
+        """
+        Returns
+        -------
+        shape: Tuple[int, ...]
+            The TCZYX(S) shape of the complete timepoints written so far.
+        """
+        return (self.n_timepoints,) + self._shape
+
+    @property
+    def n_timepoints(self) -> int:
+        """
+        Returns
+        -------
+        n_timepoints: int
+            The number of complete timepoints written so far.
+        """
+        return self._n_planes // self._planes_per_timepoint
+
+    @property
+    def closed(self) -> bool:
+        return self._tif is None
+
+    def _build_description(self, n_timepoints: int) -> bytes:
+        ome = OmeTiffWriter.build_ome(
+            [(n_timepoints,) + self._shape],
+            [self._dtype],
+            dimension_order=[DimensionNames.Time + self._dim_order],
+            channel_names=[self._channel_names],
+            image_name=[self._image_name],
+            physical_pixel_sizes=[
+                self._physical_pixel_sizes or types.PhysicalPixelSizes(None, None, None)
+            ],
+            channel_colors=[self._channel_colors],
+        )
+        return to_xml(ome).encode()
+
+    def append(self, data: types.ArrayLike) -> None:
+        """
+        Write one or more planes to the end of the file.
+
+        Parameters
+        ----------
+        data: types.ArrayLike
+            The data to append. Its shape must match the trailing dimensions of the
+            timepoint shape, i.e. a full CZYX timepoint, a ZYX stack of a single
+            channel, or a single YX plane. Planes are appended in CZ order, so a
+            single channel stack or plane continues the current timepoint.
+            Multiple TCZYX timepoints can also be appended at once.
+
+        Raises
+        ------
+        ValueError
+            The writer is closed or the data has an unexpected dtype.
+        exceptions.UnexpectedShapeError
+            The data doesn't match the timepoint shape or doesn't start at the first
+            plane of a stack of its shape.
+        """
+        if self._tif is None:
+            raise ValueError("Cannot append to a closed OmeTiffAppendWriter.")
+
+        data = np.asarray(data)
+        if data.dtype != self._dtype:
+            raise ValueError(
+                f"OmeTiffAppendWriter was opened with dtype: {self._dtype} but "
+                f"received data with dtype: {data.dtype}."
+            )
+
+        # Either whole timepoints or the trailing dimensions of a single timepoint
+        is_timepoints = data.shape[1:] == self._shape
+        is_sub_timepoint = (
+            self._n_plane_dims <= data.ndim <= len(self._shape)
+            and data.shape == self._shape[len(self._shape) - data.ndim :]
+        )
+        if not (is_timepoints or is_sub_timepoint):
+            raise exceptions.UnexpectedShapeError(
+                f"OmeTiffAppendWriter expects planes of a timepoint with shape: "
+                f"{self._shape} (dim_order: {self._dim_order}). "
+                f"Received data with shape: {data.shape}."
+            )
+
+        # Whole timepoints must start a timepoint, a stack must start where a stack
+        # of its shape starts in the timepoint
+        n_data_planes = int(np.prod(data.shape[: -self._n_plane_dims], dtype=int))
+        if is_timepoints:
+            n_data_planes = self._planes_per_timepoint
+        if self._n_planes % n_data_planes != 0:
+            raise exceptions.UnexpectedShapeError(
+                f"OmeTiffAppendWriter can't append data with shape: {data.shape} "
+                f"after {self._n_planes % self._planes_per_timepoint} planes of the "
+                f"current timepoint (shape: {self._shape}, "
+                f"dim_order: {self._dim_order})."
+            )
+
+        for plane in data.reshape((-1,) + self._plane_shape):
+            self._tif.write(
+                plane,
+                description=self._initial_description if self._n_planes == 0 else None,
+                **self._write_kwargs,
+            )
+            self._n_planes += 1
+
+        self._patch_description()
+
+    def _patch_description(self, final: bool = False) -> None:
+        if self.n_timepoints == self._described_timepoints or self.n_timepoints == 0:
+            return
+
+        description = self._build_description(self.n_timepoints)
+
+        # Only patch in place while the file is open, a longer description would be
+        # moved to the end of the file where the next planes are written
+        if len(description) > self._description_size:
+            if not final:
+                return
+        else:
+            description = description.ljust(self._description_size)
+
+        if self._tif is not None:
+            self._tif.filehandle.flush()
+
+        tifffile.tiffcomment(self._path, description)
+        self._described_timepoints = self.n_timepoints
+
+    def close(self) -> None:
+        """
+        Finish writing the file and patch the OME-XML description to describe every
+        complete timepoint.
+        """
+        if self._tif is None:
+            return
+
+        self._tif.close()
+        self._tif = None
+
+        n_incomplete_planes = self._n_planes % self._planes_per_timepoint
+        if n_incomplete_planes > 0:
+            log.warning(
+                f"OmeTiffAppendWriter closed with {n_incomplete_planes} planes of an "
+                f"incomplete timepoint. These planes are not described by the "
+                f"OME-XML metadata."
+            )
+
+        self._patch_description(final=True)
+
+    def __enter__(self) -> "OmeTiffAppendWriter":
+        return self
+
+    def __exit__(
+        self,
+        exc_type: Optional[Type[BaseException]],
+        exc_value: Optional[BaseException],
+        traceback: Optional[TracebackType],
+    ) -> None:
+        self.close()
+
+    def __del__(self) -> None:
+        # Writes the remaining TIFF structures if the writer was never closed
+        if getattr(self, "_tif", None) is not None:
+            self.close()
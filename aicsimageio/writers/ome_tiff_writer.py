@@ -1,26 +1,23 @@
 #!/usr/bin/env python
 # -*- coding: utf-8 -*-
 
-from typing import Any, Dict, List, Optional, Tuple, Union
+import tempfile
+from typing import Any, Dict, Iterator, List, Optional, Tuple, Union
 
 import dask.array as da
 import numpy as np
 import tifffile
+import zarr
 from fsspec.implementations.local import LocalFileSystem
 from ome_types import from_xml, to_xml
-from ome_types.model import OME, Channel, Image, Pixels, TiffData
-from ome_types.model.simple_types import ChannelID, Color, PositiveFloat, PositiveInt
+from ome_types.model import OME
+from ome_types.model.simple_types import PositiveInt
 from tifffile import TIFF
 
-from .. import exceptions, get_module_version, types
-from ..dimensions import (
-    DEFAULT_DIMENSION_ORDER,
-    DEFAULT_DIMENSION_ORDER_LIST_WITH_SAMPLES,
-    DEFAULT_DIMENSION_ORDER_WITH_SAMPLES,
-    DimensionNames,
-)
+from .. import exceptions, transforms, types
+from ..dimensions import DimensionNames
 from ..metadata import utils
-from ..utils import io_utils
+from ..utils import dask_utils, io_utils
 from .writer import Writer
 
 # This is the threshold to use BigTiff, if it's the 4GB boundary it should be 2**22 but
@@ -29,6 +26,8 @@ from .writer import Writer
 # calculate it but for now this is a stopgap working value
 BIGTIFF_BYTE_LIMIT = 2**21
 
+DEFAULT_COMPRESSION = TIFF.COMPRESSION.ADOBE_DEFLATE
+
 
 class OmeTiffWriter(Writer):
     @staticmethod
@@ -46,6 +45,14 @@ class OmeTiffWriter(Writer):
             Union[List[List[int]], List[Optional[List[List[int]]]]]
         ] = None,
         fs_kwargs: Dict[str, Any] = {},
+        tile: Optional[Tuple[int, int]] = None,
+        compression: Optional[Union[str, int, TIFF.COMPRESSION]] = DEFAULT_COMPRESSION,
+        compression_level: Optional[int] = None,
+        predictor: Optional[Union[bool, str, int, TIFF.PREDICTOR]] = None,
+        maxworkers: Optional[int] = None,
+        pyramid_levels: Optional[int] = None,
+        downsample_factors: Optional[List[int]] = None,
+        downsample_method: str = "mean",
         **kwargs: Any,
     ) -> None:
         """
@@ -58,6 +65,9 @@ class OmeTiffWriter(Writer):
             list is provided, then it is understood to be multiple images written to the
             ome-tiff file. All following metadata parameters will be expanded to the
             length of this list.
+            Dask arrays are written plane by plane as their chunks are computed
+            (see `aicsimageio.utils.dask_utils.iter_planes`) and are never fully
+            loaded into memory.
         uri: types.PathLike
             The URI or local path for where to save the data.
             Note: OmeTiffWriter can only write to local file systems.
@@ -102,11 +112,60 @@ class OmeTiffWriter(Writer):
             Any specific keyword arguments to pass down to the fsspec created
             filesystem.
             Default: {}
+        tile: Optional[Tuple[int, int]]
+            The (Y, X) shape of the tiles to write planes as. Both must be multiples
+            of 16. Tiled planes make reading regions of the image cheap.
+            Default: None (write planes as strips)
+        compression: Optional[Union[str, int, TIFF.COMPRESSION]]
+            The compression codec to write planes with, i.e. "zlib" (deflate), "zstd",
+            "lzw", or "jpeg" (uint8 data only). Any codec supported by tifffile can
+            be used. Use None (or "none") to write uncompressed planes.
+            Default: DEFAULT_COMPRESSION (ADOBE_DEFLATE)
+        compression_level: Optional[int]
+            The level to compress with, i.e. 1 to 9 for "zlib".
+            Default: None (the codec default)
+        predictor: Optional[Union[bool, str, int, TIFF.PREDICTOR]]
+            The predictor applied to planes before compression, i.e. True (the
+            predictor best suited to the dtype), "horizontal", or "floatingpoint".
+            Default: None (no predictor)
+        maxworkers: Optional[int]
+            The maximum number of threads to compress the tiles or strips of each
+            plane with. Use 1 to disable multithreaded compression.
+            Default: None (up to half of the CPU cores for large planes)
+        pyramid_levels: Optional[int]
+            The number of reduced resolution levels to write after each full
+            resolution image, each downsampled by
+            transforms.DEFAULT_DOWNSAMPLE_FACTOR (2) in Y and X from the level above.
+            Default: None (only write the full resolution image)
+        downsample_factors: Optional[List[int]]
+            The Y and X downsampling factor of each reduced resolution level relative
+            to the level above, i.e. [2, 2, 4] for levels at 1/2, 1/4, and 1/16 of
+            the full resolution. Can't be combined with pyramid_levels.
+            Default: None (only write the full resolution image)
+        downsample_method: str
+            How reduced resolution levels are downsampled, one of "mean", "nearest",
+            or "max" (see `aicsimageio.transforms.downsample`).
+            Default: "mean"
 
         Raises
         ------
         ValueError:
             Non-local file system URI provided.
+        ValueError:
+            JPEG compression requested for non-uint8 data.
+        ValueError:
+            Invalid downsample factors or method provided.
+        exceptions.ConflictingArgumentsError:
+            Both pyramid_levels and downsample_factors provided.
+
+        Notes
+        -----
+        Reduced resolution levels are written as SubIFDs of the full resolution
+        planes, as described by the OME-TIFF pyramid specification. Each level is
+        generated from the level above. Dask levels are computed once, plane by
+        plane, into a temporary zarr store which the level is then written from and
+        the next level is generated from, so the full resolution data is only read
+        twice no matter how many levels are written.
 
         Examples
         --------
@@ -198,11 +257,25 @@ class OmeTiffWriter(Writer):
                                 f"{len(channel_colors)}"
                             )
 
+        # Resolve the reduced resolution levels to write
+        downsample_factors = transforms.resolve_downsample_factors(
+            pyramid_levels, downsample_factors, method=downsample_method
+        )
+
         # make sure data is a list
         if not isinstance(data, list):
             data = [data]
         num_images = len(data)
 
+        # JPEG can only encode 8 bit data
+        if compression is not None and OmeTiffWriter._is_jpeg(compression):
+            for scene_data in data:
+                if scene_data.dtype != np.uint8:
+                    raise ValueError(
+                        f"JPEG compression can only be used to write uint8 data. "
+                        f"Received data with dtype: {scene_data.dtype}."
+                    )
+
         # If metadata is attached as singles, expand to lists to match data
         if dim_order is None or isinstance(dim_order, str):
             dim_order = [dim_order] * num_images
@@ -282,10 +355,7 @@ class OmeTiffWriter(Writer):
 
             # now the heavy lifting. assemble the raw data and write it
             for scene_index in range(num_images):
-                image_data = data[scene_index]
-                # Assumption: if provided a dask array to save, it can fit into memory
-                if isinstance(image_data, da.core.Array):
-                    image_data = data[scene_index].compute()
+                scene_data = data[scene_index]
 
                 description = xml if scene_index == 0 else None
                 # assume if first channel is rgb then all of it is
@@ -295,123 +365,139 @@ class OmeTiffWriter(Writer):
                     TIFF.PHOTOMETRIC.RGB if is_rgb else TIFF.PHOTOMETRIC.MINISBLACK
                 )
                 planarconfig = TIFF.PLANARCONFIG.CONTIG if is_rgb else None
-                tif.write(
-                    image_data,
-                    description=description,
+                write_kwargs = dict(
                     photometric=photometric,
-                    metadata=None,
                     planarconfig=planarconfig,
-                    compression=TIFF.COMPRESSION.ADOBE_DEFLATE,
+                    tile=tile,
+                    compression=compression,
+                    compressionargs=(
+                        {"level": compression_level}
+                        if compression_level is not None
+                        else None
+                    ),
+                    predictor=predictor,
+                    maxworkers=maxworkers,
+                )
+
+                OmeTiffWriter._write_image(
+                    tif,
+                    scene_data,
+                    is_rgb=is_rgb,
+                    description=description,
+                    metadata=None,
+                    subifds=(
+                        len(downsample_factors) if len(downsample_factors) > 0 else None
+                    ),
+                    **write_kwargs,
                 )
 
+                # Write each reduced resolution level as SubIFDs of the planes above
+                with tempfile.TemporaryDirectory() as level_dir:
+                    level_data = scene_data
+                    for level, factor in enumerate(downsample_factors):
+                        level_factors = [1] * level_data.ndim
+                        level_factors[-3 if is_rgb else -2] = factor
+                        level_factors[-2 if is_rgb else -1] = factor
+                        level_data = transforms.downsample(
+                            level_data, tuple(level_factors), method=downsample_method
+                        )
+
+                        # Don't recompute every level from the full resolution data
+                        if isinstance(level_data, da.core.Array):
+                            level_data = OmeTiffWriter._materialize_level(
+                                level_data,
+                                f"{level_dir}/{level}.zarr",
+                                is_rgb=is_rgb,
+                            )
+
+                        OmeTiffWriter._write_image(
+                            tif,
+                            level_data,
+                            is_rgb=is_rgb,
+                            subfiletype=TIFF.FILETYPE.REDUCEDIMAGE,
+                            **write_kwargs,
+                        )
+
             tif.close()
 
     @staticmethod
-    def _resolve_OME_dimension_order(
-        shape: Tuple[int, ...], dimension_order: Union[str, None]
-    ) -> Tuple[str, bool]:
-        """
-        Do some dimension validation and return an ome-compatible 5D dimension order
-        and whether the data is rgb multisample
+    def _write_image(
+        tif: tifffile.TiffWriter,
+        image: types.ArrayLike,
+        is_rgb: bool,
+        **kwargs: Any,
+    ) -> None:
+        image_data: Union[types.ArrayLike, Iterator[np.ndarray]] = image
 
-        Parameters
-        ----------
-        shape: Tuple[int, ...]
-            A data array shape
-        dimension_order: Union[str, None]
-            A dimension order string, composed of some subset of TCZYXS
+        # Stream dask arrays plane by plane instead of computing the image
+        if isinstance(image, da.core.Array):
+            image_data = dask_utils.iter_planes(
+                image,
+                n_plane_dims=image.ndim - (3 if is_rgb else 2),
+            )
 
-        Returns
-        -------
-        Tuple[str, bool]
-            An OME-compatible 5D dimension_order string and a boolean for whether the
-            data shape had rgb samples
-        """
-        ndims = len(shape)
+            # Streamed tiled planes are written tile by tile
+            if kwargs.get("tile") is not None:
+                image_data = OmeTiffWriter._iter_tiles(image_data, kwargs["tile"])
 
-        if ndims > 5 and (shape[-1] != 3 and shape[-1] != 4):
-            raise ValueError(
-                f"Passed in greater than 5D data but last dimension is not 3 or 4: "
-                f"{shape[-1]}"
-            )
+        tif.write(image_data, shape=image.shape, dtype=image.dtype, **kwargs)
 
-        if dimension_order is not None and len(dimension_order) != ndims:
-            raise exceptions.InvalidDimensionOrderingError(
-                f"Dimension order string has {len(dimension_order)} dims but data "
-                f"shape has {ndims} dims"
-            )
+    @staticmethod
+    def _materialize_level(
+        level_data: da.Array,
+        store_path: str,
+        is_rgb: bool,
+    ) -> da.Array:
+        """
+        Compute a lazy resolution level into a zarr store chunked by plane and
+        return a dask array reading from that store.
+        """
+        n_plane_dims = level_data.ndim - (3 if is_rgb else 2)
+        chunks = (1,) * n_plane_dims + level_data.shape[n_plane_dims:]
+        target = zarr.open(
+            store_path,
+            mode="w",
+            shape=level_data.shape,
+            chunks=chunks,
+            dtype=level_data.dtype,
+        )
+        da.store(level_data.rechunk(chunks), target, lock=False)
 
-        # data is rgb if last dimension is S and its size is 3 or 4
-        is_rgb = False
-        if dimension_order is None:
-            # we will only guess rgb here if ndims > 5
-            # I could make a better guess if I look at any ome-xml passed in
-            is_rgb = ndims > 5 and (shape[-1] == 3 or shape[-1] == 4)
-            dimension_order = (
-                DEFAULT_DIMENSION_ORDER_WITH_SAMPLES
-                if is_rgb
-                else DEFAULT_DIMENSION_ORDER
-            )
-        else:
-            is_rgb = dimension_order[-1] == DimensionNames.Samples and (
-                shape[-1] == 3 or shape[-1] == 4
-            )
+        return da.from_zarr(target)
 
-        if (ndims > 5 and not is_rgb) or ndims > 6 or ndims < 2:
-            raise ValueError(
-                f"Data array has unexpected number of dimensions: is_rgb = {is_rgb} "
-                f"and shape is {shape}"
-            )
+    @staticmethod
+    def _is_jpeg(compression: Union[str, int, TIFF.COMPRESSION]) -> bool:
+        if isinstance(compression, str):
+            return compression.upper() == "JPEG"
 
-        # assert valid characters in dimension_order
-        if not (
-            all(d in DEFAULT_DIMENSION_ORDER_LIST_WITH_SAMPLES for d in dimension_order)
-        ):
-            raise exceptions.InvalidDimensionOrderingError(
-                f"Invalid dimension_order {dimension_order}"
-            )
-        if dimension_order.find(DimensionNames.Samples) > -1 and not is_rgb:
-            raise exceptions.InvalidDimensionOrderingError(
-                "Samples must be last dimension if present, and only S=3 or 4 is \
-                supported."
-            )
-        if dimension_order[-2:] != "YX" and dimension_order[-3:] != "YXS":
-            raise exceptions.InvalidDimensionOrderingError(
-                f"Last characters of dimension_order {dimension_order} expected to \
-                be YX or YXS.  Please transpose your data."
-            )
+        return compression == TIFF.COMPRESSION.JPEG
 
-        # remember whether S was a dim or not, and remove it for now
-        if is_rgb:
-            ndims = ndims - 1
-            dimension_order = dimension_order[:-1]
-
-        # expand to 5D and add appropriate dimensions
-        if len(dimension_order) == 2:
-            dimension_order = "TCZ" + dimension_order
-
-        # expand to 5D and add appropriate dimensions
-        elif len(dimension_order) == 3:
-            # prepend either TC, TZ or CZ
-            if dimension_order[0] == DimensionNames.Time:
-                dimension_order = "CZ" + dimension_order
-            elif dimension_order[0] == DimensionNames.Channel:
-                dimension_order = "TZ" + dimension_order
-            elif dimension_order[0] == DimensionNames.SpatialZ:
-                dimension_order = "TC" + dimension_order
-
-        # expand to 5D and add appropriate dimensions
-        elif len(dimension_order) == 4:
-            # prepend either T, C, or Z
-            first2 = dimension_order[:2]
-            if first2 == "TC" or first2 == "CT":
-                dimension_order = DimensionNames.SpatialZ + dimension_order
-            elif first2 == "TZ" or first2 == "ZT":
-                dimension_order = DimensionNames.Channel + dimension_order
-            elif first2 == "CZ" or first2 == "ZC":
-                dimension_order = DimensionNames.Time + dimension_order
-
-        return dimension_order, is_rgb
+    @staticmethod
+    def _iter_tiles(
+        planes: Iterator[np.ndarray], tile: Tuple[int, int]
+    ) -> Iterator[np.ndarray]:
+        # Tiles are written in row-major order as full sized, zero-padded
+        # (length, width, samples) arrays, the tile shape tifffile passes to the
+        # codecs, so that any predictor is applied along the width of the tile and
+        # tifffile never has to pad edge tiles
+        for plane in planes:
+            if plane.ndim == 2:
+                plane = plane[..., np.newaxis]
+
+            for y in range(0, plane.shape[0], tile[0]):
+                for x in range(0, plane.shape[1], tile[1]):
+                    tile_data = plane[y : y + tile[0], x : x + tile[1]]
+                    if tile_data.shape[:2] != tile:
+                        tile_data = np.pad(
+                            tile_data,
+                            (
+                                (0, tile[0] - tile_data.shape[0]),
+                                (0, tile[1] - tile_data.shape[1]),
+                                (0, 0),
+                            ),
+                        )
+
+                    yield np.ascontiguousarray(tile_data)
 
     @staticmethod
     def _size_of_ndarray(data: List[types.ArrayLike]) -> int:
@@ -431,145 +517,6 @@ class OmeTiffWriter(Writer):
             size += data[i].size * data[i].itemsize
         return size
 
-    @staticmethod
-    def _extend_data_shape(shape: Tuple[int, ...], num_dims: int) -> Tuple[int, ...]:
-        # extend data shape to be same len as dimension_order
-        if len(shape) < num_dims:
-            shape = tuple([1] * (num_dims - len(shape))) + shape
-        return shape
-
-    @staticmethod
-    def _build_ome_image(
-        image_index: int = 0,
-        tiff_plane_offset: int = 0,
-        data_shape: Tuple[int, ...] = (1, 1, 1, 1, 1),
-        data_dtype: np.dtype = np.dtype(np.uint8),
-        is_rgb: bool = False,
-        dimension_order: str = DEFAULT_DIMENSION_ORDER,
-        image_name: Optional[str] = "I0",
-        physical_pixel_sizes: types.PhysicalPixelSizes = types.PhysicalPixelSizes(
-            None, None, None
-        ),
-        channel_names: List[str] = None,
-        channel_colors: Optional[List[List[int]]] = None,
-    ) -> Image:
-        if len(data_shape) < 2 or len(data_shape) > 6:
-            raise ValueError(f"Bad OME image shape length: {data_shape}")
-
-        # extend data shape to be same len as dimension_order, accounting for rgb
-        if is_rgb:
-            data_shape = OmeTiffWriter._extend_data_shape(
-                data_shape, len(dimension_order) + 1
-            )
-        else:
-            data_shape = OmeTiffWriter._extend_data_shape(
-                data_shape, len(dimension_order)
-            )
-
-        def dim_or_1(dim: str) -> int:
-            idx = dimension_order.find(dim)
-            return 1 if idx == -1 else data_shape[idx]
-
-        channel_count = dim_or_1(DimensionNames.Channel)
-
-        if len(dimension_order) != 5:
-            raise ValueError(f"Unrecognized OME TIFF dimension order {dimension_order}")
-        for c in dimension_order:
-            if c not in DEFAULT_DIMENSION_ORDER:
-                raise ValueError(f"Unrecognized OME TIFF dimension {c}")
-        if isinstance(channel_names, list) and len(channel_names) != channel_count:
-            raise ValueError(f"Wrong number of channel names {len(channel_names)}")
-        if isinstance(channel_colors, list) and len(channel_colors) != channel_count:
-            raise ValueError(
-                f"Wrong number of channel colors. "
-                f"Received: {len(channel_colors)} ({channel_colors}) "
-                f"Expected: {channel_count}."
-            )
-
-        samples_per_pixel = 1
-        if is_rgb:
-            samples_per_pixel = data_shape[-1]
-
-        # dimension_order must be set to the *reverse* of what dimensionality
-        # the ome tif file is saved as
-        pixels = Pixels(
-            id=f"Pixels:{image_index}:0",
-            dimension_order=dimension_order[::-1],
-            type=utils.dtype_to_ome_type(data_dtype),
-            size_t=dim_or_1(DimensionNames.Time),
-            size_c=channel_count * samples_per_pixel,
-            size_z=dim_or_1(DimensionNames.SpatialZ),
-            size_y=dim_or_1(DimensionNames.SpatialY),
-            size_x=dim_or_1(DimensionNames.SpatialX),
-            interleaved=True if samples_per_pixel > 1 else None,
-        )
-        if physical_pixel_sizes.Z is None or physical_pixel_sizes.Z == 0:
-            pixels.physical_size_z = None
-        else:
-            pixels.physical_size_z = PositiveFloat(physical_pixel_sizes.Z)
-        if physical_pixel_sizes.Y is None or physical_pixel_sizes.Y == 0:
-            pixels.physical_size_y = None
-        else:
-            pixels.physical_size_y = PositiveFloat(physical_pixel_sizes.Y)
-        if physical_pixel_sizes.X is None or physical_pixel_sizes.X == 0:
-            pixels.physical_size_x = None
-        else:
-            pixels.physical_size_x = PositiveFloat(physical_pixel_sizes.X)
-
-        # one single tiffdata indicating sequential tiff IFDs based on dimension_order
-        pixels.tiff_data_blocks = [
-            TiffData(
-                plane_count=pixels.size_t * channel_count * pixels.size_z,
-                ifd=tiff_plane_offset,
-            )
-        ]
-
-        pixels.channels = [
-            Channel(samples_per_pixel=samples_per_pixel) for i in range(channel_count)
-        ]
-        if channel_names is None:
-            for i in range(channel_count):
-                pixels.channels[i].id = ChannelID(
-                    utils.generate_ome_channel_id(str(image_index), i)
-                )
-                pixels.channels[i].name = "C:" + str(i)
-        else:
-            for i in range(channel_count):
-                name = channel_names[i]
-                pixels.channels[i].id = ChannelID(
-                    utils.generate_ome_channel_id(str(image_index), i)
-                )
-                pixels.channels[i].name = name
-
-        if channel_colors is not None:
-            assert len(channel_colors) >= pixels.size_c
-            for i in range(channel_count):
-                this_channel_color_def = channel_colors[i]
-                if len(this_channel_color_def) != 3:
-                    raise ValueError(
-                        f"Expected RGB (3) color definition for channel color. "
-                        f"Received {len(this_channel_color_def)} values "
-                        f"({this_channel_color_def}) for image {image_index} "
-                        f"channel {i}."
-                    )
-                else:
-                    # Handle List[int] -> Tuple[int, int, int] for color def
-                    # Naive cast of tuple(List[int]) generates type: Tuple[int, ...]
-                    this_channel_color = (
-                        this_channel_color_def[0],
-                        this_channel_color_def[1],
-                        this_channel_color_def[2],
-                    )
-
-                    pixels.channels[i].color = Color(this_channel_color)
-
-        img = Image(
-            name=image_name,
-            id=utils.generate_ome_image_id(str(image_index)),
-            pixels=pixels,
-        )
-        return img
-
     @staticmethod
     def build_ome(
         data_shapes: List[Tuple[int, ...]],
@@ -581,94 +528,18 @@ class OmeTiffWriter(Writer):
         channel_colors: List[Optional[List[List[int]]]] = None,
     ) -> OME:
         """
-
-        Create the necessary metadata for an OME tiff image
-
-        Parameters
-        ----------
-        data_shapes:
-            A list of 5- or 6-d tuples
-        data_types:
-            A list of data types
-        dimension_order:
-            The order of dimensions in the data array, using
-            T,C,Z,Y,X and optionally S
-        channel_names:
-            The names for each channel to be put into the OME metadata
-        image_name:
-            The name of the image to be put into the OME metadata
-        physical_pixel_sizes:
-            Z,Y, and X physical dimensions of each pixel,
-            defaulting to microns
-        channel_colors:
-            List of all images channel colors to be put into the OME metadata
-        is_rgb:
-            is a S dimension present?  S is expected to be the last dim in
-            the data shape
-
-        Returns
-        -------
-        OME
-            An OME object that can be converted to a valid OME-XML string
+        Create the necessary metadata for an OME tiff image.
+        See aicsimageio.metadata.utils.build_ome for the full documentation.
         """
-        num_images = len(data_shapes)
-        # resolve defaults that are None
-        if dimension_order is None:
-            dimension_order = [None] * num_images
-        if channel_names is None:
-            channel_names = [None] * num_images
-        if image_name is None:
-            image_name = [None] * num_images
-        if physical_pixel_sizes is None:
-            physical_pixel_sizes = [
-                types.PhysicalPixelSizes(None, None, None)
-            ] * num_images
-        if channel_colors is None:
-            channel_colors = [None] * num_images
-
-        # assert all lists are same length
-        if (
-            num_images != len(data_types)
-            or num_images != len(dimension_order)
-            or num_images != len(channel_names)
-            or num_images != len(image_name)
-            or num_images != len(physical_pixel_sizes)
-            or num_images != len(channel_colors)
-        ):
-            raise ValueError("Mismatched array counts in parameters to build_ome")
-
-        images = []
-        tiff_plane_offset = 0
-        for image_index in range(len(data_shapes)):
-            # correct the dimension_order for ome
-            ome_dimension_order, is_rgb = OmeTiffWriter._resolve_OME_dimension_order(
-                data_shapes[image_index], dimension_order[image_index]
-            )
-            img = OmeTiffWriter._build_ome_image(
-                image_index,
-                tiff_plane_offset,
-                data_shapes[image_index],
-                data_types[image_index],
-                is_rgb,
-                ome_dimension_order,
-                image_name[image_index],
-                physical_pixel_sizes[image_index],
-                channel_names[image_index],
-                channel_colors[image_index],
-            )
-            # increment tiff_plane_offset for next image
-            tiff_plane_offset += (
-                img.pixels.size_z * img.pixels.size_t * len(img.pixels.channels)
-            )
-            images.append(img)
-
-        ome_object = OME(creator=f"aicsimageio {get_module_version()}", images=images)
-
-        # validate! (TODO: Is there a better api in ome-types for this?)
-        test = to_xml(ome_object)
-        from_xml(test)
-
-        return ome_object
+        return utils.build_ome(
+            data_shapes,
+            data_types,
+            dimension_order=dimension_order,
+            channel_names=channel_names,
+            image_name=image_name,
+            physical_pixel_sizes=physical_pixel_sizes,
+            channel_colors=channel_colors,
+        )
 
     @staticmethod
     def _check_ome_dims(
@@ -697,7 +568,7 @@ class OmeTiffWriter(Writer):
             dimension_order += DimensionNames.Samples
 
         expected_shape = tuple(dims[i] for i in dimension_order)
-        data_shape = OmeTiffWriter._extend_data_shape(data_shape, len(dimension_order))
+        data_shape = utils.extend_data_shape(data_shape, len(dimension_order))
         if expected_shape != data_shape:
             raise ValueError(
                 f"OME shape {expected_shape} is not the same as data array shape: \
@@ -0,0 +1,442 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+from typing import Any, Dict, List, Optional, Tuple, Union
+
+import dask.array as da
+import numpy as np
+import zarr
+from fsspec.implementations.local import LocalFileSystem
+from numcodecs import Blosc
+from numcodecs.abc import Codec
+from ome_types import to_xml
+
+from .. import exceptions, get_module_version, transforms, types
+from ..dimensions import DEFAULT_DIMENSION_ORDER, DimensionNames
+from ..metadata import utils
+from ..utils import io_utils
+from .writer import Writer
+
+###############################################################################
+
+NGFF_VERSION = "0.4"
+
+# NGFF axes are always written as TCZYX
+NGFF_DIMENSION_ORDER = DEFAULT_DIMENSION_ORDER
+NGFF_AXES = {
+    DimensionNames.Time: {"name": "t", "type": "time"},
+    DimensionNames.Channel: {"name": "c", "type": "channel"},
+    DimensionNames.SpatialZ: {"name": "z", "type": "space", "unit": "micrometer"},
+    DimensionNames.SpatialY: {"name": "y", "type": "space", "unit": "micrometer"},
+    DimensionNames.SpatialX: {"name": "x", "type": "space", "unit": "micrometer"},
+}
+
+# Multiple images are written with the bioformats2raw layout
+BIOFORMATS2RAW_LAYOUT_VERSION = 3
+
+DEFAULT_CHUNK_YX = 1024
+DEFAULT_COMPRESSOR = Blosc(cname="zstd", clevel=3, shuffle=Blosc.BITSHUFFLE)
+DEFAULT_CHANNEL_COLOR = "FFFFFF"
+
+###############################################################################
+
+
+class OmeZarrWriter(Writer):
+    @staticmethod
+    def save(
+        data: Union[List[types.ArrayLike], types.ArrayLike],
+        uri: types.PathLike,
+        dim_order: Optional[Union[str, List[Optional[str]]]] = None,
+        channel_names: Optional[Union[List[str], List[Optional[List[str]]]]] = None,
+        image_name: Optional[Union[str, List[Optional[str]]]] = None,
+        physical_pixel_sizes: Optional[
+            Union[types.PhysicalPixelSizes, List[types.PhysicalPixelSizes]]
+        ] = None,
+        channel_colors: Optional[
+            Union[List[List[int]], List[Optional[List[List[int]]]]]
+        ] = None,
+        fs_kwargs: Dict[str, Any] = {},
+        chunks: Optional[Tuple[int, ...]] = None,
+        compressor: Optional[Codec] = DEFAULT_COMPRESSOR,
+        pyramid_levels: Optional[int] = None,
+        downsample_factors: Optional[List[int]] = None,
+        downsample_method: str = "mean",
+        **kwargs: Any,
+    ) -> None:
+        """
+        Write a data array to an OME-Zarr (OME-NGFF) store.
+
+        Parameters
+        ----------
+        data: Union[List[types.ArrayLike], types.ArrayLike]
+            The array of data to store. Data arrays must have 2 to 6 dimensions. If a
+            list of more than one array is provided, then it is understood to be
+            multiple images written to the store with the bioformats2raw layout
+            (each image in its own group with the OME-XML metadata in
+            "OME/METADATA.ome.xml"). All following metadata parameters will be
+            expanded to the length of this list. Chunks are computed and written
+            concurrently from the dask graph.
+        uri: types.PathLike
+            The URI or local path for where to save the data. Any fsspec supported
+            file system can be written to.
+        dim_order: Optional[Union[str, List[Optional[str]]]]
+            The dimension order of the provided data, composed of some subset of
+            TCZYXS. Images are always written with TCZYX axes, RGB samples (S) are
+            written as channels and require a single channel (C) dimension.
+            Default: None (guess the dimensions based on a TCZYX ordering)
+        channel_names: Optional[Union[List[str], List[Optional[List[str]]]]]
+            Lists of strings representing the names of the data channels.
+            Default: None
+            If None is given, the list will be generated as a 0-indexed list of strings
+            of the form "Channel:image_index:channel_index"
+        image_name: Optional[Union[str, List[Optional[str]]]]
+            List of strings representing the names of the images.
+            Default: None
+            If None is given, the list will be generated as a 0-indexed list of strings
+            of the form "Image:image_index"
+        physical_pixel_sizes: Optional[Union[types.PhysicalPixelSizes,
+                List[types.PhysicalPixelSizes]]]
+            List of numbers representing the physical pixel sizes in Z, Y, X in microns
+            Default: None
+        channel_colors: Optional[Union[List[List[int]], List[Optional[List[List[int]]]]]
+            List of rgb color values per channel or a list of lists for each image.
+            Default: None
+        fs_kwargs: Dict[str, Any]
+            Any specific keyword arguments to pass down to the fsspec created
+            filesystem.
+            Default: {}
+        chunks: Optional[Tuple[int, ...]]
+            The TCZYX shape of the stored chunks. Reduced resolution levels use the
+            same chunk shape, clipped to the shape of the level.
+            Default: None (single YX planes of up to DEFAULT_CHUNK_YX (1024) pixels)
+        compressor: Optional[Codec]
+            The numcodecs compressor to store chunks with. Use None to store
+            uncompressed chunks.
+            Default: DEFAULT_COMPRESSOR (Blosc zstd, bit shuffled)
+        pyramid_levels: Optional[int]
+            The number of reduced resolution levels to write, each downsampled by
+            transforms.DEFAULT_DOWNSAMPLE_FACTOR (2) in Y and X from the level above.
+            Default: None (only write the full resolution image)
+        downsample_factors: Optional[List[int]]
+            The Y and X downsampling factor of each reduced resolution level relative
+            to the level above. Can't be combined with pyramid_levels.
+            Default: None (only write the full resolution image)
+        downsample_method: str
+            How reduced resolution levels are downsampled, one of "mean", "nearest",
+            or "max" (see `aicsimageio.transforms.downsample`).
+            Default: "mean"
+
+        Raises
+        ------
+        ValueError:
+            Invalid chunks, downsample factors, or downsample method provided.
+        exceptions.ConflictingArgumentsError:
+            Both pyramid_levels and downsample_factors provided, or a list of metadata
+            of a different length than the list of images provided.
+        exceptions.InvalidDimensionOrderingError:
+            The dimension order doesn't match the data.
+
+        Examples
+        --------
+        Write a TCZYX data set to OME-Zarr
+
+        >>> image = numpy.ndarray([1, 10, 3, 1024, 2048])
+        ... OmeZarrWriter.save(image, "file.ome.zarr")
+
+        Write a lazy image with a three level pyramid to cloud storage
+
+        >>> image = dask.array.ones((10, 3, 4096, 4096), chunks=(1, 1, 1024, 1024))
+        ... OmeZarrWriter.save(
+        ...     image,
+        ...     "s3://my-bucket/file.ome.zarr",
+        ...     dim_order="ZCYX",
+        ...     chunks=(1, 1, 1, 512, 512),
+        ...     pyramid_levels=3,
+        ... )
+
+        Notes
+        -----
+        Each resolution level is stored as a zarr array with "/" separated chunk
+        keys and described by the NGFF "multiscales" and "omero" metadata. Reduced
+        resolution levels are downsampled from the stored level above so the source
+        data is only computed once.
+        """
+        # Resolve the reduced resolution levels to write
+        downsample_factors = transforms.resolve_downsample_factors(
+            pyramid_levels, downsample_factors, method=downsample_method
+        )
+        if chunks is not None and (
+            len(chunks) != len(NGFF_DIMENSION_ORDER) or min(chunks) < 1
+        ):
+            raise ValueError(
+                f"Chunks must be a positive integer for each of the "
+                f"{NGFF_DIMENSION_ORDER} dimensions. Received chunks: {chunks}."
+            )
+
+        # Expand single images and metadata to lists
+        datas = data if isinstance(data, list) else [data]
+        num_images = len(datas)
+        is_multi_image = num_images > 1
+        dim_orders = OmeZarrWriter._expand_to_images(
+            dim_order, num_images, dim_order is None or isinstance(dim_order, str)
+        )
+        image_names = OmeZarrWriter._expand_to_images(
+            image_name, num_images, image_name is None or isinstance(image_name, str)
+        )
+        pps = OmeZarrWriter._expand_to_images(
+            physical_pixel_sizes,
+            num_images,
+            physical_pixel_sizes is None or isinstance(physical_pixel_sizes, tuple),
+        )
+        names = OmeZarrWriter._expand_to_images(
+            channel_names,
+            num_images,
+            channel_names is None or isinstance(channel_names[0], str),
+        )
+        colors = OmeZarrWriter._expand_to_images(
+            channel_colors,
+            num_images,
+            channel_colors is None
+            or (
+                isinstance(channel_colors[0], list)
+                and isinstance(channel_colors[0][0], int)
+            ),
+        )
+
+        # Every image is written as TCZYX
+        tczyx_datas = [
+            OmeZarrWriter._to_tczyx(image_data, image_dim_order)
+            for image_data, image_dim_order in zip(datas, dim_orders)
+        ]
+
+        # Resolve final destination
+        fs, path = io_utils.pathlike_to_fs(uri, fs_kwargs=fs_kwargs)
+
+        # Chunks are written to nested directories
+        if isinstance(fs, LocalFileSystem):
+            fs = LocalFileSystem(auto_mkdir=True)
+
+        store = zarr.storage.FSStore(path, fs=fs)
+        root = zarr.group(store=store, overwrite=True)
+
+        # Resolve default names and physical pixel sizes
+        image_names = [
+            name or utils.generate_ome_image_id(image_index)
+            for image_index, name in enumerate(image_names)
+        ]
+        names = [
+            image_channel_names
+            or [
+                utils.generate_ome_channel_id(
+                    utils.generate_ome_image_id(image_index), channel_index
+                )
+                for channel_index in range(image_data.shape[1])
+            ]
+            for image_index, (image_data, image_channel_names) in enumerate(
+                zip(tczyx_datas, names)
+            )
+        ]
+        pps = [
+            image_pps or types.PhysicalPixelSizes(None, None, None) for image_pps in pps
+        ]
+
+        for image_index, image_data in enumerate(tczyx_datas):
+            OmeZarrWriter._write_image(
+                group=(root.create_group(str(image_index)) if is_multi_image else root),
+                data=image_data,
+                image_name=image_names[image_index],
+                channel_names=names[image_index],
+                channel_colors=colors[image_index],
+                physical_pixel_sizes=pps[image_index],
+                chunks=chunks,
+                compressor=compressor,
+                downsample_factors=downsample_factors,
+                downsample_method=downsample_method,
+            )
+
+        # Describe every image with OME-XML in the bioformats2raw layout
+        if is_multi_image:
+            root.attrs["bioformats2raw.layout"] = BIOFORMATS2RAW_LAYOUT_VERSION
+            ome_group = root.create_group(utils.OME_GROUP)
+            ome_group.attrs["series"] = [str(i) for i in range(num_images)]
+
+            ome = utils.build_ome(
+                [image_data.shape for image_data in tczyx_datas],
+                [image_data.dtype for image_data in tczyx_datas],
+                dimension_order=[NGFF_DIMENSION_ORDER] * num_images,
+                channel_names=names,
+                image_name=image_names,
+                physical_pixel_sizes=pps,
+                channel_colors=colors,
+            )
+
+            # The pixels are stored in the zarr arrays, not in TIFF IFDs
+            for image in ome.images:
+                image.pixels.tiff_data_blocks = []
+                image.pixels.metadata_only = True
+
+            store[utils.OME_METADATA_KEY] = to_xml(ome).encode()
+
+    @staticmethod
+    def _expand_to_images(value: Any, num_images: int, is_single: bool) -> List[Any]:
+        if is_single:
+            return [value] * num_images
+
+        if len(value) != num_images:
+            raise exceptions.ConflictingArgumentsError(
+                f"OmeZarrWriter received a list of metadata of different length than "
+                f"the number of images. "
+                f"Number of provided images: {num_images}, "
+                f"Number of provided metadata values: {len(value)}"
+            )
+
+        return value
+
+    @staticmethod
+    def _to_tczyx(data: types.ArrayLike, dim_order: Optional[str]) -> types.ArrayLike:
+        if dim_order is None:
+            dim_order = DEFAULT_DIMENSION_ORDER[-len(data.shape) :]
+        if len(dim_order) != len(data.shape):
+            raise exceptions.InvalidDimensionOrderingError(
+                f"Dimension order string has {len(dim_order)} dims but data "
+                f"shape has {len(data.shape)} dims"
+            )
+
+        if not isinstance(data, da.Array):
+            data = da.from_array(data, chunks=-1)
+
+        # RGB samples are written as channels
+        return_dims = NGFF_DIMENSION_ORDER
+        if DimensionNames.Samples in dim_order:
+            if (
+                DimensionNames.Channel in dim_order
+                and data.shape[dim_order.index(DimensionNames.Channel)] > 1
+            ):
+                raise exceptions.InvalidDimensionOrderingError(
+                    f"OmeZarrWriter writes RGB samples as channels and can't write "
+                    f"data with both multiple channels and samples. "
+                    f"Received data with shape: {data.shape} "
+                    f"(dim_order: {dim_order})."
+                )
+
+            return_dims = return_dims.replace(
+                DimensionNames.Channel, DimensionNames.Samples
+            )
+
+        return transforms.reshape_data(
+            data, given_dims=dim_order, return_dims=return_dims
+        )
+
+    @staticmethod
+    def _write_image(
+        group: zarr.hierarchy.Group,
+        data: types.ArrayLike,
+        image_name: str,
+        channel_names: List[str],
+        channel_colors: Optional[List[List[int]]],
+        physical_pixel_sizes: types.PhysicalPixelSizes,
+        chunks: Optional[Tuple[int, ...]],
+        compressor: Optional[Codec],
+        downsample_factors: List[int],
+        downsample_method: str,
+    ) -> None:
+        if chunks is None:
+            chunks = (
+                1,
+                1,
+                1,
+                min(data.shape[3], DEFAULT_CHUNK_YX),
+                min(data.shape[4], DEFAULT_CHUNK_YX),
+            )
+
+        scale = [
+            1.0,
+            1.0,
+            physical_pixel_sizes.Z or 1.0,
+            physical_pixel_sizes.Y or 1.0,
+            physical_pixel_sizes.X or 1.0,
+        ]
+        datasets = []
+        level_data = da.asarray(data)
+        for level, factor in enumerate([1] + downsample_factors):
+            # Downsample from the stored level above
+            if level > 0:
+                level_data = transforms.downsample(
+                    da.from_zarr(group[str(level - 1)]),
+                    (1, 1, 1, factor, factor),
+                    method=downsample_method,
+                )
+                scale = scale[:3] + [scale[3] * factor, scale[4] * factor]
+
+            # Chunks are aligned to the stored chunks so each task writes whole
+            # chunks and no locking is needed
+            level_chunks = tuple(min(c, s) for c, s in zip(chunks, level_data.shape))
+            stored = group.create_dataset(
+                str(level),
+                shape=level_data.shape,
+                chunks=level_chunks,
+                dtype=level_data.dtype,
+                compressor=compressor,
+                dimension_separator="/",
+                overwrite=True,
+            )
+            da.store(level_data.rechunk(level_chunks), stored, lock=False)
+
+            datasets.append(
+                {
+                    "path": str(level),
+                    "coordinateTransformations": [{"type": "scale", "scale": scale}],
+                }
+            )
+
+        group.attrs["multiscales"] = [
+            {
+                "version": NGFF_VERSION,
+                "name": image_name,
+                "axes": [NGFF_AXES[dim] for dim in NGFF_DIMENSION_ORDER],
+                "datasets": datasets,
+                "type": downsample_method,
+                "metadata": {
+                    "method": "aicsimageio.transforms.downsample",
+                    "version": get_module_version(),
+                },
+            }
+        ]
+
+        # Integer data is displayed over the full range of its dtype
+        window = None
+        if np.issubdtype(data.dtype, np.integer):
+            info = np.iinfo(data.dtype)
+            window = {
+                "min": int(info.min),
+                "max": int(info.max),
+                "start": int(info.min),
+                "end": int(info.max),
+            }
+
+        channels: List[Dict[str, Any]] = []
+        for channel_index, channel_name in enumerate(channel_names):
+            channel: Dict[str, Any] = {
+                "label": channel_name,
+                "color": (
+                    "".join(f"{value:02X}" for value in channel_colors[channel_index])
+                    if channel_colors is not None
+                    else DEFAULT_CHANNEL_COLOR
+                ),
+                "active": True,
+            }
+            if window is not None:
+                channel["window"] = window
+
+            channels.append(channel)
+
+        group.attrs["omero"] = {
+            "name": image_name,
+            "version": NGFF_VERSION,
+            "channels": channels,
+            "rdefs": {
+                "defaultT": 0,
+                "defaultZ": data.shape[2] // 2,
+                "model": "color",
+            },
+        }
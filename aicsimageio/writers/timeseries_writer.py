@@ -1,7 +1,7 @@
 #!/usr/bin/env python
 # -*- coding: utf-8 -*-
 
-from typing import Any, Dict
+from typing import Any, Dict, Iterator
 
 import dask.array as da
 import numpy as np
@@ -12,7 +12,7 @@ from .. import types
 from ..dimensions import DimensionNames
 from ..exceptions import InvalidDimensionOrderingError, UnexpectedShapeError
 from ..transforms import reshape_data
-from ..utils import io_utils
+from ..utils import dask_utils, io_utils
 from .writer import Writer
 
 try:
@@ -27,6 +27,13 @@ except ImportError:
 
 ###############################################################################
 
+# The number of chunks of frames computed ahead of the encoder and the number of
+# threads computing them
+DEFAULT_MAX_CHUNKS_IN_FLIGHT = 4
+DEFAULT_MAX_WORKERS = 2
+
+###############################################################################
+
 
 class TimeseriesWriter(Writer):
     """
@@ -58,23 +65,30 @@ class TimeseriesWriter(Writer):
         extension: str,
         imageio_mode: str,
         fps: int,
-        data: da.Array,
-        dim_order: str,
+        data: types.ArrayLike,
+        max_chunks_in_flight: int = DEFAULT_MAX_CHUNKS_IN_FLIGHT,
+        max_workers: int = DEFAULT_MAX_WORKERS,
     ) -> None:
+        # Compute upcoming frames in the background while the current ones are encoded
+        frames: Iterator[np.ndarray]
+        if isinstance(data, da.core.Array):
+            frames = dask_utils.iter_planes(
+                data,
+                n_plane_dims=1,
+                max_batches_in_flight=max_chunks_in_flight,
+                max_workers=max_workers,
+            )
+        else:
+            frames = iter(data)
+
         with get_writer(
             f,
             format=extension,
             mode=imageio_mode,
             fps=fps,
         ) as writer:
-            # Make each chunk of the dask array be a frame
-            chunks = tuple(1 if dim == DimensionNames.Time else -1 for dim in dim_order)
-            data = data.rechunk(chunks)
-
-            # Save each frame
-            for block in data.blocks:
-                # Need to squeeze to remove the singleton T dimension
-                writer.append_data(da.squeeze(block).compute())
+            for frame in frames:
+                writer.append_data(frame)
 
     @staticmethod
     def save(
@@ -83,6 +97,8 @@ class TimeseriesWriter(Writer):
         dim_order: str = None,
         fps: int = 24,
         fs_kwargs: Dict[str, Any] = {},
+        max_chunks_in_flight: int = DEFAULT_MAX_CHUNKS_IN_FLIGHT,
+        max_workers: int = DEFAULT_MAX_WORKERS,
         **kwargs: Any,
     ) -> None:
         """
@@ -105,6 +121,13 @@ class TimeseriesWriter(Writer):
             Any specific keyword arguments to pass down to the fsspec created
             filesystem.
             Default: {}
+        max_chunks_in_flight: int
+            The maximum number of chunks (along the time dimension) of dask array data
+            being computed or waiting to be encoded.
+            Default: DEFAULT_MAX_CHUNKS_IN_FLIGHT (4)
+        max_workers: int
+            The number of background threads computing chunks of dask array data.
+            Default: DEFAULT_MAX_WORKERS (2)
 
         Examples
         --------
@@ -130,6 +153,13 @@ class TimeseriesWriter(Writer):
 
         Notes
         -----
+        Dask array data is streamed: upcoming frames are computed in background
+        threads while the current frames are encoded. Each chunk of the data is
+        computed once and at most max_chunks_in_flight chunks are held in memory, so
+        peak memory scales with the chunk size along T rather than with the number of
+        timepoints. Exporting a long lazy timeseries (such as `AICSImage.dask_data`)
+        therefore runs at encoder speed.
+
         This writer can also be useful when wanting to create a timeseries image using
         a non-time dimension. For example, creating a timeseries image where each frame
         is a Z-plane from a source volumetric image as seen below.
@@ -151,10 +181,6 @@ class TimeseriesWriter(Writer):
             imageio_mode,
         ) = DefaultReader._get_extension_and_mode(path)
 
-        # Convert to dask array to make downstream usage of data have a consistent API
-        if isinstance(data, np.ndarray):
-            data = da.from_array(data)
-
         # Shorthand num dimensions
         n_dims = len(data.shape)
 
@@ -214,7 +240,8 @@ class TimeseriesWriter(Writer):
                 imageio_mode=imageio_mode,
                 fps=fps,
                 data=data,
-                dim_order=dim_order,
+                max_chunks_in_flight=max_chunks_in_flight,
+                max_workers=max_workers,
             )
 
         # Handle all non-ffmpeg formats
@@ -226,5 +253,6 @@ class TimeseriesWriter(Writer):
                     imageio_mode=imageio_mode,
                     fps=fps,
                     data=data,
-                    dim_order=dim_order,
+                    max_chunks_in_flight=max_chunks_in_flight,
+                    max_workers=max_workers,
                 )
@@ -1,16 +1,23 @@
 #!/usr/bin/env python
 # -*- coding: utf-8 -*-
 
-from typing import Any, Dict
+import io
+import multiprocessing
+import os
+from collections import deque
+from concurrent.futures import Executor, Future, ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Any, Deque, Dict, Iterator, List, Optional, Tuple
 
 import dask.array as da
+import numpy as np
+from fsspec.spec import AbstractFileSystem
 from imageio import get_writer
 
 from .. import types
-from ..dimensions import DimensionNames
+from ..dimensions import DEFAULT_DIMENSION_ORDER, DimensionNames
 from ..exceptions import InvalidDimensionOrderingError, UnexpectedShapeError
 from ..transforms import reshape_data
-from ..utils import io_utils
+from ..utils import dask_utils, io_utils
 from .writer import Writer
 
 try:
@@ -25,6 +32,18 @@ except ImportError:
 ###############################################################################
 
 
+def _encode_plane(data: np.ndarray, extension: str, imageio_mode: str) -> bytes:
+    # Module level so that it can be run in worker processes
+    with io.BytesIO() as buffer:
+        with get_writer(buffer, format=extension, mode=imageio_mode) as writer:
+            writer.append_data(data)
+
+        return buffer.getvalue()
+
+
+###############################################################################
+
+
 class TwoDWriter(Writer):
     """
     A writer for image data is only 2 dimension with samples (RGB / RGBA) optional.
@@ -145,3 +164,170 @@ class TwoDWriter(Writer):
                 mode=imageio_mode,
             ) as writer:
                 writer.append_data(data)
+
+    @staticmethod
+    def save_planes(
+        data: types.ArrayLike,
+        uri_template: str,
+        dim_order: Optional[str] = None,
+        fs_kwargs: Dict[str, Any] = {},
+        max_workers: Optional[int] = None,
+        use_processes: bool = True,
+        **kwargs: Any,
+    ) -> List[str]:
+        """
+        Write every plane of a data array to its own file, encoding planes in
+        parallel.
+
+        Parameters
+        ----------
+        data: types.ArrayLike
+            The array of data to store. Data must have Y and X dimensions, and
+            optionally a Samples (RGB / RGBA) dimension. Every other dimension is
+            iterated over.
+        uri_template: str
+            The URI or local path template for where to save each plane. Formatted
+            with the index of each plane by dimension name, i.e.
+            "qc/T{T}_C{C}_Z{Z:03d}.png". Must produce a unique URI for every plane.
+        dim_order: Optional[str]
+            The dimension order of the provided data.
+            Default: None (guess the dimensions based on a TCZYX ordering)
+        fs_kwargs: Dict[str, Any]
+            Any specific keyword arguments to pass down to the fsspec created
+            filesystem.
+            Default: {}
+        max_workers: Optional[int]
+            The number of workers encoding planes.
+            Default: None (the number of CPUs)
+        use_processes: bool
+            Whether to encode planes in worker processes rather than threads. Most
+            imageio encoders hold the GIL so only processes scale across cores.
+            Worker processes are spawned, not forked, so they are safe to start
+            while dask threads are computing planes.
+            Default: True
+
+        Returns
+        -------
+        uris: List[str]
+            The URI of each written plane, in the order the planes were written.
+
+        Raises
+        ------
+        ValueError
+            The uri_template references unknown dimensions or doesn't produce a unique
+            URI for every plane.
+        exceptions.UnexpectedShapeError
+            The dimension order doesn't match the data.
+        exceptions.InvalidDimensionOrderingError
+            The dimension order doesn't include Y and X.
+
+        Examples
+        --------
+        Write every plane of an image for a QC dashboard
+
+        >>> img = AICSImage("my_file.ome.tiff")
+        ... TwoDWriter.save_planes(
+        ...     img.dask_data, "qc/T{T}_C{C}_Z{Z}.png", dim_order=img.dims.order
+        ... )
+
+        Notes
+        -----
+        Planes are read in the order they are stored, with the chunks of dask array
+        data computed ahead of the encoders (see
+        `aicsimageio.utils.dask_utils.iter_planes`). At most twice max_workers planes
+        are waiting to be encoded or written, so memory use doesn't grow with the
+        number of planes.
+        """
+        # Assume dim order if not provided
+        if dim_order is None:
+            dim_order = DEFAULT_DIMENSION_ORDER[-len(data.shape) :]
+
+        # Uppercase dim order
+        dim_order = dim_order.upper()
+
+        if len(dim_order) != len(data.shape):
+            raise UnexpectedShapeError(
+                f"Dimension order string has {len(dim_order)} dims but data shape "
+                f"has {len(data.shape)} dims. ({data.shape})"
+            )
+        if any(dim not in dim_order for dim in TwoDWriter._PLANE_DIMENSIONS):
+            raise InvalidDimensionOrderingError(
+                f"TwoDWriter.save_planes requires that the dim_order includes "
+                f"dimensions: {TwoDWriter._PLANE_DIMENSIONS}. "
+                f"Provided dim_order string: '{dim_order}'."
+            )
+
+        # Iterate over the other dimensions in their stored order
+        plane_dims = TwoDWriter.DIM_ORDERS[
+            3 if DimensionNames.Samples in dim_order else 2
+        ]
+        iter_dims = "".join(dim for dim in dim_order if dim not in plane_dims)
+        if dim_order != iter_dims + plane_dims:
+            data = reshape_data(
+                data, given_dims=dim_order, return_dims=iter_dims + plane_dims
+            )
+
+        # Resolve every destination before anything is written
+        plane_indices = list(np.ndindex(*data.shape[: len(iter_dims)]))
+        try:
+            uris = [
+                uri_template.format(**dict(zip(iter_dims, plane_index)))
+                for plane_index in plane_indices
+            ]
+        except (KeyError, IndexError) as e:
+            raise ValueError(
+                f"The uri_template can only reference the dimensions: '{iter_dims}'. "
+                f"Provided uri_template: '{uri_template}'."
+            ) from e
+        if len(set(uris)) != len(uris):
+            raise ValueError(
+                f"The uri_template must reference every dimension with more than one "
+                f"plane ({iter_dims}, shape: {data.shape[: len(iter_dims)]}) to "
+                f"produce a unique URI for every plane. "
+                f"Provided uri_template: '{uri_template}'."
+            )
+
+        planes: Iterator[np.ndarray]
+        if isinstance(data, da.core.Array):
+            planes = dask_utils.iter_planes(data, n_plane_dims=len(iter_dims))
+        else:
+            planes = (data[plane_index] for plane_index in plane_indices)
+
+        if max_workers is None:
+            max_workers = os.cpu_count() or 1
+
+        executor: Executor
+        if use_processes:
+            # Spawned workers don't inherit the threads computing the planes
+            executor = ProcessPoolExecutor(
+                max_workers=max_workers, mp_context=multiprocessing.get_context("spawn")
+            )
+        else:
+            executor = ThreadPoolExecutor(max_workers=max_workers)
+
+        with executor:
+            pending: Deque[Tuple[AbstractFileSystem, str, Future]] = deque()
+            for uri, plane in zip(uris, planes):
+                # Wait for the oldest plane to be written before encoding more
+                if len(pending) >= 2 * max_workers:
+                    TwoDWriter._write_encoded(*pending.popleft())
+
+                fs, path = io_utils.pathlike_to_fs(uri, fs_kwargs=fs_kwargs)
+                extension, imageio_mode = DefaultReader._get_extension_and_mode(path)
+                pending.append(
+                    (
+                        fs,
+                        path,
+                        executor.submit(_encode_plane, plane, extension, imageio_mode),
+                    )
+                )
+
+            while len(pending) > 0:
+                TwoDWriter._write_encoded(*pending.popleft())
+
+        return uris
+
+    @staticmethod
+    def _write_encoded(fs: AbstractFileSystem, path: str, encoded: Future) -> None:
+        with fs.open(path, "wb") as open_resource:
+            open_resource.write(encoded.result())